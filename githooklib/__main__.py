@@ -1,8 +1,5 @@
 # pylint: disable=invalid-name
-from .utils.google_fire_mock_get_result_function import FireGetResultMock
 from .cli import CLI
-import fire.value_types
-import fire
 import os
 import platform
 import sys
@@ -31,6 +28,11 @@ def main() -> None:
         logger.error(UI_MESSAGE_COULD_NOT_FIND_PROJECT_ROOT)
         logger.debug("Project root not found, exiting")
         sys.exit(1)
+
+    import fire
+    import fire.trace
+    from .utils.google_fire_mock_get_result_function import FireGetResultMock
+
     original_function = fire.trace.FireTrace.GetResult
     mock_function = FireGetResultMock(original_function)
     try:
@@ -25,6 +25,7 @@ class API:
         logger.trace("Initializing API")
         self.config = get_config()
         self.git_gateway = GitGateway()
+        self.project_root_gateway = ProjectRootGateway()
         self.hook_discovery_service = HookDiscoveryService()
         self.hook_management_service = HookManagementService()
         self.error_message_service = ErrorMessageService()
@@ -117,7 +118,7 @@ class API:
     def get_seed_failure_details(self, example_name: str) -> SeedFailureDetails:
         logger.debug("Getting seed failure details for example '%s'", example_name)
         try:
-            project_root = ProjectRootGateway.find_project_root()
+            project_root = self.project_root_gateway.find_project_root()
             logger.trace("Project root found: %s", project_root)
         except Exception as e:
             logger.trace("Project root not found: %s", e)
@@ -134,11 +135,14 @@ class API:
     def seed_example_hook_to_project(self, example_name: str) -> bool:
         logger.debug("Seeding example hook '%s' to project", example_name)
         try:
-            project_root = ProjectRootGateway.find_project_root()
+            project_root = self.project_root_gateway.find_project_root()
             logger.trace("Project root: %s", project_root)
         except Exception as e:
             logger.debug("Failed to find project root: %s", e)
             return False
+        if project_root is None:
+            logger.debug("Project root not found, cannot seed '%s'", example_name)
+            return False
         success = self.seed_service.seed_hook(example_name, project_root)
         logger.debug(
             "Example hook '%s' seeding %s",
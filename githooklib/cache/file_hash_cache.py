@@ -2,6 +2,8 @@ from pathlib import Path
 from typing import Dict, Optional, Set
 import hashlib
 import json
+import mmap
+import os
 import time
 
 from ..gateways import ProjectRootGateway, GitGateway
@@ -11,14 +13,37 @@ logger = get_logger()
 
 _global_cache: Optional["FileHashCache"] = None
 
+MMAP_THRESHOLD_BYTES: int = 64 * 1024
+READ_CHUNK_BYTES: int = 1024 * 1024
+
+
+def _hash_file_contents(hasher: "hashlib._Hash", fd: int, size: int) -> None:
+    if size >= MMAP_THRESHOLD_BYTES:
+        try:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                hasher.update(mapped)
+            return
+        except (OSError, ValueError) as e:
+            logger.trace("mmap unavailable (%s), falling back to chunked reads", e)
+
+    while True:
+        chunk = os.read(fd, READ_CHUNK_BYTES)
+        if not chunk:
+            break
+        hasher.update(chunk)
+
 
 def _compute_file_hash(file_path: Path) -> str:
     logger.trace("Computing hash for file: %s", file_path)
     try:
         hasher = hashlib.md5()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hasher.update(chunk)
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            _hash_file_contents(hasher, fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
         file_hash = hasher.hexdigest()
         logger.trace("Hash for %s: %s", file_path, file_hash)
         return file_hash
@@ -1,5 +1,5 @@
-from .config_loader import ConfigLoader, get_config
+from .config_loader import ConfigLoader, get_config, clear_config_cache
 from .config_schema import GithooklibConfig
 
-__all__ = ["ConfigLoader", "get_config", "GithooklibConfig"]
+__all__ = ["ConfigLoader", "get_config", "clear_config_cache", "GithooklibConfig"]
 
@@ -1,5 +1,6 @@
 from pathlib import Path
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Tuple
+import copy
 import logging
 
 from .config_schema import (
@@ -17,6 +18,19 @@ from ..logger import get_logger
 logger = get_logger()
 
 _global_config: Optional[GithooklibConfig] = None
+_loaded_configs: Dict[Path, Tuple[Tuple[int, int], GithooklibConfig]] = {}
+
+
+def clear_config_cache() -> None:
+    _loaded_configs.clear()
+
+
+def _get_file_signature(config_path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat_result = config_path.stat()
+    except OSError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size
 
 
 def _load_yaml(config_path: Path) -> Dict[str, Any]:
@@ -172,6 +186,12 @@ class ConfigLoader:
             logger.debug("Using default configuration")
             return GithooklibConfig()
         
+        signature = _get_file_signature(config_path)
+        cached = _loaded_configs.get(config_path)
+        if signature is not None and cached is not None and cached[0] == signature:
+            logger.debug("Using cached config for: %s", config_path)
+            return copy.deepcopy(cached[1])
+        
         logger.info("Loading config from: %s", config_path)
         
         if config_path.suffix in [".yaml", ".yml"]:
@@ -185,6 +205,8 @@ class ConfigLoader:
         try:
             config = _parse_config_data(data)
             logger.debug("Config loaded successfully")
+            if signature is not None:
+                _loaded_configs[config_path] = (signature, copy.deepcopy(config))
             return config
         except Exception as e:
             logger.error("Failed to parse config: %s", e)
@@ -266,5 +288,5 @@ def get_config(reload: bool = False) -> GithooklibConfig:
     return _global_config
 
 
-__all__ = ["ConfigLoader", "get_config"]
+__all__ = ["ConfigLoader", "get_config", "clear_config_cache"]
 
@@ -16,9 +16,12 @@ class GitHookContext:
     argv: List[str]
     project_root: Path = field(default_factory=ProjectRootGateway.find_project_root)
     stdin_lines: List[str] = field(default_factory=list)
+    git_gateway: GitGateway = field(
+        default_factory=GitGateway, repr=False, compare=False
+    )
 
     def get_changed_files(self) -> List[str]:
-        git_gateway = GitGateway()
+        git_gateway = self.git_gateway
 
         if self.hook_name == "pre-push" and self.stdin_lines:
             remote_ref, local_ref = self._parse_pre_push_refs_from_stdin()
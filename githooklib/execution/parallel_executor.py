@@ -27,6 +27,7 @@ class ParallelExecutor:
         self,
         tasks: Dict[str, Callable[[], T]],
         show_progress: bool = True,
+        fail_fast: bool = False,
     ) -> List[TaskResult[T]]:
         logger.debug("Executing %d tasks in parallel with %d workers", len(tasks), self.max_workers)
         
@@ -34,71 +35,18 @@ class ParallelExecutor:
             logger.trace("No tasks to execute")
             return []
         
-        results: List[TaskResult[T]] = []
-        
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_id: Dict[Future, str] = {}
-            task_start_times: Dict[str, float] = {}
-            
-            for task_id, task_func in tasks.items():
-                logger.trace("Submitting task: %s", task_id)
-                future = executor.submit(self._execute_task, task_id, task_func)
-                future_to_id[future] = task_id
-                task_start_times[task_id] = time.time()
-            
-            completed_count = 0
-            total_count = len(tasks)
-            
-            if show_progress:
-                try:
-                    from tqdm import tqdm
-                    progress_bar = tqdm(total=total_count, desc="Executing tasks", unit="task")
-                except ImportError:
-                    logger.trace("tqdm not available, skipping progress bar")
-                    progress_bar = None
+            if show_progress or fail_fast:
+                results = self._execute_as_completed(
+                    executor, tasks, show_progress, fail_fast
+                )
             else:
-                progress_bar = None
-            
-            for future in as_completed(future_to_id):
-                task_id = future_to_id[future]
-                completed_count += 1
-                
-                try:
-                    result = future.result()
-                    duration_ms = (time.time() - task_start_times[task_id]) * 1000
-                    
-                    task_result = TaskResult(
-                        task_id=task_id,
-                        success=True,
-                        result=result,
-                        duration_ms=duration_ms,
-                    )
-                    results.append(task_result)
-                    logger.debug("Task '%s' completed successfully (%.2fms)", task_id, duration_ms)
-                    
-                except Exception as e:
-                    duration_ms = (time.time() - task_start_times[task_id]) * 1000
-                    logger.error("Task '%s' failed: %s", task_id, e)
-                    logger.trace("Exception details: %s", e, exc_info=True)
-                    
-                    task_result = TaskResult(
-                        task_id=task_id,
-                        success=False,
-                        result=None,
-                        duration_ms=duration_ms,
-                        error=e,
+                logger.trace("Dispatching %d tasks in a single batch", len(tasks))
+                results = list(
+                    executor.map(
+                        lambda item: self._run_task_safely(*item), tasks.items()
                     )
-                    results.append(task_result)
-                
-                if progress_bar:
-                    progress_bar.update(1)
-                    progress_bar.set_postfix(
-                        completed=f"{completed_count}/{total_count}",
-                        success=sum(1 for r in results if r.success),
-                    )
-            
-            if progress_bar:
-                progress_bar.close()
+                )
         
         successful = sum(1 for r in results if r.success)
         logger.debug(
@@ -109,6 +57,85 @@ class ParallelExecutor:
         
         return results
     
+    def _execute_as_completed(
+        self,
+        executor: ThreadPoolExecutor,
+        tasks: Dict[str, Callable[[], T]],
+        show_progress: bool,
+        fail_fast: bool,
+    ) -> List[TaskResult[T]]:
+        results: List[TaskResult[T]] = []
+        future_to_id: Dict[Future, str] = {}
+        
+        for task_id, task_func in tasks.items():
+            logger.trace("Submitting task: %s", task_id)
+            future = executor.submit(self._run_task_safely, task_id, task_func)
+            future_to_id[future] = task_id
+        
+        completed_count = 0
+        total_count = len(tasks)
+        
+        if show_progress:
+            try:
+                from tqdm import tqdm
+                progress_bar = tqdm(total=total_count, desc="Executing tasks", unit="task")
+            except ImportError:
+                logger.trace("tqdm not available, skipping progress bar")
+                progress_bar = None
+        else:
+            progress_bar = None
+        
+        for future in as_completed(future_to_id):
+            completed_count += 1
+            task_result = future.result()
+            results.append(task_result)
+            
+            if progress_bar:
+                progress_bar.update(1)
+                progress_bar.set_postfix(
+                    completed=f"{completed_count}/{total_count}",
+                    success=sum(1 for r in results if r.success),
+                )
+            
+            if fail_fast and not task_result.success:
+                cancelled = sum(1 for pending in future_to_id if pending.cancel())
+                logger.debug(
+                    "Task '%s' failed, cancelled %d pending tasks",
+                    task_result.task_id,
+                    cancelled,
+                )
+                break
+        
+        if progress_bar:
+            progress_bar.close()
+        
+        return results
+    
+    def _run_task_safely(self, task_id: str, task_func: Callable[[], T]) -> TaskResult[T]:
+        start_time = time.time()
+        try:
+            result = self._execute_task(task_id, task_func)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            duration_ms = (time.time() - start_time) * 1000
+            logger.error("Task '%s' failed: %s", task_id, e)
+            logger.trace("Exception details: %s", e, exc_info=True)
+            return TaskResult(
+                task_id=task_id,
+                success=False,
+                result=None,
+                duration_ms=duration_ms,
+                error=e,
+            )
+        
+        duration_ms = (time.time() - start_time) * 1000
+        logger.debug("Task '%s' completed successfully (%.2fms)", task_id, duration_ms)
+        return TaskResult(
+            task_id=task_id,
+            success=True,
+            result=result,
+            duration_ms=duration_ms,
+        )
+    
     def _execute_task(self, task_id: str, task_func: Callable[[], T]) -> T:
         logger.trace("Executing task: %s", task_id)
         return task_func()
@@ -1,3 +1,4 @@
+import os
 from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, List
@@ -34,10 +35,11 @@ class GitGateway:
         logger.debug("Git root not found")
         return None
 
-    def _find_git_root_via_command(self) -> Optional[Path]:
+    def _find_git_root_via_command(self, cwd: Optional[Path] = None) -> Optional[Path]:
         logger.trace("Finding git root via 'git rev-parse --show-toplevel' command")
         result = self.command_executor.run(
             ["git", "rev-parse", "--show-toplevel"],
+            cwd=cwd,
             check=True,
         )
         if not result.success:
@@ -55,10 +57,10 @@ class GitGateway:
         return None
 
     @staticmethod
-    def _find_git_root_via_filesystem() -> Optional[Path]:
+    def _find_git_root_via_filesystem(start: Optional[Path] = None) -> Optional[Path]:
         logger.trace("Finding git root via filesystem traversal")
-        current = Path.cwd()
-        logger.trace("Starting from current directory: %s", current)
+        current = start if start is not None else Path.cwd()
+        logger.trace("Starting from directory: %s", current)
         search_paths = [current] + list(current.parents)
         logger.trace("Search paths: %s", search_paths)
         for path in search_paths:
@@ -75,13 +77,17 @@ class GitGateway:
     def get_installed_hooks(self, hooks_dir: Path) -> Dict[str, bool]:
         logger.debug("Getting installed hooks from directory: %s", hooks_dir)
         installed = {}
-        logger.trace("Iterating over files in hooks directory")
-        for hook_file in hooks_dir.iterdir():
-            logger.trace("Checking file: %s", hook_file)
+        logger.trace("Scanning files in hooks directory")
+        with os.scandir(hooks_dir) as entries:
+            hook_entries = list(entries)
+        for hook_file in hook_entries:
+            logger.trace("Checking file: %s", hook_file.path)
             if hook_file.is_file() and not hook_file.name.endswith(".sample"):
                 hook_name = hook_file.name
                 logger.trace("Processing hook file: %s", hook_name)
-                is_tool_installed = self._is_hook_from_githooklib(hook_file)
+                is_tool_installed = self._is_hook_from_githooklib(
+                    Path(hook_file.path)
+                )
                 logger.trace(
                     "Hook '%s' installed via githooklib: %s",
                     hook_name,
@@ -111,11 +117,12 @@ class GitGateway:
             logger.trace("Error reading hook file: %s", e)
             return False
 
-    def get_cached_index_files(self) -> List[str]:
+    def get_cached_index_files(self, cwd: Optional[Path] = None) -> List[str]:
         logger.debug("Getting cached index files (staged files)")
         logger.trace("Running 'git diff --cached --name-only'")
         result = self.command_executor.run(
             ["git", "diff", "--cached", "--name-only"],
+            cwd=cwd,
             check=True,
         )
         if not result.success:
@@ -128,7 +135,9 @@ class GitGateway:
         logger.trace("Cached index files: %s", files)
         return files
 
-    def get_diff_files_between_refs(self, remote_ref: str, local_ref: str) -> List[str]:
+    def get_diff_files_between_refs(
+        self, remote_ref: str, local_ref: str, cwd: Optional[Path] = None
+    ) -> List[str]:
         logger.debug(
             "Getting diff files between refs: remote_ref=%s, local_ref=%s",
             remote_ref,
@@ -137,6 +146,7 @@ class GitGateway:
         logger.trace("Running 'git diff %s %s --name-only'", remote_ref, local_ref)
         result = self.command_executor.run(
             ["git", "diff", remote_ref, local_ref, "--name-only"],
+            cwd=cwd,
             check=True,
         )
         if not result.success:
@@ -150,11 +160,12 @@ class GitGateway:
         logger.trace("Diff files: %s", files)
         return files
 
-    def get_all_modified_files(self) -> List[str]:
+    def get_all_modified_files(self, cwd: Optional[Path] = None) -> List[str]:
         logger.debug("Getting all modified files (staged, unstaged, and untracked)")
         logger.trace("Running 'git status --porcelain -uall'")
         result = self.command_executor.run(
             ["git", "status", "--porcelain", "-uall"],
+            cwd=cwd,
             check=True,
         )
         if not result.success:
@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Type, Tuple
+from typing import Dict, Optional, List, Type, Tuple, Pattern
 import traceback
 import logging
 import sys
 import fnmatch
+import os
+import re
 from pathlib import Path
 
 from .constants import DELEGATOR_SCRIPT_TEMPLATE, EXIT_SUCCESS, EXIT_FAILURE
@@ -16,7 +18,9 @@ from .definitions import HookResult
 
 class GitHook(ABC):
     logger: Logger
-    _registered_hooks: List[Type["GitHook"]] = []
+    _registered_hooks: Dict[Type["GitHook"], None] = {}
+    _cached_file_patterns: Optional[Tuple[str, ...]]
+    _compiled_file_pattern: Pattern[str]
 
     @staticmethod
     def _write_script_file(hook_script_path: Path, script_content: str) -> None:
@@ -51,14 +55,14 @@ class GitHook(ABC):
     def __init_subclass__(cls, **kwargs) -> None:
         super().__init_subclass__(**kwargs)
         logger = get_logger()
-        GitHook._registered_hooks.append(cls)
+        GitHook._registered_hooks[cls] = None
         hook_name = cls.get_hook_name()
         cls.logger = get_logger(f"{__name__}.{cls.__name__}", prefix=hook_name)
         logger.trace("Hook subclass registered: %s -> %s", cls.__name__, hook_name)
 
     @classmethod
     def get_registered_hooks(cls) -> List[Type["GitHook"]]:
-        return cls._registered_hooks.copy()
+        return list(cls._registered_hooks)
 
     @classmethod
     def _get_module_and_class(cls) -> Tuple[str, str]:
@@ -183,7 +187,7 @@ class GitHook(ABC):
                 "Hook context: hook_name=%s, argv=%s", context.hook_name, context.argv
             )
 
-            patterns = self.get_file_patterns()
+            patterns = self._get_cached_file_patterns()
             changed_files = context.get_changed_files()
             if not self._should_run_based_on_patterns(context):
                 self.logger.info(
@@ -237,8 +241,35 @@ class GitHook(ABC):
         except Exception as e:
             self.logger.trace("Failed to send notification: %s", e)
 
+    @classmethod
+    def _get_cached_file_patterns(cls) -> Optional[Tuple[str, ...]]:
+        if "_cached_file_patterns" not in cls.__dict__:
+            patterns = cls.get_file_patterns()
+            cls._cached_file_patterns = (
+                tuple(patterns) if patterns is not None else None
+            )
+            if "_compiled_file_pattern" in cls.__dict__:
+                delattr(cls, "_compiled_file_pattern")
+            logger = get_logger()
+            logger.trace(
+                "Cached file patterns for %s: %s", cls.__name__, cls._cached_file_patterns
+            )
+        return cls._cached_file_patterns
+
+    @classmethod
+    def _get_compiled_file_pattern(cls) -> Pattern[str]:
+        patterns = cls._get_cached_file_patterns() or ()
+        if "_compiled_file_pattern" not in cls.__dict__:
+            combined = "|".join(
+                fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns
+            )
+            cls._compiled_file_pattern = re.compile(combined)
+            logger = get_logger()
+            logger.trace("Compiled file patterns for %s: %s", cls.__name__, combined)
+        return cls._compiled_file_pattern
+
     def _should_run_based_on_patterns(self, context: GitHookContext) -> bool:
-        patterns = self.get_file_patterns()
+        patterns = self._get_cached_file_patterns()
         if patterns is None:
             self.logger.trace("No file patterns specified, hook will run")
             return True
@@ -257,15 +288,15 @@ class GitHook(ABC):
             len(changed_files),
             len(patterns),
         )
+        compiled_pattern = self._get_compiled_file_pattern()
         for file_path in changed_files:
-            for pattern in patterns:
-                if fnmatch.fnmatch(file_path, pattern):
-                    self.logger.trace(
-                        "File '%s' matches pattern '%s', hook will run",
-                        file_path,
-                        pattern,
-                    )
-                    return True
+            if compiled_pattern.match(os.path.normcase(file_path)):
+                self.logger.trace(
+                    "File '%s' matches one of patterns %s, hook will run",
+                    file_path,
+                    patterns,
+                )
+                return True
 
         self.logger.trace("No changed files match any pattern, hook will not run")
         return False
@@ -10,6 +10,7 @@ logging.addLevelName(TRACE, "TRACE")
 logging.addLevelName(SUCCESS, "SUCCESS")
 
 _configured_log_level: Optional[int] = None
+_LOG_LEVEL_FLAGS = {"--trace": TRACE, "--debug": logging.DEBUG}
 
 
 class LogFilter(logging.Filter):
@@ -102,16 +103,15 @@ def get_logger(name: Optional[str] = None, prefix: Optional[str] = None) -> Logg
 def setup_logging() -> None:
     global _configured_log_level
 
-    if "--trace" in sys.argv:
-        level = TRACE
-        sys.argv.remove("--trace")
-        if "--debug" in sys.argv:
-            sys.argv.remove("--debug")
-    elif "--debug" in sys.argv:
-        level = logging.DEBUG
-        sys.argv.remove("--debug")
-    else:
-        level = logging.INFO
+    level = logging.INFO
+    remaining_args = []
+    for arg in sys.argv[1:]:
+        flag_level = _LOG_LEVEL_FLAGS.get(arg)
+        if flag_level is None:
+            remaining_args.append(arg)
+        else:
+            level = min(level, flag_level)
+    sys.argv[1:] = remaining_args
 
     _configured_log_level = level
 
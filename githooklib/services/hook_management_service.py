@@ -1,5 +1,6 @@
 import logging
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -12,8 +13,10 @@ from .hook_discovery_service import HookDiscoveryService
 logger = get_logger()
 
 
-@dataclass
+@dataclass(frozen=True)
 class InstalledHooksContext:
+    __slots__ = ("installed_hooks", "git_root", "hooks_dir_exists")
+
     installed_hooks: Dict[str, bool]
     git_root: Optional[Path]
     hooks_dir_exists: bool
@@ -22,14 +25,18 @@ class InstalledHooksContext:
 @singleton
 class HookManagementService:
     def __init__(self) -> None:
-        self.hook_discovery_service = HookDiscoveryService()
-        self.git_gateway = GitGateway()
         logger.trace("HookManagementService initialized")
 
+    @cached_property
+    def hook_discovery_service(self) -> HookDiscoveryService:
+        return HookDiscoveryService()
+
+    @cached_property
+    def git_gateway(self) -> GitGateway:
+        return GitGateway()
+
     def list_hooks(self) -> List[str]:
-        hooks = self.hook_discovery_service.discover_hooks()
-        hook_names = sorted(hooks.keys())
-        return hook_names
+        return sorted(self.hook_discovery_service.discover_hooks())
 
     def install_hook(self, hook_name: str) -> bool:
         logger.debug("Installing hook '%s'", hook_name)
@@ -19,12 +19,16 @@ class HookSeedingService:
         logger.trace("HookSeedingService initialized")
 
     def get_target_hook_path(self, example_name: str, project_root: Path) -> Path:
-        target_path = project_root / TARGET_HOOKS_DIR / f"{example_name}.py"
+        target_path = project_root.joinpath(TARGET_HOOKS_DIR, f"{example_name}.py")
         logger.trace("Target hook path for '%s': %s", example_name, target_path)
         return target_path
 
     def does_target_hook_exist(self, example_name: str, project_root: Path) -> bool:
         target_path = self.get_target_hook_path(example_name, project_root)
+        return self._target_hook_exists(example_name, target_path)
+
+    @staticmethod
+    def _target_hook_exists(example_name: str, target_path: Path) -> bool:
         exists = target_path.exists()
         logger.debug("Target hook '%s' exists: %s", example_name, exists)
         logger.trace("Target path: %s", target_path)
@@ -39,22 +43,21 @@ class HookSeedingService:
             logger.debug("Example '%s' not found in examples", example_name)
             return False
 
-        if self.does_target_hook_exist(example_name, project_root):
+        target_file = self.get_target_hook_path(example_name, project_root)
+        if self._target_hook_exists(example_name, target_file):
             logger.warning("Target hook '%s' already exists", example_name)
             logger.debug("Target hook '%s' already exists, cannot seed", example_name)
             return False
 
         source_file = self.examples_gateway.get_example_path(example_name)
         logger.trace("Source file: %s", source_file)
-        target_hooks_dir = project_root / TARGET_HOOKS_DIR
+        target_hooks_dir = target_file.parent
         logger.trace("Target hooks directory: %s", target_hooks_dir)
         logger.debug("Creating target hooks directory if it doesn't exist")
         target_hooks_dir.mkdir(exist_ok=True)
-        target_file = target_hooks_dir / f"{example_name}.py"
-        logger.trace("Target file: %s", target_file)
 
         logger.debug("Copying example file from %s to %s", source_file, target_file)
-        shutil.copy2(source_file, target_file)
+        shutil.copyfile(source_file, target_file)
         logger.info("Successfully seeded hook '%s' to %s", example_name, target_file)
         logger.debug("Hook '%s' seeding completed successfully", example_name)
         return True
@@ -68,17 +71,14 @@ class HookSeedingService:
         logger.trace("Example '%s' not found: %s", example_name, example_not_found)
         project_root_not_found = project_root is None
         logger.trace("Project root not found: %s", project_root_not_found)
-        target_hook_path = (
-            self.get_target_hook_path(example_name, project_root)
-            if project_root
-            else None
-        )
+        target_hook_path: Optional[Path] = None
+        target_hook_already_exists = False
+        if project_root:
+            target_hook_path = self.get_target_hook_path(example_name, project_root)
+            target_hook_already_exists = self._target_hook_exists(
+                example_name, target_hook_path
+            )
         logger.trace("Target hook path: %s", target_hook_path)
-        target_hook_already_exists = (
-            self.does_target_hook_exist(example_name, project_root)
-            if project_root
-            else False
-        )
         logger.trace("Target hook already exists: %s", target_hook_already_exists)
         available_examples = self.examples_gateway.get_available_examples()
         logger.trace("Available examples: %s", available_examples)
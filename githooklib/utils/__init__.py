@@ -1,7 +1,16 @@
+from typing import Any
+
 from .singleton import *
 
 try:
-    from .google_fire_mock_get_result_function import *
     from .command_result_factory import *
 except ImportError:
     pass
+
+
+def __getattr__(name: str) -> Any:
+    if name == "FireGetResultMock":
+        from .google_fire_mock_get_result_function import FireGetResultMock
+
+        return FireGetResultMock
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
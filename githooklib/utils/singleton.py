@@ -2,10 +2,11 @@ from typing import TypeVar, Type, Dict, Any
 
 T = TypeVar("T")
 
+_instances: Dict[type, Any] = {}
+_initialized: Dict[type, bool] = {}
+
 
 def singleton(cls: Type[T]) -> Type[T]:
-    _instances: Dict[Type[T], T] = {}
-    _initialized: Dict[Type[T], bool] = {}
     original_new = getattr(cls, "__new__", object.__new__)
     original_init = getattr(cls, "__init__", object.__init__)
 
@@ -29,4 +30,9 @@ def singleton(cls: Type[T]) -> Type[T]:
     return cls
 
 
-__all__ = ["singleton"]
+def reset_singleton(cls: type) -> None:
+    _instances.pop(cls, None)
+    _initialized.pop(cls, None)
+
+
+__all__ = ["singleton", "reset_singleton"]
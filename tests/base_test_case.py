@@ -1,6 +1,26 @@
+import os
+import shutil
+import sys
+import tempfile
 import unittest
+from contextlib import contextmanager
+from io import StringIO
+from pathlib import Path
+from unittest.mock import MagicMock
 
-from typing import TypeVar, Optional, cast
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 from githooklib import get_logger, Logger
 
@@ -12,14 +32,117 @@ except ImportError:
 T = TypeVar("T")
 
 
+class SpyCounter:
+    __slots__ = ("count", "last_args", "return_value")
+
+    def __init__(self, return_value: Any = None) -> None:
+        self.count = 0
+        self.last_args: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = None
+        self.return_value = return_value
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.count += 1
+        self.last_args = (args, kwargs)
+        return self.return_value
+
+
 class BaseTestCase(unittest.TestCase):
     logger: Logger
+    _scratch_pool: ClassVar[List[Path]]
 
     @classmethod
     def setUpClass(cls) -> None:
         cls.logger = get_logger(__name__, prefix=cls.__name__)
         cls.logger.setLevel(0)
 
+    def make_scratch_dir(self) -> Path:
+        pool = type(self)._get_scratch_pool()
+        scratch_dir = pool.pop() if pool else Path(tempfile.mkdtemp())
+        self.addCleanup(self._release_scratch_dir, scratch_dir)
+        return scratch_dir
+
+    @classmethod
+    def _get_scratch_pool(cls) -> List[Path]:
+        if "_scratch_pool" not in cls.__dict__:
+            cls._scratch_pool = []
+            cls.addClassCleanup(cls._remove_scratch_pool)
+        return cls._scratch_pool
+
+    @classmethod
+    def _release_scratch_dir(cls, scratch_dir: Path) -> None:
+        try:
+            with os.scandir(scratch_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+        except OSError:
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+            return
+        cls._get_scratch_pool().append(scratch_dir)
+
+    @classmethod
+    def _remove_scratch_pool(cls) -> None:
+        for scratch_dir in cls.__dict__.get("_scratch_pool", []):
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+        cls._scratch_pool.clear()
+
+    @staticmethod
+    def touch(path: Path, data: bytes = b"x") -> None:
+        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def make_dirs(base: Path, names: Iterable[str]) -> List[Path]:
+        base_str = str(base)
+        created = []
+        for name in names:
+            path = os.path.join(base_str, name)
+            os.mkdir(path)
+            created.append(Path(path))
+        return created
+
+    @staticmethod
+    def reset_mocks(*mocks: MagicMock) -> None:
+        for mock in mocks:
+            mock.reset_mock(return_value=True, side_effect=True)
+
+    def start_patch(self, patcher: Any) -> Any:
+        started = patcher.start()
+        self.addCleanup(patcher.stop)
+        return started
+
+    @staticmethod
+    def raising(error: BaseException) -> Callable[..., Any]:
+        def _raise(*_args: Any, **_kwargs: Any) -> Any:
+            raise error
+
+        return _raise
+
+    @staticmethod
+    @contextmanager
+    def patched_argv(*args: str) -> Iterator[List[str]]:
+        original_argv = sys.argv
+        sys.argv = list(args)
+        try:
+            yield sys.argv
+        finally:
+            sys.argv = original_argv
+
+    @staticmethod
+    @contextmanager
+    def patched_stdin(content: str) -> Iterator[StringIO]:
+        original_stdin = sys.stdin
+        sys.stdin = StringIO(content)
+        try:
+            yield sys.stdin
+        finally:
+            sys.stdin = original_stdin
+
     def unwrap_optional(self, obj: Optional[T], msg: Optional[str] = None) -> T:
         super().assertIsNotNone(obj, msg)
         return cast(T, obj)
@@ -1,12 +1,11 @@
 import os
 import re
-import sys
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path
 from typing import List, Optional, Generator, Dict
 
-from githooklib import CommandExecutor, get_logger, CommandResult
+from githooklib import CommandExecutor, CommandResult
 from tests.base_test_case import BaseTestCase
 from tests.utils import PathUtils
 
@@ -1,3 +1,4 @@
+import shutil
 import unittest
 
 from .base_test_case import OperationsBaseTestCase
@@ -39,8 +40,6 @@ class TestInstallE2E(OperationsBaseTestCase):
     def test_hooks_directory_missing(self):
         with self.new_temp_project() as root:
             hooks_dir = self.get_installed_hooks_path(root)
-            import shutil
-
             shutil.rmtree(hooks_dir)
             result = self.githooklib(
                 ["install", "pre-commit"], cwd=root, success=False, exit_code=1
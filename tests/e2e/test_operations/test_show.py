@@ -1,3 +1,4 @@
+import shutil
 import unittest
 
 from githooklib.ui_messages import (
@@ -59,8 +60,6 @@ class TestShowE2E(OperationsBaseTestCase):
     def test_no_hooks_directory(self):
         with self.new_temp_project() as root:
             hooks_dir = self.get_installed_hooks_path(root)
-            import shutil
-
             shutil.rmtree(hooks_dir)
             result = self.githooklib(["show"], cwd=root, success=True, exit_code=0)
             self.assertIn(UI_MESSAGE_NO_HOOKS_DIRECTORY_FOUND, result.stdout)
@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import patch
 
-from githooklib import GitHook, GitHookContext, HookResult, CommandExecutor
+from githooklib import GitHook, GitHookContext, HookResult
 
 
 class TestPreCommit(unittest.TestCase):
@@ -4,41 +4,59 @@ import re
 import subprocess
 import unittest
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 from unittest import skip
 
 from githooklib.gateways import ProjectRootGateway
 from tests.base_test_case import BaseTestCase
 
 
+def _convert_to_wsl_path(windows_path: str) -> str:
+    path_str = str(Path(windows_path).resolve())
+    if len(path_str) >= 2 and path_str[1] == ":":
+        drive_letter = path_str[0].lower()
+        path_without_drive = path_str[2:].replace("\\", "/")
+        return f"/mnt/{drive_letter}{path_without_drive}"
+    return path_str.replace("\\", "/")
+
+
 @skip("Only run manually if you have time")
 class TestWslPytest(BaseTestCase):
-    def setUp(self):
+    project_root: Path
+    wsl_project_path: str
+    wsl_venv_path: str
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
         if platform.system() != "Windows":
-            self.skipTest("WSL tests only run on Windows")
+            raise unittest.SkipTest("WSL tests only run on Windows")
 
         if os.environ.get("GITHOOKLIB_WSL_TEST_RUNNING"):
-            self.skipTest("Already running in WSL test context to prevent recursion")
+            raise unittest.SkipTest(
+                "Already running in WSL test context to prevent recursion"
+            )
 
-    def _convert_to_wsl_path(self, windows_path: Path) -> str:
-        path_str = str(windows_path.resolve())
-        if len(path_str) >= 2 and path_str[1] == ":":
-            drive_letter = path_str[0].lower()
-            path_without_drive = path_str[2:].replace("\\", "/")
-            return f"/mnt/{drive_letter}{path_without_drive}"
-        return path_str.replace("\\", "/")
+        project_root = ProjectRootGateway.find_project_root()
+        if project_root is None:
+            raise unittest.SkipTest("Project root not found")
+
+        cls.project_root = project_root
+        cls.wsl_project_path = _convert_to_wsl_path(str(project_root))
+        cls.wsl_venv_path = _convert_to_wsl_path(str(project_root / "wslvenv"))
 
     def _discover_tests(
-        self, project_root: Path, wsl_project_path: str, wsl_venv_path: str
+        self,
+        project_root: Path,
+        wsl_project_path: str,
+        wsl_venv_path: str,
+        env: Dict[str, str],
     ) -> List[str]:
         wsl_command = (
             f"cd {wsl_project_path} && "
             f"{wsl_venv_path}/bin/python -m pytest --collect-only -q"
         )
 
-        env = os.environ.copy()
-        env["GITHOOKLIB_WSL_TEST_RUNNING"] = "1"
-
         result = subprocess.run(
             ["wsl", "bash", "-c", wsl_command],
             capture_output=True,
@@ -69,15 +87,13 @@ class TestWslPytest(BaseTestCase):
         project_root: Path,
         wsl_project_path: str,
         wsl_venv_path: str,
+        env: Dict[str, str],
     ) -> tuple[int, str, str]:
         wsl_command = (
             f"cd {wsl_project_path} && "
             f"{wsl_venv_path}/bin/python -m pytest {test_name}"
         )
 
-        env = os.environ.copy()
-        env["GITHOOKLIB_WSL_TEST_RUNNING"] = "1"
-
         result = subprocess.run(
             ["wsl", "bash", "-c", wsl_command],
             capture_output=True,
@@ -89,20 +105,17 @@ class TestWslPytest(BaseTestCase):
         return result.returncode, result.stdout, result.stderr
 
     def test_run_all_tests_in_wsl(self):
-        if platform.system() != "Windows":
-            self.skipTest("WSL tests only run on Windows")
-
-        if os.environ.get("GITHOOKLIB_WSL_TEST_RUNNING"):
-            self.skipTest("Already running in WSL test context to prevent recursion")
-
-        project_root = ProjectRootGateway.find_project_root()
-        wsl_project_path = self._convert_to_wsl_path(project_root)
-        wsl_venv_path = self._convert_to_wsl_path(project_root / "wslvenv")
+        project_root = self.project_root
+        wsl_project_path = self.wsl_project_path
+        wsl_venv_path = self.wsl_venv_path
 
         if not (project_root / "wslvenv").exists():
             self.skipTest("wslvenv not found, skipping WSL test")
 
-        test_names = self._discover_tests(project_root, wsl_project_path, wsl_venv_path)
+        wsl_env = {**os.environ, "GITHOOKLIB_WSL_TEST_RUNNING": "1"}
+        test_names = self._discover_tests(
+            project_root, wsl_project_path, wsl_venv_path, wsl_env
+        )
 
         if not test_names:
             self.skipTest("No tests discovered in WSL")
@@ -115,7 +128,7 @@ class TestWslPytest(BaseTestCase):
         for test_name in test_names:
             with self.subTest(test_name):
                 exit_code, stdout, stderr = self._run_single_test_in_wsl(
-                    test_name, project_root, wsl_project_path, wsl_venv_path
+                    test_name, project_root, wsl_project_path, wsl_venv_path, wsl_env
                 )
 
                 self.logger.debug("Test %s: exit_code=%d", test_name, exit_code)
@@ -1,31 +1,28 @@
+import functools
+import threading
 import time
 import unittest
+from typing import Callable, Dict
 
 from githooklib.execution import ParallelExecutor
 
 
 class TestParallelExecutionPerformance(unittest.TestCase):
-    def test_parallel_execution_faster_than_sequential(self):
-        def slow_task():
-            time.sleep(0.1)
-            return "done"
+    def test_parallel_execution_runs_tasks_concurrently(self):
+        max_workers = 4
+        barrier = threading.Barrier(max_workers, timeout=5)
         
-        tasks = {f"task_{i}": slow_task for i in range(10)}
+        def rendezvous_task():
+            barrier.wait()
+            return "done"
         
-        start_sequential = time.time()
-        for task in tasks.values():
-            task()
-        sequential_time = time.time() - start_sequential
+        tasks = {f"task_{i}": rendezvous_task for i in range(max_workers)}
         
-        executor = ParallelExecutor(max_workers=4)
-        start_parallel = time.time()
+        executor = ParallelExecutor(max_workers=max_workers)
         results = executor.execute_tasks(tasks, show_progress=False)
-        parallel_time = time.time() - start_parallel
         
-        self.assertEqual(len(results), 10)
+        self.assertEqual(len(results), max_workers)
         self.assertTrue(all(r.success for r in results))
-        
-        self.assertLess(parallel_time, sequential_time * 0.5)
     
     def test_parallel_executor_handles_failures(self):
         def failing_task():
@@ -51,6 +48,49 @@ class TestParallelExecutionPerformance(unittest.TestCase):
         
         self.assertEqual(len(successful), 2)
         self.assertEqual(len(failed), 2)
+    
+    def test_parallel_executor_fail_fast_cancels_pending_tasks(self):
+        started = []
+        
+        def failing_task():
+            raise ValueError("Task failed")
+        
+        def pending_task():
+            started.append(True)
+            time.sleep(0.1)
+            return "success"
+        
+        tasks = {"fail": failing_task}
+        tasks.update({f"pending_{i}": pending_task for i in range(10)})
+        
+        executor = ParallelExecutor(max_workers=1)
+        results = executor.execute_tasks(tasks, show_progress=False, fail_fast=True)
+        
+        self.assertEqual(["fail"], [r.task_id for r in results])
+        self.assertFalse(results[0].success)
+        self.assertLessEqual(len(started), 1)
+    
+    def test_parallel_executor_without_progress_preserves_task_order(self):
+        tasks: Dict[str, Callable[[], int]] = {
+            f"task_{i}": functools.partial(int, i) for i in range(10)
+        }
+        
+        results = ParallelExecutor(max_workers=4).execute_tasks(tasks, show_progress=False)
+        
+        self.assertEqual(list(tasks), [r.task_id for r in results])
+        self.assertEqual(list(range(10)), [r.result for r in results])
+    
+    def test_nested_execute_tasks_completes(self):
+        executor = ParallelExecutor()
+        
+        def outer_task():
+            inner = executor.execute_tasks({"inner": lambda: 1}, show_progress=False)
+            return inner[0].result
+        
+        tasks = {f"outer_{i}": outer_task for i in range(8)}
+        results = executor.execute_tasks(tasks, show_progress=False)
+        
+        self.assertEqual([1] * 8, [r.result for r in results])
 
 
 __all__ = ["TestParallelExecutionPerformance"]
@@ -1,3 +1,4 @@
+import hashlib
 import tempfile
 from pathlib import Path
 
@@ -66,6 +67,19 @@ class TestFileHashCache(BaseTestCase):
                 self.assertEqual(original_hash, loaded_hash)
         finally:
             temp_file.unlink()
+    
+    def test_file_hash_matches_md5_for_small_and_large_files(self):
+        small_content = b"small content"
+        large_content = bytes(range(256)) * 1024
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = FileHashCache(cache_dir=Path(temp_dir) / "cache")
+            for name, content in (("small", small_content), ("large", large_content), ("empty", b"")):
+                with self.subTest(name=name):
+                    file_path = Path(temp_dir) / name
+                    file_path.write_bytes(content)
+                    
+                    self.assertEqual(hashlib.md5(content).hexdigest(), cache.update_hash(file_path))
 
 
 __all__ = ["TestFileHashCache"]
@@ -1,7 +1,9 @@
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
-from githooklib.config import ConfigLoader, GithooklibConfig
+from githooklib.config import ConfigLoader, GithooklibConfig, clear_config_cache
+from githooklib.config import config_loader
 from githooklib.config.config_schema import (
     PerformanceConfig,
     NotificationsConfig,
@@ -12,6 +14,10 @@ from tests.base_test_case import BaseTestCase
 
 
 class TestConfigLoader(BaseTestCase):
+    def setUp(self):
+        clear_config_cache()
+        self.addCleanup(clear_config_cache)
+    
     def test_load_default_config_when_no_file_exists(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             config = ConfigLoader.load_config(Path(temp_dir) / "nonexistent.yaml")
@@ -57,6 +63,66 @@ performance:
             self.assertTrue(config.performance.caching_enabled)
             self.assertTrue(config.performance.parallel_execution)
             self.assertEqual(config.performance.max_workers, 8)
+    
+    def test_load_config_reuses_parsed_config_for_unchanged_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / ".githooklib.yaml"
+            config_path.write_text("log_level: DEBUG\n", encoding="utf-8")
+            parse_spy = self.start_patch(
+                patch.object(
+                    config_loader,
+                    "_parse_config_data",
+                    wraps=config_loader._parse_config_data,
+                )
+            )
+            
+            first = ConfigLoader.load_config(config_path)
+            second = ConfigLoader.load_config(config_path)
+            
+            self.assertEqual(first, second)
+            parse_spy.assert_called_once()
+    
+    def test_load_config_returns_independent_copies_for_unchanged_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / ".githooklib.yaml"
+            config_path.write_text("log_level: DEBUG\n", encoding="utf-8")
+            
+            first = ConfigLoader.load_config(config_path)
+            first.hook_search_paths.append("mutated")
+            second = ConfigLoader.load_config(config_path)
+            
+            self.assertIsNot(first, second)
+            self.assertEqual(["githooks"], second.hook_search_paths)
+    
+    def test_clear_config_cache_forces_reparse(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / ".githooklib.yaml"
+            config_path.write_text("log_level: DEBUG\n", encoding="utf-8")
+            parse_spy = self.start_patch(
+                patch.object(
+                    config_loader,
+                    "_parse_config_data",
+                    wraps=config_loader._parse_config_data,
+                )
+            )
+            
+            ConfigLoader.load_config(config_path)
+            clear_config_cache()
+            ConfigLoader.load_config(config_path)
+            
+            self.assertEqual(2, parse_spy.call_count)
+    
+    def test_load_config_reparses_modified_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / ".githooklib.yaml"
+            config_path.write_text("log_level: DEBUG\n", encoding="utf-8")
+            first = ConfigLoader.load_config(config_path)
+            
+            config_path.write_text("log_level: WARNING\n", encoding="utf-8")
+            second = ConfigLoader.load_config(config_path)
+            
+            self.assertEqual("DEBUG", first.log_level)
+            self.assertEqual("WARNING", second.log_level)
 
 
 class TestConfigValidation(BaseTestCase):
@@ -1,7 +1,9 @@
+import shutil
+import subprocess
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from githooklib import GitHookContext
 from githooklib.command import CommandExecutor, CommandResult
@@ -11,6 +13,15 @@ from ...utils import PathUtils
 
 
 class TestPreCommitBlack(BaseTestCase):
+    _skeleton_dir: Optional[tempfile.TemporaryDirectory] = None
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        if cls._skeleton_dir is not None:
+            cls._skeleton_dir.cleanup()
+            cls._skeleton_dir = None
+        super().tearDownClass()
+
     def setUp(self) -> None:
         super().setUp()
         self.executor = CommandExecutor()
@@ -53,9 +64,22 @@ class TestPreCommitBlack(BaseTestCase):
             )
 
     def _initialize_repo(self, repo: Path) -> None:
-        self._git(repo, ["init"])
-        self._git(repo, ["config", "user.email", "test@example.com"])
-        self._git(repo, ["config", "user.name", "Tester"])
+        shutil.copytree(self._get_skeleton_repo(), repo, dirs_exist_ok=True)
+
+    @classmethod
+    def _get_skeleton_repo(cls) -> Path:
+        if cls._skeleton_dir is None:
+            cls._skeleton_dir = tempfile.TemporaryDirectory()
+            skeleton = Path(cls._skeleton_dir.name)
+            for args in (
+                ["init"],
+                ["config", "user.email", "test@example.com"],
+                ["config", "user.name", "Tester"],
+            ):
+                subprocess.run(
+                    ["git"] + args, cwd=skeleton, capture_output=True, check=True
+                )
+        return Path(cls._skeleton_dir.name)
 
     def _create_initial_commit(
         self, repo: Path, staged_file: Path, unstaged_file: Path
@@ -1,9 +1,10 @@
 import os
+import shlex
 import subprocess
 import tempfile
 import unittest
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from unittest.mock import patch
 
 from githooklib.constants import EXIT_FAILURE
@@ -12,14 +13,55 @@ from githooklib.gateways import GitGateway
 from tests.base_test_case import BaseTestCase
 
 
+_DELEGATION_SCRIPT = b"""#!/usr/bin/env python3
+
+import subprocess
+import sys
+
+
+def main() -> None:
+    result = subprocess.run(
+        ["python", "-m", "githooklib", "run", "pre-commit"],
+        cwd="/path/to/project",
+    )
+    sys.exit(result.returncode)
+
+
+if __name__ == "__main__":
+    main()
+"""
+
+
 class TestGitRepositoryGateway(BaseTestCase):
+    _shared_gateway: GitGateway
+    _shared_root: Optional[Path]
+    _repo_dir: tempfile.TemporaryDirectory
+    _repo: Path
+    _hooks_path: Path
+    _delegation_path: Path
+    _regular_path: Path
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._shared_gateway = GitGateway()
+        cls._shared_root = cls._shared_gateway.get_git_root_path()
+        cls._repo_dir = tempfile.TemporaryDirectory()
+        cls._repo = Path(cls._repo_dir.name)
+        cls._initialize_repo(cls._repo)
+        cls._git(cls._repo, ["commit", "--allow-empty", "-m", "initial"])
+        cls._git(cls._repo, ["tag", "initial"])
+        cls._create_hook_fixtures()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._repo_dir.cleanup()
+        super().tearDownClass()
+
     def setUp(self):
-        self.gateway = GitGateway()
+        self.gateway = self._shared_gateway
 
     def test_find_git_root_via_command_subprocess_fails_returns_none(self):
-        from githooklib.definitions import CommandResult
-        from githooklib.constants import EXIT_FAILURE
-
         with self.subTest("file_not_found_error"):
             failed_result = CommandResult(
                 success=False,
@@ -56,13 +98,8 @@ class TestGitRepositoryGateway(BaseTestCase):
 
     def test_find_git_root_via_command_no_git_directory_returns_none(self):
         with tempfile.TemporaryDirectory() as temp_dir:
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(temp_dir)
-                result = self.gateway._find_git_root_via_command()
-                self.assertIsNone(result)
-            finally:
-                os.chdir(original_cwd)
+            result = self.gateway._find_git_root_via_command(cwd=Path(temp_dir))
+            self.assertIsNone(result)
 
     def test_find_git_root_via_filesystem_ends_with_githooklib(self):
         result = self.gateway._find_git_root_via_filesystem()
@@ -71,17 +108,9 @@ class TestGitRepositoryGateway(BaseTestCase):
         self.assertTrue((result / ".git").exists())
 
     def test_find_git_root_via_filesystem_found_in_parent(self):
-        git_root = self.gateway.get_git_root_path()
-        git_root = self.unwrap_optional(git_root)
-        original_cwd = os.getcwd()
-        try:
-            subdir = git_root / "tests" / "ut" / "gateways"
-            subdir.mkdir(parents=True, exist_ok=True)
-            os.chdir(subdir)
-            result = self.gateway._find_git_root_via_filesystem()
-            self.assertIsNotNone(result)
-        finally:
-            os.chdir(original_cwd)
+        git_root = self.unwrap_optional(self._shared_root)
+        result = self.gateway._find_git_root_via_filesystem(Path(__file__).parent)
+        self.assertEqual(result, git_root.parent.resolve())
 
     def test_find_git_root_ends_with_githooklib(self):
         result = self.gateway.get_git_root_path()
@@ -90,63 +119,25 @@ class TestGitRepositoryGateway(BaseTestCase):
         self.assertTrue(result.exists())
 
     def test_find_git_root_no_repo_returns_none(self):
+        self.gateway = GitGateway()
         self.gateway.get_git_root_path.cache_clear()
-        with tempfile.TemporaryDirectory() as temp_dir:
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(temp_dir)
-                with patch.object(
-                    self.gateway, "_find_git_root_via_command", return_value=None
-                ):
-                    with patch.object(
-                        self.gateway, "_find_git_root_via_filesystem", return_value=None
-                    ):
-                        result = self.gateway.get_git_root_path()
-                        self.assertIsNone(result)
-            finally:
-                os.chdir(original_cwd)
-                self.gateway.get_git_root_path.cache_clear()
+        self.addCleanup(self.gateway.get_git_root_path.cache_clear)
+        self.start_patch(
+            patch.object(self.gateway, "_find_git_root_via_command", return_value=None)
+        )
+        self.start_patch(
+            patch.object(
+                self.gateway, "_find_git_root_via_filesystem", return_value=None
+            )
+        )
+        result = self.gateway.get_git_root_path()
+        self.assertIsNone(result)
 
     def test_is_hook_from_githooklib_true_for_correct(self):
-        with tempfile.NamedTemporaryFile(
-            mode="w", delete=False, suffix=".sh"
-        ) as temp_file:
-            temp_path = Path(temp_file.name)
-            delegation_script = """#!/usr/bin/env python3
-
-import subprocess
-import sys
-
-
-def main() -> None:
-    result = subprocess.run(
-        ["python", "-m", "githooklib", "run", "pre-commit"],
-        cwd="/path/to/project",
-    )
-    sys.exit(result.returncode)
-
-
-if __name__ == "__main__":
-    main()
-"""
-            temp_file.write(delegation_script)
-        try:
-            result = GitGateway._is_hook_from_githooklib(temp_path)
-            self.assertTrue(result)
-        finally:
-            temp_path.unlink()
+        self.assertTrue(GitGateway._is_hook_from_githooklib(self._delegation_path))
 
     def test_is_hook_from_githooklib_false_for_incorrect(self):
-        with tempfile.NamedTemporaryFile(
-            mode="w", delete=False, suffix=".sh"
-        ) as temp_file:
-            temp_path = Path(temp_file.name)
-            temp_file.write("#!/bin/bash\necho 'test'")
-        try:
-            result = GitGateway._is_hook_from_githooklib(temp_path)
-            self.assertFalse(result)
-        finally:
-            temp_path.unlink()
+        self.assertFalse(GitGateway._is_hook_from_githooklib(self._regular_path))
 
     def test_is_hook_from_githooklib_false_on_file_read_error(self):
         non_existent_path = Path("/non/existent/path/hook")
@@ -163,7 +154,7 @@ if __name__ == "__main__":
         with tempfile.TemporaryDirectory() as temp_dir:
             hooks_dir = Path(temp_dir)
             sample_hook = hooks_dir / "pre-commit.sample"
-            sample_hook.write_text("sample content")
+            self.touch(sample_hook, b"sample content")
             try:
                 result = self.gateway.get_installed_hooks(hooks_dir)
                 self.assertNotIn("pre-commit.sample", result)
@@ -173,113 +164,82 @@ if __name__ == "__main__":
                     sample_hook.unlink()
 
     def test_get_installed_hooks(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            hooks_dir = Path(temp_dir)
-            githooklib_hook = hooks_dir / "pre-commit"
-            delegation_script = """#!/usr/bin/env python3
-
-import subprocess
-import sys
-
-
-def main() -> None:
-    result = subprocess.run(
-        ["python", "-m", "githooklib", "run", "pre-commit"],
-        cwd="/path/to/project",
-    )
-    sys.exit(result.returncode)
-
-
-if __name__ == "__main__":
-    main()
-"""
-            githooklib_hook.write_text(delegation_script)
-            regular_hook = hooks_dir / "pre-push"
-            regular_hook.write_text("#!/bin/bash\necho 'test'")
-            sample_hook = hooks_dir / "pre-commit.sample"
-            sample_hook.write_text("sample content")
-            try:
-                result = self.gateway.get_installed_hooks(hooks_dir)
-                self.assertIn("pre-commit", result)
-                self.assertTrue(result["pre-commit"])
-                self.assertIn("pre-push", result)
-                self.assertFalse(result["pre-push"])
-                self.assertNotIn("pre-commit.sample", result)
-            finally:
-                for hook_file in [githooklib_hook, regular_hook, sample_hook]:
-                    if hook_file.exists():
-                        hook_file.unlink()
+        result = self.gateway.get_installed_hooks(self._hooks_path)
+        self.assertIn("pre-commit", result)
+        self.assertTrue(result["pre-commit"])
+        self.assertIn("pre-push", result)
+        self.assertFalse(result["pre-push"])
+        self.assertNotIn("pre-commit.sample", result)
 
     def test_get_cached_index_files_returns_staged_files(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo = Path(temp_dir)
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(repo)
-                self._initialize_repo(repo)
-                test_file = repo / "test.py"
-                test_file.write_text("print('test')")
-                self._git(repo, ["add", "test.py"])
-                files = self.gateway.get_cached_index_files()
-                self.assertIn("test.py", files)
-            finally:
-                os.chdir(original_cwd)
+        repo = self._use_shared_repo()
+        test_file = repo / "test.py"
+        test_file.write_text("print('test')")
+        self._git(repo, ["add", "test.py"])
+        files = self.gateway.get_cached_index_files(cwd=repo)
+        self.assertIn("test.py", files)
 
     def test_get_cached_index_files_no_staged_files_returns_empty(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo = Path(temp_dir)
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(repo)
-                self._initialize_repo(repo)
-                files = self.gateway.get_cached_index_files()
-                self.assertEqual(files, [])
-            finally:
-                os.chdir(original_cwd)
+        repo = self._use_shared_repo()
+        files = self.gateway.get_cached_index_files(cwd=repo)
+        self.assertEqual(files, [])
 
     def test_get_diff_files_between_refs_returns_changed_files(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo = Path(temp_dir)
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(repo)
-                self._initialize_repo(repo)
-                test_file = repo / "test.py"
-                test_file.write_text("print('test')")
-                self._git(repo, ["add", "test.py"])
-                self._git(repo, ["commit", "-m", "initial"])
-                test_file.write_text("print('updated')")
-                self._git(repo, ["add", "test.py"])
-                self._git(repo, ["commit", "-m", "update"])
-                files = self.gateway.get_diff_files_between_refs("HEAD~1", "HEAD")
-                self.assertIn("test.py", files)
-            finally:
-                os.chdir(original_cwd)
+        repo = self._use_shared_repo()
+        test_file = repo / "test.py"
+        test_file.write_text("print('test')")
+        self._git_batch(repo, [["add", "test.py"], ["commit", "-m", "add test"]])
+        test_file.write_text("print('updated')")
+        self._git_batch(repo, [["add", "test.py"], ["commit", "-m", "update"]])
+        files = self.gateway.get_diff_files_between_refs("HEAD~1", "HEAD", cwd=repo)
+        self.assertIn("test.py", files)
 
     def test_get_all_modified_files_returns_changed_files(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo = Path(temp_dir)
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(repo)
-                self._initialize_repo(repo)
-                test_file = repo / "test.py"
-                test_file.write_text("print('test')")
-                files = self.gateway.get_all_modified_files()
-                self.assertIn("test.py", files)
-            finally:
-                os.chdir(original_cwd)
-
-    def _initialize_repo(self, repo: Path) -> None:
-        self._git(repo, ["init"])
-        self._git(repo, ["config", "user.email", "test@example.com"])
-        self._git(repo, ["config", "user.name", "Tester"])
-
-    def _git(self, repo: Path, args: List[str]) -> None:
+        repo = self._use_shared_repo()
+        test_file = repo / "test.py"
+        test_file.write_text("print('test')")
+        files = self.gateway.get_all_modified_files(cwd=repo)
+        self.assertIn("test.py", files)
+
+    def _use_shared_repo(self) -> Path:
+        self.addCleanup(self._git, self._repo, ["clean", "-fdx"])
+        self.addCleanup(self._git, self._repo, ["reset", "--hard", "initial"])
+        return self._repo
+
+    @classmethod
+    def _create_hook_fixtures(cls) -> None:
+        hook_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(hook_dir.cleanup)
+        cls._hooks_path = Path(hook_dir.name)
+        cls._delegation_path = cls._hooks_path / "pre-commit"
+        cls.touch(cls._delegation_path, _DELEGATION_SCRIPT)
+        cls._regular_path = cls._hooks_path / "pre-push"
+        cls.touch(cls._regular_path, b"#!/bin/bash\necho 'test'")
+        cls.touch(cls._hooks_path / "pre-commit.sample", b"sample content")
+
+    @classmethod
+    def _initialize_repo(cls, repo: Path) -> None:
+        cls._git(repo, ["-c", "init.defaultBranch=main", "init"])
+        with open(repo / ".git" / "config", "a", encoding="utf-8") as git_config:
+            git_config.write("[user]\n\temail = test@example.com\n\tname = Tester\n")
+
+    @staticmethod
+    def _git(repo: Path, args: List[str]) -> None:
         result = subprocess.run(
             ["git"] + args, cwd=repo, capture_output=True, text=True, check=True
         )
 
+    @classmethod
+    def _git_batch(cls, repo: Path, commands: List[List[str]]) -> None:
+        if os.name == "nt":
+            for args in commands:
+                cls._git(repo, args)
+            return
+        script = " && ".join(shlex.join(["git"] + args) for args in commands)
+        subprocess.run(
+            ["sh", "-c", script], cwd=repo, capture_output=True, text=True, check=True
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
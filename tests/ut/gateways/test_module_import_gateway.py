@@ -3,7 +3,8 @@ import tempfile
 import unittest
 from builtins import __import__
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 from githooklib.gateways.module_import_gateway import ModuleImportGateway
 from tests.base_test_case import BaseTestCase
@@ -34,10 +35,8 @@ class TestModuleImportGateway(BaseTestCase):
             project_root = Path(temp_dir)
             module_file = project_root / "test_module.py"
             module_file.write_text("test")
-            with patch("importlib.util.find_spec") as mock_find_spec:
-                mock_spec = MagicMock()
-                mock_spec.origin = str(module_file)
-                mock_find_spec.return_value = mock_spec
+            spec = SimpleNamespace(origin=str(module_file))
+            with patch("importlib.util.find_spec", return_value=spec):
                 result = ModuleImportGateway.find_module_file(
                     "test_module", project_root
                 )
@@ -47,10 +46,8 @@ class TestModuleImportGateway(BaseTestCase):
         with tempfile.TemporaryDirectory() as temp_dir:
             module_file = Path(temp_dir) / "test_module.py"
             module_file.write_text("test")
-            with patch("importlib.util.find_spec") as mock_find_spec:
-                mock_spec = MagicMock()
-                mock_spec.origin = str(module_file)
-                mock_find_spec.return_value = mock_spec
+            spec = SimpleNamespace(origin=str(module_file))
+            with patch("importlib.util.find_spec", return_value=spec):
                 result = ModuleImportGateway.find_module_file("test_module", None)
                 self.assertEqual(result, str(module_file))
 
@@ -62,10 +59,8 @@ class TestModuleImportGateway(BaseTestCase):
             project_root.mkdir()
             module_file = Path(temp_dir) / "test_module.py"
             module_file.write_text("test")
-            with patch("importlib.util.find_spec") as mock_find_spec:
-                mock_spec = MagicMock()
-                mock_spec.origin = str(module_file)
-                mock_find_spec.return_value = mock_spec
+            spec = SimpleNamespace(origin=str(module_file))
+            with patch("importlib.util.find_spec", return_value=spec):
                 result = ModuleImportGateway.find_module_file(
                     "test_module", project_root
                 )
@@ -77,10 +72,8 @@ class TestModuleImportGateway(BaseTestCase):
             self.assertIsNone(result)
 
     def test_find_module_file_returns_none_when_spec_origin_missing(self):
-        with patch("importlib.util.find_spec") as mock_find_spec:
-            mock_spec = MagicMock()
-            mock_spec.origin = None
-            mock_find_spec.return_value = mock_spec
+        spec = SimpleNamespace(origin=None)
+        with patch("importlib.util.find_spec", return_value=spec):
             result = ModuleImportGateway.find_module_file("test", None)
             self.assertIsNone(result)
 
@@ -113,7 +106,7 @@ class TestModuleImportGateway(BaseTestCase):
             relative_path = Path("test/module/__init__.py")
             original_import = __import__
             call_count = 0
-            mock_module = MagicMock()
+            mock_module = SimpleNamespace()
 
             def side_effect(name, *args, **kwargs):
                 nonlocal call_count
@@ -132,7 +125,7 @@ class TestModuleImportGateway(BaseTestCase):
             module_file.write_text("")
             original_import = __import__
             call_count = 0
-            mock_module = MagicMock()
+            mock_module = SimpleNamespace()
 
             def side_effect(name, *args, **kwargs):
                 nonlocal call_count
@@ -10,6 +10,11 @@ class TestProjectRootGateway(BaseTestCase):
         result = self.unwrap_optional(result)
         self.assertEqual("githooklib", result.name)
 
+    def test_find_project_root_is_resolved_once_per_process(self):
+        first = ProjectRootGateway.find_project_root()
+        self.assertIs(ProjectRootGateway.find_project_root(), first)
+        self.assertGreater(ProjectRootGateway.find_project_root.cache_info().hits, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
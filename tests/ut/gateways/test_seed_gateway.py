@@ -1,5 +1,6 @@
 import unittest
 from pathlib import Path
+from typing import List
 from unittest.mock import patch
 
 from githooklib.gateways.seed_gateway import SeedGateway
@@ -7,8 +8,17 @@ from tests.base_test_case import BaseTestCase
 
 
 class TestSeedGateway(BaseTestCase):
+    _shared_gateway: SeedGateway
+    _examples: List[str]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._shared_gateway = SeedGateway()
+        cls._examples = cls._shared_gateway.get_available_examples()
+
     def setUp(self):
-        self.gateway = SeedGateway()
+        self.gateway = self._shared_gateway
 
     def test_get_available_examples_returns_list(self):
         result = self.gateway.get_available_examples()
@@ -20,7 +30,7 @@ class TestSeedGateway(BaseTestCase):
         self.assertEqual(result1, result2)
 
     def test_is_example_available_returns_true_when_exists(self):
-        examples = self.gateway.get_available_examples()
+        examples = self._examples
         if examples:
             result = self.gateway.is_example_available(examples[0])
             self.assertTrue(result)
@@ -30,7 +40,7 @@ class TestSeedGateway(BaseTestCase):
         self.assertFalse(result)
 
     def test_is_example_available_caches_result(self):
-        examples = self.gateway.get_available_examples()
+        examples = self._examples
         if examples:
             with patch.object(self.gateway, "_get_examples_folder_path") as mock_path:
                 result1 = self.gateway.is_example_available(examples[0])
@@ -38,14 +48,14 @@ class TestSeedGateway(BaseTestCase):
                 self.assertEqual(result1, result2)
 
     def test_get_example_path_returns_path(self):
-        examples = self.gateway.get_available_examples()
+        examples = self._examples
         if examples:
             result = self.gateway.get_example_path(examples[0])
             self.assertIsInstance(result, Path)
             self.assertTrue(result.name.endswith(".py"))
 
     def test_get_example_path_caches_result(self):
-        examples = self.gateway.get_available_examples()
+        examples = self._examples
         if examples:
             result1 = self.gateway.get_example_path(examples[0])
             result2 = self.gateway.get_example_path(examples[0])
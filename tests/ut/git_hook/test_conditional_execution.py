@@ -1,12 +1,14 @@
-import sys
-import tempfile
+import dataclasses
+import fnmatch
 import unittest
+from contextlib import ExitStack
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple, cast
 from unittest.mock import patch
 
 from githooklib import GitHook, GitHookContext, HookResult
 from githooklib.gateways import GitGateway
-from tests.base_test_case import BaseTestCase
+from tests.base_test_case import BaseTestCase, SpyCounter
 
 
 class HookWithoutPatterns(GitHook):
@@ -15,7 +17,7 @@ class HookWithoutPatterns(GitHook):
         return "test-hook"
 
     @classmethod
-    def get_file_patterns(cls):
+    def get_file_patterns(cls) -> Optional[List[str]]:
         return None
 
     def execute(self, context: GitHookContext) -> HookResult:
@@ -28,7 +30,7 @@ class HookWithPatterns(GitHook):
         return "test-hook-patterns"
 
     @classmethod
-    def get_file_patterns(cls):
+    def get_file_patterns(cls) -> Optional[List[str]]:
         return ["*.py", "src/**/*.ts"]
 
     def execute(self, context: GitHookContext) -> HookResult:
@@ -41,7 +43,7 @@ class HookWithEmptyPatterns(GitHook):
         return "test-hook-empty-patterns"
 
     @classmethod
-    def get_file_patterns(cls):
+    def get_file_patterns(cls) -> Optional[List[str]]:
         return []
 
     def execute(self, context: GitHookContext) -> HookResult:
@@ -54,7 +56,7 @@ class PreCommitHookWithPatterns(GitHook):
         return "pre-commit"
 
     @classmethod
-    def get_file_patterns(cls):
+    def get_file_patterns(cls) -> Optional[List[str]]:
         return ["*.py"]
 
     def execute(self, context: GitHookContext) -> HookResult:
@@ -67,241 +69,292 @@ class PrePushHookWithPatterns(GitHook):
         return "pre-push"
 
     @classmethod
-    def get_file_patterns(cls):
+    def get_file_patterns(cls) -> Optional[List[str]]:
         return ["*.py"]
 
     def execute(self, context: GitHookContext) -> HookResult:
         return HookResult(success=True, message="Executed")
 
 
+class FakeGitGateway:
+    def __init__(
+        self,
+        staged: Optional[List[str]] = None,
+        modified: Optional[List[str]] = None,
+        diff: Optional[List[str]] = None,
+    ) -> None:
+        self.staged = staged or []
+        self.modified = modified or []
+        self.diff = diff or []
+        self.calls: List[Tuple[str, Tuple[str, ...]]] = []
+
+    def get_cached_index_files(self) -> List[str]:
+        self.calls.append(("get_cached_index_files", ()))
+        return list(self.staged)
+
+    def get_all_modified_files(self) -> List[str]:
+        self.calls.append(("get_all_modified_files", ()))
+        return list(self.modified)
+
+    def get_diff_files_between_refs(self, remote_ref: str, local_ref: str) -> List[str]:
+        self.calls.append(("get_diff_files_between_refs", (remote_ref, local_ref)))
+        return list(self.diff)
+
+
 class TestConditionalExecution(BaseTestCase):
+    _shared_hook_without_patterns: HookWithoutPatterns
+    _shared_hook_with_patterns: HookWithPatterns
+    _shared_hook_with_empty_patterns: HookWithEmptyPatterns
+    _shared_pre_commit_hook: PreCommitHookWithPatterns
+    _shared_pre_push_hook: PrePushHookWithPatterns
+    _shared_contexts: Dict[str, GitHookContext]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._shared_hook_without_patterns = HookWithoutPatterns()
+        cls._shared_hook_with_patterns = HookWithPatterns()
+        cls._shared_hook_with_empty_patterns = HookWithEmptyPatterns()
+        cls._shared_pre_commit_hook = PreCommitHookWithPatterns()
+        cls._shared_pre_push_hook = PrePushHookWithPatterns()
+        cls._shared_contexts = {
+            hook_name: GitHookContext(hook_name, [])
+            for hook_name in [
+                "test-hook",
+                "test-hook-patterns",
+                "test-hook-empty-patterns",
+                "pre-commit",
+                "pre-push",
+            ]
+        }
+
     def setUp(self):
-        self.hook_without_patterns = HookWithoutPatterns()
-        self.hook_with_patterns = HookWithPatterns()
-        self.hook_with_empty_patterns = HookWithEmptyPatterns()
-        self.pre_commit_hook = PreCommitHookWithPatterns()
-        self.pre_push_hook = PrePushHookWithPatterns()
+        self.hook_without_patterns = self._shared_hook_without_patterns
+        self.hook_with_patterns = self._shared_hook_with_patterns
+        self.hook_with_empty_patterns = self._shared_hook_with_empty_patterns
+        self.pre_commit_hook = self._shared_pre_commit_hook
+        self.pre_push_hook = self._shared_pre_push_hook
+
+    def test_file_patterns_are_cached_per_hook_class(self):
+        first = HookWithPatterns._get_cached_file_patterns()
+        self.assertEqual(("*.py", "src/**/*.ts"), first)
+        self.assertIs(HookWithPatterns._get_cached_file_patterns(), first)
+        self.assertEqual(
+            ("*.py",), PreCommitHookWithPatterns._get_cached_file_patterns()
+        )
+        self.assertIsNone(HookWithoutPatterns._get_cached_file_patterns())
+
+    def test_compiled_file_pattern_agrees_with_fnmatch(self):
+        compiled = HookWithPatterns._get_compiled_file_pattern()
+        self.assertIs(HookWithPatterns._get_compiled_file_pattern(), compiled)
+        patterns = self.unwrap_optional(HookWithPatterns.get_file_patterns())
+        for file_path in [
+            "test.py",
+            "pkg/module.py",
+            "src/components/App.ts",
+            "src/App.ts",
+            "lib/App.ts",
+            "test.txt",
+            "test.pyc",
+        ]:
+            with self.subTest(file_path=file_path):
+                expected = any(
+                    fnmatch.fnmatch(file_path, pattern)
+                    for pattern in patterns
+                )
+                self.assertEqual(expected, bool(compiled.match(file_path)))
+
+    def test_compiled_file_pattern_is_rebuilt_with_cached_patterns(self):
+        HookWithPatterns._get_compiled_file_pattern()
+        self.addCleanup(delattr, HookWithPatterns, "_cached_file_patterns")
+        del HookWithPatterns._cached_file_patterns
+        with patch.object(HookWithPatterns, "get_file_patterns", return_value=["*.md"]):
+            HookWithPatterns._get_cached_file_patterns()
+        compiled = HookWithPatterns._get_compiled_file_pattern()
+        self.assertTrue(compiled.match("README.md"))
+        self.assertFalse(compiled.match("test.py"))
 
     def test_hook_without_patterns_always_runs(self):
-        context = GitHookContext("test-hook", [])
+        context = self._shared_contexts["test-hook"]
         should_run = self.hook_without_patterns._should_run_based_on_patterns(context)
         self.assertTrue(should_run)
 
     def test_hook_with_empty_patterns_list_always_runs(self):
-        context = GitHookContext("test-hook-empty-patterns", [])
+        context = self._shared_contexts["test-hook-empty-patterns"]
         should_run = self.hook_with_empty_patterns._should_run_based_on_patterns(
             context
         )
         self.assertTrue(should_run)
 
     def test_hook_with_patterns_no_changed_files_does_not_run(self):
-        context = GitHookContext("test-hook-patterns", [])
-        with patch.object(GitGateway, "get_cached_index_files", return_value=[]):
-            with patch.object(GitGateway, "get_all_modified_files", return_value=[]):
-                should_run = self.hook_with_patterns._should_run_based_on_patterns(
-                    context
-                )
-                self.assertFalse(should_run)
+        context = self._make_context("test-hook-patterns", FakeGitGateway())
+        should_run = self.hook_with_patterns._should_run_based_on_patterns(context)
+        self.assertFalse(should_run)
 
     def test_hook_with_patterns_matching_file_runs(self):
-        context = GitHookContext("test-hook-patterns", [])
-        with patch.object(GitGateway, "get_cached_index_files", return_value=[]):
-            with patch.object(
-                GitGateway, "get_all_modified_files", return_value=["test.py"]
-            ):
-                should_run = self.hook_with_patterns._should_run_based_on_patterns(
-                    context
-                )
-                self.assertTrue(should_run)
+        gateway = FakeGitGateway(modified=["test.py"])
+        context = self._make_context("test-hook-patterns", gateway)
+        should_run = self.hook_with_patterns._should_run_based_on_patterns(context)
+        self.assertTrue(should_run)
 
     def test_hook_with_patterns_non_matching_file_does_not_run(self):
-        context = GitHookContext("test-hook-patterns", [])
-        with patch.object(GitGateway, "get_cached_index_files", return_value=[]):
-            with patch.object(
-                GitGateway, "get_all_modified_files", return_value=["test.txt"]
-            ):
-                should_run = self.hook_with_patterns._should_run_based_on_patterns(
-                    context
-                )
-                self.assertFalse(should_run)
+        gateway = FakeGitGateway(modified=["test.txt"])
+        context = self._make_context("test-hook-patterns", gateway)
+        should_run = self.hook_with_patterns._should_run_based_on_patterns(context)
+        self.assertFalse(should_run)
 
     def test_hook_with_patterns_multiple_files_one_matches_runs(self):
-        context = GitHookContext("test-hook-patterns", [])
-        with patch.object(GitGateway, "get_cached_index_files", return_value=[]):
-            with patch.object(
-                GitGateway,
-                "get_all_modified_files",
-                return_value=["test.txt", "test.py", "other.txt"],
-            ):
-                should_run = self.hook_with_patterns._should_run_based_on_patterns(
-                    context
-                )
-                self.assertTrue(should_run)
+        gateway = FakeGitGateway(modified=["test.txt", "test.py", "other.txt"])
+        context = self._make_context("test-hook-patterns", gateway)
+        should_run = self.hook_with_patterns._should_run_based_on_patterns(context)
+        self.assertTrue(should_run)
 
     def test_hook_with_patterns_glob_pattern_matching(self):
-        context = GitHookContext("test-hook-patterns", [])
-        with patch.object(GitGateway, "get_cached_index_files", return_value=[]):
-            with patch.object(
-                GitGateway,
-                "get_all_modified_files",
-                return_value=["src/components/App.ts"],
-            ):
-                should_run = self.hook_with_patterns._should_run_based_on_patterns(
-                    context
-                )
-                self.assertTrue(should_run)
+        gateway = FakeGitGateway(modified=["src/components/App.ts"])
+        context = self._make_context("test-hook-patterns", gateway)
+        should_run = self.hook_with_patterns._should_run_based_on_patterns(context)
+        self.assertTrue(should_run)
 
     def test_pre_commit_hook_uses_staged_files(self):
-        context = GitHookContext("pre-commit", [])
-        with patch.object(
-            GitGateway, "get_cached_index_files", return_value=["test.py"]
-        ) as mock_staged:
-            with patch.object(GitGateway, "get_all_modified_files") as mock_all:
-                should_run = self.pre_commit_hook._should_run_based_on_patterns(context)
-                self.assertTrue(should_run)
-                mock_staged.assert_called_once()
-                mock_all.assert_not_called()
+        gateway = FakeGitGateway(staged=["test.py"])
+        context = self._make_context("pre-commit", gateway)
+        should_run = self.pre_commit_hook._should_run_based_on_patterns(context)
+        self.assertTrue(should_run)
+        self.assertEqual(gateway.calls, [("get_cached_index_files", ())])
 
     def test_pre_commit_hook_no_matching_staged_files_does_not_run(self):
-        context = GitHookContext("pre-commit", [])
-        with patch.object(
-            GitGateway, "get_cached_index_files", return_value=["test.txt"]
-        ):
-            should_run = self.pre_commit_hook._should_run_based_on_patterns(context)
-            self.assertFalse(should_run)
+        gateway = FakeGitGateway(staged=["test.txt"])
+        context = self._make_context("pre-commit", gateway)
+        should_run = self.pre_commit_hook._should_run_based_on_patterns(context)
+        self.assertFalse(should_run)
 
     def test_pre_push_hook_uses_changed_files_for_push(self):
-        context = GitHookContext(
+        gateway = FakeGitGateway(diff=["test.py"])
+        context = self._make_context(
             "pre-push",
-            [],
+            gateway,
             stdin_lines=[
                 "refs/heads/main refs/remotes/origin/main refs/heads/main refs/remotes/origin/main"
             ],
         )
-        with patch.object(
-            GitGateway,
-            "get_diff_files_between_refs",
-            return_value=["test.py"],
-        ) as mock_push:
-            with patch.object(GitGateway, "get_all_modified_files") as mock_all:
-                should_run = self.pre_push_hook._should_run_based_on_patterns(context)
-                self.assertTrue(should_run)
-                mock_push.assert_called_once_with("refs/heads/main", "refs/heads/main")
-                mock_all.assert_not_called()
+        should_run = self.pre_push_hook._should_run_based_on_patterns(context)
+        self.assertTrue(should_run)
+        self.assertEqual(
+            gateway.calls,
+            [("get_diff_files_between_refs", ("refs/heads/main", "refs/heads/main"))],
+        )
 
     def test_pre_push_hook_no_refs_falls_back_to_staged_then_all_changed_files(self):
-        context = GitHookContext("pre-push", [], stdin_lines=[])
-        with patch.object(
-            GitGateway, "get_cached_index_files", return_value=[]
-        ) as mock_staged:
-            with patch.object(
-                GitGateway, "get_all_modified_files", return_value=["test.py"]
-            ) as mock_all:
-                with patch.object(
-                    GitGateway, "get_diff_files_between_refs"
-                ) as mock_push:
-                    should_run = self.pre_push_hook._should_run_based_on_patterns(
-                        context
-                    )
-                    self.assertTrue(should_run)
-                    mock_staged.assert_called_once()
-                    mock_all.assert_called_once()
-                    mock_push.assert_not_called()
+        gateway = FakeGitGateway(modified=["test.py"])
+        context = self._make_context("pre-push", gateway, stdin_lines=[])
+        should_run = self.pre_push_hook._should_run_based_on_patterns(context)
+        self.assertTrue(should_run)
+        self.assertEqual(
+            gateway.calls,
+            [("get_cached_index_files", ()), ("get_all_modified_files", ())],
+        )
 
     def test_context_get_changed_files_with_refs_uses_push_diff(self):
-        context = GitHookContext(
+        gateway = FakeGitGateway(diff=["file1.py"])
+        context = self._make_context(
             "pre-push",
-            [],
+            gateway,
             stdin_lines=[
                 "refs/heads/main refs/remotes/origin/main refs/heads/main refs/remotes/origin/main"
             ],
         )
-        with patch.object(
-            GitGateway,
-            "get_diff_files_between_refs",
-            return_value=["file1.py"],
-        ) as mock_push:
-            files = context.get_changed_files()
-            self.assertEqual(files, ["file1.py"])
-            mock_push.assert_called_once_with("refs/heads/main", "refs/heads/main")
+        files = context.get_changed_files()
+        self.assertEqual(files, ["file1.py"])
+        self.assertEqual(
+            gateway.calls,
+            [("get_diff_files_between_refs", ("refs/heads/main", "refs/heads/main"))],
+        )
 
     def test_context_get_changed_files_no_refs_uses_staged_then_all(self):
-        context = GitHookContext("pre-commit", [])
-        with patch.object(
-            GitGateway, "get_cached_index_files", return_value=["file1.py", "file2.txt"]
-        ) as mock_staged:
-            with patch.object(GitGateway, "get_all_modified_files") as mock_all:
-                files = context.get_changed_files()
-                self.assertEqual(files, ["file1.py", "file2.txt"])
-                mock_staged.assert_called_once()
-                mock_all.assert_not_called()
+        gateway = FakeGitGateway(staged=["file1.py", "file2.txt"])
+        context = self._make_context("pre-commit", gateway)
+        files = context.get_changed_files()
+        self.assertEqual(files, ["file1.py", "file2.txt"])
+        self.assertEqual(gateway.calls, [("get_cached_index_files", ())])
 
     def test_context_get_changed_files_no_staged_falls_back_to_all(self):
-        context = GitHookContext("pre-commit", [])
-        with patch.object(
-            GitGateway, "get_cached_index_files", return_value=[]
-        ) as mock_staged:
-            with patch.object(
-                GitGateway, "get_all_modified_files", return_value=["file1.py"]
-            ) as mock_all:
-                files = context.get_changed_files()
-                self.assertEqual(files, ["file1.py"])
-                mock_staged.assert_called_once()
-                mock_all.assert_called_once()
+        gateway = FakeGitGateway(modified=["file1.py"])
+        context = self._make_context("pre-commit", gateway)
+        files = context.get_changed_files()
+        self.assertEqual(files, ["file1.py"])
+        self.assertEqual(
+            gateway.calls,
+            [("get_cached_index_files", ()), ("get_all_modified_files", ())],
+        )
+
+    def test_context_defaults_to_shared_git_gateway(self):
+        context = GitHookContext("pre-commit", [], project_root=Path("."))
+        self.assertIs(context.git_gateway, GitGateway())
 
     def test_run_skips_execution_when_patterns_dont_match(self):
-        context = GitHookContext("test-hook-patterns", [])
-        with patch.object(GitHookContext, "from_argv", return_value=context):
-            with patch.object(GitGateway, "get_cached_index_files", return_value=[]):
-                with patch.object(
-                    GitGateway, "get_all_modified_files", return_value=["test.txt"]
-                ):
-                    with patch.object(
-                        self.hook_with_patterns, "execute"
-                    ) as mock_execute:
-                        with patch.object(
-                            self.hook_with_patterns.logger, "info"
-                        ) as mock_info:
-                            with patch.object(
-                                self.hook_with_patterns.logger, "debug"
-                            ) as mock_debug:
-                                with patch.object(
-                                    self.hook_with_patterns.logger, "trace"
-                                ) as mock_trace:
-                                    exit_code = self.hook_with_patterns.run()
-                                    self.assertEqual(exit_code, 0)
-                                    mock_execute.assert_not_called()
-                                    mock_info.assert_called_once_with(
-                                        "Hook '%s' skipped: no changed files match the specified patterns",
-                                        "test-hook-patterns",
-                                    )
-                                    mock_debug.assert_any_call(
-                                        "Hook '%s' skipped: patterns checked: %s",
-                                        "test-hook-patterns",
-                                        ["*.py", "src/**/*.ts"],
-                                    )
-                                    mock_trace.assert_any_call(
-                                        "Hook '%s' skipped: changed files checked: %s",
-                                        "test-hook-patterns",
-                                        ["test.txt"],
-                                    )
+        gateway = FakeGitGateway(modified=["test.txt"])
+        context = self._make_context("test-hook-patterns", gateway)
+        hook = self.hook_with_patterns
+        with ExitStack() as stack:
+            stack.enter_context(
+                patch.object(GitHookContext, "from_argv", return_value=context)
+            )
+            execute_spy = SpyCounter()
+            info_spy = SpyCounter()
+            stack.enter_context(patch.object(hook, "execute", execute_spy))
+            stack.enter_context(patch.object(hook.logger, "info", info_spy))
+            mock_debug = stack.enter_context(patch.object(hook.logger, "debug"))
+            mock_trace = stack.enter_context(patch.object(hook.logger, "trace"))
+            exit_code = hook.run()
+            self.assertEqual(exit_code, 0)
+            self.assertEqual(execute_spy.count, 0)
+            self.assertEqual(info_spy.count, 1)
+            self.assertEqual(
+                info_spy.last_args,
+                (
+                    (
+                        "Hook '%s' skipped: no changed files match the specified patterns",
+                        "test-hook-patterns",
+                    ),
+                    {},
+                ),
+            )
+            mock_debug.assert_any_call(
+                "Hook '%s' skipped: patterns checked: %s",
+                "test-hook-patterns",
+                ("*.py", "src/**/*.ts"),
+            )
+            mock_trace.assert_any_call(
+                "Hook '%s' skipped: changed files checked: %s",
+                "test-hook-patterns",
+                ["test.txt"],
+            )
 
     def test_run_executes_when_patterns_match(self):
-        context = GitHookContext("test-hook-patterns", [])
+        gateway = FakeGitGateway(modified=["test.py"])
+        context = self._make_context("test-hook-patterns", gateway)
         with patch.object(GitHookContext, "from_argv", return_value=context):
-            with patch.object(GitGateway, "get_cached_index_files", return_value=[]):
-                with patch.object(
-                    GitGateway, "get_all_modified_files", return_value=["test.py"]
-                ):
-                    exit_code = self.hook_with_patterns.run()
-                    self.assertEqual(exit_code, 0)
+            exit_code = self.hook_with_patterns.run()
+            self.assertEqual(exit_code, 0)
 
     def test_run_executes_when_no_patterns_defined(self):
-        context = GitHookContext("test-hook", [])
+        context = self._make_context("test-hook", FakeGitGateway())
         with patch.object(GitHookContext, "from_argv", return_value=context):
             exit_code = self.hook_without_patterns.run()
             self.assertEqual(exit_code, 0)
 
+    def _make_context(
+        self,
+        hook_name: str,
+        gateway: "FakeGitGateway",
+        stdin_lines: Optional[List[str]] = None,
+    ) -> GitHookContext:
+        return dataclasses.replace(
+            self._shared_contexts[hook_name],
+            stdin_lines=stdin_lines or [],
+            git_gateway=cast(GitGateway, gateway),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,16 @@
-import tempfile
+import logging
+import os
+import stat
 import unittest
+from contextlib import ExitStack
 from pathlib import Path
+from typing import Tuple
 from unittest.mock import patch, MagicMock
 
 from githooklib import GitHook, GitHookContext, HookResult
-from githooklib.gateways import GitGateway, ProjectRootGateway
-from githooklib.constants import EXIT_SUCCESS, EXIT_FAILURE
-from tests.base_test_case import BaseTestCase
+from githooklib.gateways import GitGateway
+from githooklib.constants import EXIT_FAILURE
+from tests.base_test_case import BaseTestCase, SpyCounter
 
 
 class MockHook(GitHook):
@@ -22,9 +26,25 @@ class MockHook(GitHook):
         return HookResult(success=True)
 
 
+_FAKE_GIT_ROOT = Path("/fake/repo")
+
+
 class TestGitHookExtended(BaseTestCase):
+    _shared_hook: "MockHook"
+    _git_root_mock = MagicMock(return_value=None)
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._shared_hook = MockHook()
+
     def setUp(self):
-        self.hook = MockHook()
+        self.hook = self._shared_hook
+        self._git_root_mock.reset_mock()
+        self._git_root_mock.return_value = None
+        patcher = patch.object(GitGateway, "get_git_root_path", self._git_root_mock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_get_registered_hooks_returns_list(self):
         result = GitHook.get_registered_hooks()
@@ -37,89 +57,68 @@ class TestGitHookExtended(BaseTestCase):
         self.assertIn("MockHook", result[1])
 
     def test_get_log_level_returns_info(self):
-        import logging
-
         result = MockHook.get_log_level()
         self.assertEqual(result, logging.INFO)
 
-    def test_install_success_when_prerequisites_met(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            git_root = Path(temp_dir)
-            hooks_dir = git_root / "hooks"
-            hooks_dir.mkdir(parents=True)
-            with patch.object(GitGateway, "get_git_root_path", return_value=git_root):
-                with patch(
-                    "githooklib.git_hook.ProjectRootGateway.find_project_root",
-                    return_value=git_root,
-                ):
-                    with patch.object(
-                        self.hook, "_write_hook_delegation_script", return_value=True
-                    ):
-                        result = self.hook.install()
-                        self.assertTrue(result)
-
-    def test_install_fails_when_not_git_repository(self):
-        with patch.object(GitGateway, "get_git_root_path", return_value=None):
-            result = self.hook.install()
-            self.assertFalse(result)
-
-    def test_install_fails_when_hooks_directory_not_exists(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            git_root = Path(temp_dir)
-            with patch.object(GitGateway, "get_git_root_path", return_value=git_root):
-                result = self.hook.install()
-                self.assertFalse(result)
-
-    def test_install_fails_when_project_root_not_found(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            git_root = Path(temp_dir)
-            hooks_dir = git_root / "hooks"
-            hooks_dir.mkdir(parents=True)
-            with patch.object(GitGateway, "get_git_root_path", return_value=git_root):
-                with patch(
-                    "githooklib.git_hook.ProjectRootGateway.find_project_root",
-                    return_value=None,
-                ):
+    def test_install_scenarios(self):
+        root = _FAKE_GIT_ROOT
+        cases = [
+            ("success_when_prerequisites_met", root, True, root, True),
+            ("fails_when_not_git_repository", None, True, root, False),
+            ("fails_when_hooks_directory_not_exists", root, False, root, False),
+            ("fails_when_project_root_not_found", root, True, None, False),
+        ]
+        for name, git_root, hooks_dir_exists, project_root, expected in cases:
+            with self.subTest(scenario=name):
+                self._git_root_mock.return_value = git_root
+                with ExitStack() as stack:
+                    stack.enter_context(
+                        patch(
+                            "githooklib.git_hook.Path.exists",
+                            return_value=hooks_dir_exists,
+                        )
+                    )
+                    stack.enter_context(
+                        patch(
+                            "githooklib.git_hook.ProjectRootGateway.find_project_root",
+                            return_value=project_root,
+                        )
+                    )
+                    stack.enter_context(
+                        patch.object(
+                            self.hook,
+                            "_write_hook_delegation_script",
+                            return_value=True,
+                        )
+                    )
                     result = self.hook.install()
-                    self.assertFalse(result)
+                self.assertEqual(result, expected)
 
     def test_uninstall_success_when_hook_exists(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            git_root = Path(temp_dir)
-            hooks_dir = git_root / "hooks"
-            hooks_dir.mkdir(parents=True)
-            hook_file = hooks_dir / "test-hook"
-            hook_file.write_text("test content")
-            with patch.object(GitGateway, "get_git_root_path", return_value=git_root):
-                result = self.hook.uninstall()
-                self.assertTrue(result)
-                self.assertFalse(hook_file.exists())
+        git_root, hooks_dir = self._make_git_tree(with_hook_file=True)
+        hook_file = hooks_dir / "test-hook"
+        self._git_root_mock.return_value = git_root
+        result = self.hook.uninstall()
+        self.assertTrue(result)
+        self.assertFalse(hook_file.exists())
 
     def test_uninstall_fails_when_not_git_repository(self):
-        with patch.object(GitGateway, "get_git_root_path", return_value=None):
-            result = self.hook.uninstall()
-            self.assertFalse(result)
+        self._git_root_mock.return_value = None
+        result = self.hook.uninstall()
+        self.assertFalse(result)
 
     def test_uninstall_fails_when_hook_not_exists(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            git_root = Path(temp_dir)
-            hooks_dir = git_root / "hooks"
-            hooks_dir.mkdir(parents=True)
-            with patch.object(GitGateway, "get_git_root_path", return_value=git_root):
-                result = self.hook.uninstall()
-                self.assertFalse(result)
+        git_root, _ = self._make_git_tree()
+        self._git_root_mock.return_value = git_root
+        result = self.hook.uninstall()
+        self.assertFalse(result)
 
     def test_uninstall_handles_exception(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            git_root = Path(temp_dir)
-            hooks_dir = git_root / "hooks"
-            hooks_dir.mkdir(parents=True)
-            hook_file = hooks_dir / "test-hook"
-            hook_file.write_text("test content")
-            with patch.object(GitGateway, "get_git_root_path", return_value=git_root):
-                with patch("pathlib.Path.unlink", side_effect=Exception("Error")):
-                    result = self.hook.uninstall()
-                    self.assertFalse(result)
+        git_root, _ = self._make_git_tree(with_hook_file=True)
+        self._git_root_mock.return_value = git_root
+        with patch("pathlib.Path.unlink", self.raising(Exception("Error"))):
+            result = self.hook.uninstall()
+            self.assertFalse(result)
 
     def test_generate_delegator_script_includes_hook_name(self):
         with patch(
@@ -130,78 +129,77 @@ class TestGitHookExtended(BaseTestCase):
             self.assertIn("test-hook", script)
 
     def test_write_script_file_writes_content(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir) / "test_script"
-            self.hook._write_script_file(temp_path, "test content")
-            self.assertEqual(temp_path.read_text(), "test content")
+        temp_path = self.make_scratch_dir() / "test_script"
+        self.hook._write_script_file(temp_path, "test content")
+        self.assertEqual(temp_path.read_text(), "test content")
 
     def test_make_script_executable_sets_permissions(self):
-        import os
-        import stat
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir) / "test_script"
-            temp_path.write_text("test")
-            self.hook._make_script_executable(temp_path)
-            file_stat = temp_path.stat()
-            if os.name != "nt":
-                self.assertTrue(file_stat.st_mode & stat.S_IEXEC)
-            else:
-                self.assertTrue(temp_path.exists())
+        temp_path = self.make_scratch_dir() / "test_script"
+        temp_path.write_text("test")
+        self.hook._make_script_executable(temp_path)
+        file_stat = temp_path.stat()
+        if os.name != "nt":
+            self.assertTrue(file_stat.st_mode & stat.S_IEXEC)
+        else:
+            self.assertTrue(temp_path.exists())
 
     def test_write_hook_delegation_script_success(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            script_path = Path(temp_dir) / "test-hook"
+        script_path = self.make_scratch_dir() / "test-hook"
+        result = self.hook._write_hook_delegation_script(
+            script_path, "test script content"
+        )
+        self.assertTrue(result)
+        self.assertTrue(script_path.exists())
+
+    def test_write_hook_delegation_script_handles_exception(self):
+        script_path = self.make_scratch_dir() / "test-hook"
+        with patch.object(
+            self.hook, "_write_script_file", self.raising(Exception("Error"))
+        ):
             result = self.hook._write_hook_delegation_script(
                 script_path, "test script content"
             )
-            self.assertTrue(result)
-            self.assertTrue(script_path.exists())
-
-    def test_write_hook_delegation_script_handles_exception(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            script_path = Path(temp_dir) / "test-hook"
-            with patch.object(
-                self.hook, "_write_script_file", side_effect=Exception("Error")
-            ):
-                result = self.hook._write_hook_delegation_script(
-                    script_path, "test script content"
-                )
-                self.assertFalse(result)
+            self.assertFalse(result)
 
     def test_run_handles_exception(self):
-        with patch.object(GitHookContext, "from_argv", side_effect=Exception("Error")):
-            with patch.object(self.hook, "_handle_error") as mock_handle:
-                result = self.hook.run()
-                self.assertEqual(result, EXIT_FAILURE)
-                mock_handle.assert_called_once()
+        self.start_patch(
+            patch.object(GitHookContext, "from_argv", self.raising(Exception("Error")))
+        )
+        mock_handle = self.start_patch(patch.object(self.hook, "_handle_error"))
+        result = self.hook.run()
+        self.assertEqual(result, EXIT_FAILURE)
+        mock_handle.assert_called_once()
 
     def test_handle_error_logs_error(self):
-        with patch.object(self.hook.logger, "error") as mock_error:
-            error = Exception("Test error")
-            self.hook._handle_error(error)
-            self.assertTrue(mock_error.called)
+        error_spy = SpyCounter()
+        with patch.object(self.hook.logger, "error", error_spy):
+            self.hook._handle_error(Exception("Test error"))
+        self.assertGreater(error_spy.count, 0)
 
     def test_validate_installation_prerequisites_returns_hooks_dir(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            git_root = Path(temp_dir)
-            hooks_dir = git_root / "hooks"
-            hooks_dir.mkdir(parents=True)
-            with patch.object(GitGateway, "get_git_root_path", return_value=git_root):
-                result = self.hook._validate_installation_prerequisites()
-                self.assertEqual(result, hooks_dir)
+        self._git_root_mock.return_value = _FAKE_GIT_ROOT
+        with patch("githooklib.git_hook.Path.exists", return_value=True):
+            result = self.hook._validate_installation_prerequisites()
+        self.assertEqual(result, _FAKE_GIT_ROOT / "hooks")
 
     def test_validate_installation_prerequisites_returns_none_when_no_git_root(self):
-        with patch.object(GitGateway, "get_git_root_path", return_value=None):
-            result = self.hook._validate_installation_prerequisites()
-            self.assertIsNone(result)
+        self._git_root_mock.return_value = None
+        result = self.hook._validate_installation_prerequisites()
+        self.assertIsNone(result)
 
     def test_validate_installation_prerequisites_returns_none_when_no_hooks_dir(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            git_root = Path(temp_dir)
-            with patch.object(GitGateway, "get_git_root_path", return_value=git_root):
-                result = self.hook._validate_installation_prerequisites()
-                self.assertIsNone(result)
+        self._git_root_mock.return_value = _FAKE_GIT_ROOT
+        with patch("githooklib.git_hook.Path.exists", return_value=False):
+            result = self.hook._validate_installation_prerequisites()
+        self.assertIsNone(result)
+
+    def _make_git_tree(self, with_hook_file: bool = False) -> Tuple[Path, Path]:
+        git_root = self.make_scratch_dir()
+        hooks_dir = git_root / "hooks"
+        hooks_dir.mkdir()
+        if with_hook_file:
+            self.touch(hooks_dir / "test-hook", b"test content")
+        return git_root, hooks_dir
 
 
 if __name__ == "__main__":
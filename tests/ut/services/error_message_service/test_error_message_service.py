@@ -0,0 +1,141 @@
+import unittest
+from pathlib import Path
+from typing import List, Optional, Tuple
+from unittest.mock import patch
+
+from githooklib.services.error_message_service import ErrorMessageService
+from githooklib.gateways.project_root_gateway import ProjectRootGateway
+from tests.base_test_case import BaseTestCase
+from tests.utils import FakeDirectory
+
+
+class TestErrorMessageService(BaseTestCase):
+    _project_root: Optional[Path]
+    _shared_service: ErrorMessageService
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._project_root = ProjectRootGateway.find_project_root()
+        cls._shared_service = ErrorMessageService()
+
+    def setUp(self):
+        self.service = self._shared_service
+        discovery_service = self.service.hook_discovery_service
+        saved_state = (
+            discovery_service.project_root,
+            list(discovery_service.hook_search_paths),
+        )
+        self.addCleanup(self._restore_discovery_state, saved_state)
+
+    def test_get_hook_not_found_error_message_includes_hook_name(self):
+        with patch.object(
+            self.service.hook_discovery_service,
+            "project_root",
+            self._project_root,
+        ):
+            result = self.service.get_hook_not_found_error_message("test-hook")
+            self.assertIn("test-hook", result)
+
+    def test_get_hook_not_found_error_message_includes_search_info(self):
+        with patch.object(
+            self.service.hook_discovery_service,
+            "project_root",
+            self._project_root,
+        ):
+            result = self.service.get_hook_not_found_error_message("test-hook")
+            self.assertIn("Could not find hooks", result)
+
+    def test_add_project_root_search_info_with_hooks(self):
+        project_root = FakeDirectory(file_names=["test_hook.py"])
+        error_lines: List[str] = []
+        with patch.object(
+            self.service.hook_discovery_service, "project_root", project_root
+        ):
+            self.service._add_project_root_search_info(error_lines)
+        self.assertEqual(len(error_lines), 1)
+        self.assertIn(str(project_root), error_lines[0])
+        self.assertIn("1 *_hook.py files", error_lines[0])
+
+    def test_add_project_root_search_info_without_hooks(self):
+        project_root = FakeDirectory()
+        error_lines: List[str] = []
+        with patch.object(
+            self.service.hook_discovery_service, "project_root", project_root
+        ):
+            self.service._add_project_root_search_info(error_lines)
+        self.assertEqual(len(error_lines), 1)
+        self.assertIn(str(project_root), error_lines[0])
+        self.assertIn("no *_hook.py files found", error_lines[0])
+
+    def test_add_project_root_search_info_no_project_root(self):
+        error_lines: List[str] = []
+        with patch.object(self.service.hook_discovery_service, "project_root", None):
+            self.service._add_project_root_search_info(error_lines)
+        self.assertEqual(len(error_lines), 0)
+
+    def test_add_hook_search_paths_info_with_relative_paths(self):
+        cwd = self.make_scratch_dir()
+        (githooks_dir,) = self.make_dirs(cwd, ["githooks"])
+        self.touch(githooks_dir / "test.py", b"test")
+        self.service.hook_discovery_service.hook_search_paths = ["githooks"]
+        with patch("pathlib.Path.cwd", return_value=cwd):
+            error_lines: List[str] = []
+            self.service._add_hook_search_paths_info(error_lines)
+            self.assertGreater(len(error_lines), 0)
+            self.assertIn("githooks", str(error_lines))
+
+    def test_add_hook_search_paths_info_with_absolute_paths(self):
+        (abs_path,) = self.make_dirs(self.make_scratch_dir(), ["custom_hooks"])
+        self.touch(abs_path / "test.py", b"test")
+        self.service.hook_discovery_service.hook_search_paths = [str(abs_path)]
+        error_lines: List[str] = []
+        self.service._add_hook_search_paths_info(error_lines)
+        self.assertGreater(len(error_lines), 0)
+        error_text = " ".join(error_lines)
+        self.assertIn("custom_hooks", error_text)
+
+    def test_add_hook_search_paths_info_with_multiple_paths(self):
+        cwd = self.make_scratch_dir()
+        self.make_dirs(cwd, ["path1", "path2"])
+        self.service.hook_discovery_service.hook_search_paths = [
+            "path1",
+            "path2",
+        ]
+        with patch("pathlib.Path.cwd", return_value=cwd):
+            error_lines: List[str] = []
+            self.service._add_hook_search_paths_info(error_lines)
+            self.assertGreaterEqual(len(error_lines), 2)
+
+    def test_add_search_dir_info_adds_info_for_existing_directory(self):
+        search_dir = self.make_scratch_dir()
+        self.touch(search_dir / "test.py")
+        error_lines: List[str] = []
+        ErrorMessageService._add_search_dir_info(error_lines, search_dir)
+        self.assertEqual(len(error_lines), 1)
+        self.assertIn(str(search_dir), error_lines[0])
+        self.assertIn("1 .py files", error_lines[0])
+
+    def test_add_search_dir_info_adds_info_for_empty_directory(self):
+        search_dir = self.make_scratch_dir()
+        error_lines: List[str] = []
+        ErrorMessageService._add_search_dir_info(error_lines, search_dir)
+        self.assertEqual(len(error_lines), 1)
+        self.assertIn(str(search_dir), error_lines[0])
+        self.assertIn("no .py files found", error_lines[0])
+
+    def test_add_search_dir_info_ignores_init_files(self):
+        search_dir = self.make_scratch_dir()
+        self.touch(search_dir / "__init__.py")
+        error_lines: List[str] = []
+        ErrorMessageService._add_search_dir_info(error_lines, search_dir)
+        self.assertEqual(len(error_lines), 1)
+        self.assertIn("no .py files found", error_lines[0])
+
+    def _restore_discovery_state(self, saved_state: Tuple[Path, List[str]]) -> None:
+        discovery_service = self.service.hook_discovery_service
+        discovery_service.project_root, discovery_service.hook_search_paths = saved_state
+
+
+if __name__ == "__main__":
+    unittest.main()
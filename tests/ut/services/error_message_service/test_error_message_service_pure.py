@@ -0,0 +1,36 @@
+import os
+import unittest
+from pathlib import Path
+from typing import List
+
+from githooklib.services.error_message_service import ErrorMessageService
+from tests.base_test_case import BaseTestCase
+
+
+class TestErrorMessageService_Pure(BaseTestCase):
+    def test_resolve_search_path_returns_absolute_path_when_absolute(self):
+        if os.name == "nt":
+            absolute_path = Path("C:/absolute/path")
+        else:
+            absolute_path = Path("/absolute/path")
+        cwd = Path.cwd()
+        result = ErrorMessageService._resolve_search_path(str(absolute_path), cwd)
+        self.assertEqual(result, absolute_path)
+
+    def test_resolve_search_path_returns_relative_path_when_relative(self):
+        cwd = Path("/current/working/dir")
+        relative_path = "relative/path"
+        result = ErrorMessageService._resolve_search_path(relative_path, cwd)
+        self.assertEqual(result, cwd / relative_path)
+
+    def test_add_search_dir_info_adds_info_for_nonexistent_directory(self):
+        nonexistent_dir = Path("/nonexistent/directory")
+        error_lines: List[str] = []
+        ErrorMessageService._add_search_dir_info(error_lines, nonexistent_dir)
+        self.assertEqual(len(error_lines), 1)
+        self.assertIn(str(nonexistent_dir), error_lines[0])
+        self.assertIn("directory does not exist", error_lines[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
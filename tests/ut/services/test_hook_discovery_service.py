@@ -1,7 +1,10 @@
+import os
 import tempfile
 import unittest
+from contextlib import ExitStack
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from typing import Iterable, Tuple, Type
+from unittest.mock import patch
 
 from githooklib import GitHook, GitHookContext, HookResult
 from githooklib.services.hook_discovery_service import HookDiscoveryService
@@ -9,6 +12,14 @@ from githooklib.gateways.project_root_gateway import ProjectRootGateway
 from tests.base_test_case import BaseTestCase
 
 
+_DUPLICATE_VALIDATION_ERROR_FRAGMENTS = (
+    "Duplicate hook implementations found",
+    "duplicate-hook",
+)
+_DUPLICATE_PAIR_ERROR_FRAGMENTS = ("test-hook", "MockHook1", "MockHook2")
+_DUPLICATE_SINGLE_ERROR_FRAGMENTS = ("test-hook", "MockHook1")
+
+
 class MockHook1(GitHook):
     @classmethod
     def get_hook_name(cls) -> str:
@@ -36,12 +47,28 @@ class MockHook2(GitHook):
 
 
 class TestHookDiscoveryService(BaseTestCase):
+    _registered_snapshot: Tuple[Type[GitHook], ...]
+    _template_dir: tempfile.TemporaryDirectory
+    _template_file: Path
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._registered_snapshot = tuple(GitHook._registered_hooks)
+        cls._template_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls._template_dir.cleanup)
+        cls._template_file = Path(cls._template_dir.name) / "template.py"
+        cls.touch(cls._template_file)
+
     def setUp(self):
         self.service = HookDiscoveryService()
-        self.original_registered_hooks = GitHook._registered_hooks.copy()
 
     def tearDown(self):
-        GitHook._registered_hooks[:] = self.original_registered_hooks
+        if tuple(GitHook._registered_hooks) != self._registered_snapshot:
+            GitHook._registered_hooks.clear()
+            GitHook._registered_hooks.update(
+                dict.fromkeys(self._registered_snapshot)
+            )
         if hasattr(self.service, "_hooks"):
             self.service._hooks = None
 
@@ -59,18 +86,11 @@ class TestHookDiscoveryService(BaseTestCase):
 
     def test_discover_hooks_finds_registered_hooks(self):
         self.service._hooks = None
-        with patch.object(
-            self.service, "_validate_no_duplicate_hooks"
-        ) as mock_validate:
-            with patch.object(self.service, "_import_all_hook_modules") as mock_import:
-                with patch.object(
-                    HookDiscoveryService,
-                    "_collect_hook_classes_by_name",
-                    return_value={"test-hook-1": [MockHook1]},
-                ):
-                    result = self.service.discover_hooks()
-                    self.assertIsInstance(result, dict)
-                    self.assertGreater(len(result), 0)
+        with ExitStack() as stack:
+            self._enter_discovery_patches(stack)
+            result = self.service.discover_hooks()
+            self.assertIsInstance(result, dict)
+            self.assertGreater(len(result), 0)
 
     def test_hook_exists_returns_true_when_hook_exists(self):
         self.service._hooks = {"test-hook-1": MockHook1}
@@ -94,59 +114,54 @@ class TestHookDiscoveryService(BaseTestCase):
         self.assertEqual(self.service.hook_search_paths, ["path1", "path2", "path3"])
 
     def test_find_hook_modules_finds_files_in_project_root(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_root = Path(temp_dir)
-            hook_file = project_root / "test_hook.py"
-            hook_file.write_text("class TestHook(GitHook): pass")
-            self.service.project_root = project_root
-            modules = self.service._find_hook_modules()
-            self.assertIn(hook_file, modules)
+        project_root = self.make_scratch_dir()
+        hook_file = project_root / "test_hook.py"
+        self._link_placeholder(hook_file)
+        self.service.project_root = project_root
+        modules = self.service._find_hook_modules()
+        self.assertIn(hook_file, modules)
 
     def test_find_hook_modules_finds_files_in_search_directories(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cwd = Path(temp_dir)
-            githooks_dir = cwd / "githooks"
-            githooks_dir.mkdir()
-            hook_file = githooks_dir / "test_hook.py"
-            hook_file.write_text("class TestHook(GitHook): pass")
-            with patch("pathlib.Path.cwd", return_value=cwd):
-                self.service.hook_search_paths = ["githooks"]
-                modules = self.service._find_hook_modules()
-                self.assertIn(hook_file, modules)
+        cwd = self.make_scratch_dir()
+        githooks_dir = cwd / "githooks"
+        githooks_dir.mkdir()
+        hook_file = githooks_dir / "test_hook.py"
+        self._link_placeholder(hook_file)
+        with patch("pathlib.Path.cwd", return_value=cwd):
+            self.service.hook_search_paths = ["githooks"]
+            modules = self.service._find_hook_modules()
+            self.assertIn(hook_file, modules)
 
     def test_find_hook_modules_ignores_init_files(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cwd = Path(temp_dir)
-            githooks_dir = cwd / "githooks"
-            githooks_dir.mkdir()
-            init_file = githooks_dir / "__init__.py"
-            init_file.write_text("")
-            hook_file = githooks_dir / "test_hook.py"
-            hook_file.write_text("class TestHook(GitHook): pass")
-            with patch("pathlib.Path.cwd", return_value=cwd):
-                self.service.hook_search_paths = ["githooks"]
-                modules = self.service._find_hook_modules()
-                self.assertNotIn(init_file, modules)
-                self.assertIn(hook_file, modules)
-
-    def test_find_hook_modules_handles_absolute_paths(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            abs_path = Path(temp_dir) / "custom_hooks"
-            abs_path.mkdir()
-            hook_file = abs_path / "test_hook.py"
-            hook_file.write_text("class TestHook(GitHook): pass")
-            self.service.hook_search_paths = [str(abs_path)]
+        cwd = self.make_scratch_dir()
+        githooks_dir = cwd / "githooks"
+        githooks_dir.mkdir()
+        init_file = githooks_dir / "__init__.py"
+        self._link_placeholder(init_file)
+        hook_file = githooks_dir / "test_hook.py"
+        self._link_placeholder(hook_file)
+        with patch("pathlib.Path.cwd", return_value=cwd):
+            self.service.hook_search_paths = ["githooks"]
             modules = self.service._find_hook_modules()
+            self.assertNotIn(init_file, modules)
             self.assertIn(hook_file, modules)
 
+    def test_find_hook_modules_handles_absolute_paths(self):
+        abs_path = self.make_scratch_dir() / "custom_hooks"
+        abs_path.mkdir()
+        hook_file = abs_path / "test_hook.py"
+        self._link_placeholder(hook_file)
+        self.service.hook_search_paths = [str(abs_path)]
+        modules = self.service._find_hook_modules()
+        self.assertIn(hook_file, modules)
+
     def test_find_hook_modules_handles_nonexistent_directories(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cwd = Path(temp_dir)
-            nonexistent_dir = cwd / "nonexistent"
-            with patch("pathlib.Path.cwd", return_value=cwd):
-                self.service.hook_search_paths = ["nonexistent"]
-                modules = self.service._find_hook_modules()
-                self.assertEqual(len(modules), 0)
+        cwd = self.make_scratch_dir()
+        nonexistent_dir = cwd / "nonexistent"
+        with patch("pathlib.Path.cwd", return_value=cwd):
+            self.service.hook_search_paths = ["nonexistent"]
+            modules = self.service._find_hook_modules()
+            self.assertEqual(len(modules), 0)
 
     def test_invalidate_cache_clears_hooks(self):
         self.service._hooks = {"test": MockHook1}
@@ -179,15 +194,10 @@ class TestHookDiscoveryService(BaseTestCase):
             def __init__(self):
                 raise Exception("Instantiation error")
 
-        original_registered = GitHook._registered_hooks.copy()
-        try:
-            if FailingHookClass not in GitHook._registered_hooks:
-                GitHook._registered_hooks.append(FailingHookClass)
-            result = HookDiscoveryService._collect_hook_classes_by_name()
-            self.assertIsInstance(result, dict)
-            self.assertNotIn("failing-hook", result)
-        finally:
-            GitHook._registered_hooks[:] = original_registered
+        self.addCleanup(GitHook._registered_hooks.pop, FailingHookClass, None)
+        result = HookDiscoveryService._collect_hook_classes_by_name()
+        self.assertIsInstance(result, dict)
+        self.assertNotIn("failing-hook", result)
 
     def test_validate_no_duplicate_hooks_passes_with_no_duplicates(self):
         hook_classes_by_name = {  # type: ignore[assignment]
@@ -203,63 +213,80 @@ class TestHookDiscoveryService(BaseTestCase):
         hook_classes_by_name = {"duplicate-hook": [MockHook1, MockHook2]}
         with self.assertRaises(ValueError) as context:
             self.service._validate_no_duplicate_hooks(hook_classes_by_name)
-        self.assertIn("Duplicate hook implementations found", str(context.exception))
-        self.assertIn("duplicate-hook", str(context.exception))
+        self._assert_contains_all(
+            str(context.exception), _DUPLICATE_VALIDATION_ERROR_FRAGMENTS
+        )
 
     def test_raise_duplicate_hook_error_includes_module_info(self):
         duplicates = {"test-hook": [MockHook1, MockHook2]}  # type: ignore[assignment]
         with patch.object(
             self.service.module_import_gateway,
             "find_module_file",
-            return_value="test_module.py",
+            lambda module_name, project_root: "test_module.py",
         ):
             with self.assertRaises(ValueError) as context:
                 self.service._raise_duplicate_hook_error(
                     duplicates
                 )  # type: ignore[arg-type]
             error_message = str(context.exception)
-            self.assertIn("test-hook", error_message)
-            self.assertIn("MockHook1", error_message)
-            self.assertIn("MockHook2", error_message)
+            self._assert_contains_all(error_message, _DUPLICATE_PAIR_ERROR_FRAGMENTS)
 
     def test_raise_duplicate_hook_error_handles_missing_module_file(self):
         duplicates = {"test-hook": [MockHook1]}  # type: ignore[assignment]
         with patch.object(
             self.service.module_import_gateway,
             "find_module_file",
-            return_value=None,
+            lambda module_name, project_root: None,
         ):
             with self.assertRaises(ValueError) as context:
                 self.service._raise_duplicate_hook_error(duplicates)  # type: ignore[arg-type]
             error_message = str(context.exception)
-            self.assertIn("test-hook", error_message)
-            self.assertIn("MockHook1", error_message)
+            self._assert_contains_all(error_message, _DUPLICATE_SINGLE_ERROR_FRAGMENTS)
 
     def test_import_all_hook_modules_calls_import_gateway(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_root = Path(temp_dir)
-            hook_file = project_root / "test_hook.py"
-            hook_file.write_text("class TestHook(GitHook): pass")
-            self.service.project_root = project_root
-            with patch.object(
-                self.service.module_import_gateway, "import_module"
-            ) as mock_import:
-                self.service._import_all_hook_modules()
-                mock_import.assert_called()
+        fake_file = Path("/virtual/test_hook.py")
+        with ExitStack() as stack:
+            stack.enter_context(
+                patch.object(
+                    self.service, "_find_hook_modules", return_value=[fake_file]
+                )
+            )
+            mock_import = stack.enter_context(
+                patch.object(self.service.module_import_gateway, "import_module")
+            )
+            self.service._import_all_hook_modules()
+        mock_import.assert_called_once_with(fake_file, self.service.project_root)
 
     def test_discover_hooks_caches_result(self):
         self.service._hooks = None
-        with patch.object(self.service, "_validate_no_duplicate_hooks"):
-            with patch.object(self.service, "_import_all_hook_modules"):
-                with patch.object(
-                    HookDiscoveryService,
-                    "_collect_hook_classes_by_name",
-                    return_value={"test-hook-1": [MockHook1]},
-                ):
-                    result1 = self.service.discover_hooks()
-                    result2 = self.service.discover_hooks()
-                    self.assertEqual(result1, result2)
-                    self.assertIsNotNone(self.service._hooks)
+        with ExitStack() as stack:
+            self._enter_discovery_patches(stack)
+            result1 = self.service.discover_hooks()
+            result2 = self.service.discover_hooks()
+            self.assertEqual(result1, result2)
+            self.assertIsNotNone(self.service._hooks)
+
+    def _assert_contains_all(self, message: str, fragments: Iterable[str]) -> None:
+        for fragment in fragments:
+            with self.subTest(fragment=fragment):
+                self.assertIn(fragment, message)
+
+    def _link_placeholder(self, path: Path) -> None:
+        try:
+            os.link(self._template_file, path)
+        except OSError:
+            self.touch(path)
+
+    def _enter_discovery_patches(self, stack: ExitStack) -> None:
+        stack.enter_context(patch.object(self.service, "_validate_no_duplicate_hooks"))
+        stack.enter_context(patch.object(self.service, "_import_all_hook_modules"))
+        stack.enter_context(
+            patch.object(
+                HookDiscoveryService,
+                "_collect_hook_classes_by_name",
+                return_value={"test-hook-1": [MockHook1]},
+            )
+        )
 
 
 if __name__ == "__main__":
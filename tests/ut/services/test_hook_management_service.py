@@ -1,6 +1,5 @@
-import tempfile
 import unittest
-from pathlib import Path
+from dataclasses import FrozenInstanceError
 from unittest.mock import patch, MagicMock
 
 from githooklib import GitHook, GitHookContext, HookResult
@@ -8,11 +7,15 @@ from githooklib.services.hook_management_service import (
     HookManagementService,
     InstalledHooksContext,
 )
-from githooklib.gateways.git_gateway import GitGateway
+from githooklib.constants import EXIT_FAILURE, EXIT_SUCCESS
 from tests.base_test_case import BaseTestCase
 
 
 class MockHook(GitHook):
+    install = MagicMock(return_value=True)
+    uninstall = MagicMock(return_value=True)
+    run = MagicMock(return_value=EXIT_SUCCESS)
+
     @classmethod
     def get_hook_name(cls) -> str:
         return "test-hook"
@@ -26,8 +29,21 @@ class MockHook(GitHook):
 
 
 class TestHookManagementService(BaseTestCase):
+    service: HookManagementService
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.service = HookManagementService()
+
     def setUp(self):
-        self.service = HookManagementService()
+        for hook_method, default in (
+            (MockHook.install, True),
+            (MockHook.uninstall, True),
+            (MockHook.run, EXIT_SUCCESS),
+        ):
+            hook_method.reset_mock(side_effect=True)
+            hook_method.return_value = default
 
     def test_list_hooks_returns_sorted_hook_names(self):
         with patch.object(
@@ -45,155 +61,115 @@ class TestHookManagementService(BaseTestCase):
             result = self.service.list_hooks()
             self.assertEqual(result, [])
 
-    def test_install_hook_success_when_hook_exists(self):
-        with patch.object(
-            self.service.hook_discovery_service,
-            "discover_hooks",
-            return_value={"test-hook": MockHook},
-        ):
-            with patch.object(MockHook, "install", return_value=True) as mock_install:
-                result = self.service.install_hook("test-hook")
-                self.assertTrue(result)
-                mock_install.assert_called_once()
-
-    def test_install_hook_fails_when_hook_not_found(self):
-        with patch.object(
-            self.service.hook_discovery_service, "discover_hooks", return_value={}
-        ):
-            result = self.service.install_hook("non-existent-hook")
-            self.assertFalse(result)
-
-    def test_install_hook_fails_when_install_returns_false(self):
-        with patch.object(
-            self.service.hook_discovery_service,
-            "discover_hooks",
-            return_value={"test-hook": MockHook},
-        ):
-            with patch.object(MockHook, "install", return_value=False):
-                result = self.service.install_hook("test-hook")
-                self.assertFalse(result)
-
-    def test_uninstall_hook_success_when_hook_exists(self):
-        with patch.object(
-            self.service.hook_discovery_service,
-            "discover_hooks",
-            return_value={"test-hook": MockHook},
-        ):
-            with patch.object(
-                MockHook, "uninstall", return_value=True
-            ) as mock_uninstall:
-                result = self.service.uninstall_hook("test-hook")
-                self.assertTrue(result)
-                mock_uninstall.assert_called_once()
-
-    def test_uninstall_hook_fails_when_hook_not_found(self):
-        with patch.object(
-            self.service.hook_discovery_service, "discover_hooks", return_value={}
-        ):
-            result = self.service.uninstall_hook("non-existent-hook")
-            self.assertFalse(result)
-
-    def test_uninstall_hook_fails_when_uninstall_returns_false(self):
-        with patch.object(
-            self.service.hook_discovery_service,
-            "discover_hooks",
-            return_value={"test-hook": MockHook},
-        ):
-            with patch.object(MockHook, "uninstall", return_value=False):
-                result = self.service.uninstall_hook("test-hook")
-                self.assertFalse(result)
-
-    def test_run_hook_returns_exit_code_when_hook_exists(self):
+    def test_hook_operation_matrix(self):
+        cases = [
+            ("install_hook", "install", "test-hook", True, True),
+            ("install_hook", "install", "test-hook", False, False),
+            ("install_hook", "install", "non-existent-hook", True, False),
+            ("uninstall_hook", "uninstall", "test-hook", True, True),
+            ("uninstall_hook", "uninstall", "test-hook", False, False),
+            ("uninstall_hook", "uninstall", "non-existent-hook", True, False),
+            ("run_hook", "run", "test-hook", EXIT_SUCCESS, EXIT_SUCCESS),
+            ("run_hook", "run", "test-hook", EXIT_FAILURE, EXIT_FAILURE),
+            ("run_hook", "run", "non-existent-hook", EXIT_SUCCESS, EXIT_FAILURE),
+        ]
         with patch.object(
             self.service.hook_discovery_service,
             "discover_hooks",
             return_value={"test-hook": MockHook},
         ):
-            with patch.object(MockHook, "run", return_value=0) as mock_run:
-                result = self.service.run_hook("test-hook")
-                self.assertEqual(result, 0)
-                mock_run.assert_called_once()
-
-    def test_run_hook_returns_failure_when_hook_not_found(self):
-        from githooklib.constants import EXIT_FAILURE
+            for service_method, hook_method, hook_name, returned, expected in cases:
+                with self.subTest(
+                    method=service_method, hook=hook_name, returned=returned
+                ):
+                    mock_hook_method = getattr(MockHook, hook_method)
+                    mock_hook_method.reset_mock()
+                    mock_hook_method.return_value = returned
+                    result = getattr(self.service, service_method)(hook_name)
+                    self.assertEqual(result, expected)
+                    self.assertEqual(
+                        mock_hook_method.call_count,
+                        1 if hook_name == "test-hook" else 0,
+                    )
+
+    def test_installed_hooks_context_is_frozen_without_instance_dict(self):
+        context = InstalledHooksContext({}, None, False)
+        self.assertFalse(hasattr(context, "__dict__"))
+        with self.assertRaises(FrozenInstanceError):
+            context.hooks_dir_exists = True  # type: ignore[misc]
 
+    def test_get_installed_hooks_with_context_no_git_root(self):
         with patch.object(
-            self.service.hook_discovery_service, "discover_hooks", return_value={}
+            self.service.git_gateway, "get_git_root_path", return_value=None
         ):
-            result = self.service.run_hook("non-existent-hook")
-            self.assertEqual(result, EXIT_FAILURE)
+            result = self.service.get_installed_hooks_with_context()
+            self.assertIsInstance(result, InstalledHooksContext)
+            self.assertEqual(result.installed_hooks, {})
+            self.assertIsNone(result.git_root)
+            self.assertFalse(result.hooks_dir_exists)
 
-    def test_run_hook_returns_non_zero_exit_code(self):
+    def test_get_installed_hooks_with_context_does_not_build_discovery(self):
+        self.service.__dict__.pop("hook_discovery_service", None)
         with patch.object(
-            self.service.hook_discovery_service,
-            "discover_hooks",
-            return_value={"test-hook": MockHook},
+            self.service.git_gateway, "get_git_root_path", return_value=None
         ):
-            with patch.object(MockHook, "run", return_value=1):
-                result = self.service.run_hook("test-hook")
-                self.assertEqual(result, 1)
+            self.service.get_installed_hooks_with_context()
+        self.assertNotIn("hook_discovery_service", self.service.__dict__)
 
-    def test_get_installed_hooks_with_context_no_git_root(self):
+    def test_get_installed_hooks_with_context_no_hooks_directory(self):
+        git_root = self.make_scratch_dir()
         with patch.object(
-            self.service.git_gateway, "get_git_root_path", return_value=None
+            self.service.git_gateway, "get_git_root_path", return_value=git_root
         ):
             result = self.service.get_installed_hooks_with_context()
             self.assertIsInstance(result, InstalledHooksContext)
             self.assertEqual(result.installed_hooks, {})
-            self.assertIsNone(result.git_root)
+            self.assertEqual(result.git_root, git_root)
             self.assertFalse(result.hooks_dir_exists)
 
-    def test_get_installed_hooks_with_context_no_hooks_directory(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            git_root = Path(temp_dir)
-            with patch.object(
-                self.service.git_gateway, "get_git_root_path", return_value=git_root
-            ):
-                result = self.service.get_installed_hooks_with_context()
-                self.assertIsInstance(result, InstalledHooksContext)
-                self.assertEqual(result.installed_hooks, {})
-                self.assertEqual(result.git_root, git_root)
-                self.assertFalse(result.hooks_dir_exists)
-
     def test_get_installed_hooks_with_context_with_hooks(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            git_root = Path(temp_dir)
-            hooks_dir = git_root / "hooks"
-            hooks_dir.mkdir(parents=True)
-            hook_file = hooks_dir / "pre-commit"
-            hook_file.write_text("#!/bin/bash\necho test")
-
-            with patch.object(
+        git_root = self.make_scratch_dir()
+        hooks_dir = git_root / "hooks"
+        hooks_dir.mkdir(parents=True)
+        hook_file = hooks_dir / "pre-commit"
+        hook_file.write_text("#!/bin/bash\necho test")
+
+        self.start_patch(
+            patch.object(
                 self.service.git_gateway, "get_git_root_path", return_value=git_root
-            ):
-                with patch.object(
-                    self.service.git_gateway,
-                    "get_installed_hooks",
-                    return_value={"pre-commit": True},
-                ):
-                    result = self.service.get_installed_hooks_with_context()
-                    self.assertIsInstance(result, InstalledHooksContext)
-                    self.assertEqual(result.installed_hooks, {"pre-commit": True})
-                    self.assertEqual(result.git_root, git_root)
-                    self.assertTrue(result.hooks_dir_exists)
+            )
+        )
+        self.start_patch(
+            patch.object(
+                self.service.git_gateway,
+                "get_installed_hooks",
+                return_value={"pre-commit": True},
+            )
+        )
+        result = self.service.get_installed_hooks_with_context()
+        self.assertIsInstance(result, InstalledHooksContext)
+        self.assertEqual(result.installed_hooks, {"pre-commit": True})
+        self.assertEqual(result.git_root, git_root)
+        self.assertTrue(result.hooks_dir_exists)
 
     def test_get_installed_hooks_with_context_calls_git_gateway(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            git_root = Path(temp_dir)
-            hooks_dir = git_root / "hooks"
-            hooks_dir.mkdir(parents=True)
+        git_root = self.make_scratch_dir()
+        hooks_dir = git_root / "hooks"
+        hooks_dir.mkdir(parents=True)
 
-            with patch.object(
+        mock_git_root = self.start_patch(
+            patch.object(
                 self.service.git_gateway, "get_git_root_path", return_value=git_root
-            ) as mock_git_root:
-                with patch.object(
-                    self.service.git_gateway,
-                    "get_installed_hooks",
-                    return_value={},
-                ) as mock_get_hooks:
-                    self.service.get_installed_hooks_with_context()
-                    mock_git_root.assert_called_once()
-                    mock_get_hooks.assert_called_once_with(hooks_dir)
+            )
+        )
+        mock_get_hooks = self.start_patch(
+            patch.object(
+                self.service.git_gateway, "get_installed_hooks", return_value={}
+            )
+        )
+        self.service.get_installed_hooks_with_context()
+        mock_git_root.assert_called_once()
+        mock_get_hooks.assert_called_once_with(hooks_dir)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,13 @@
+import subprocess
 import sys
 import unittest
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Optional, Tuple
 from unittest.mock import patch, MagicMock
 
-from githooklib.__main__ import main
+from githooklib.__main__ import main, logger as main_logger
+from githooklib.definitions import HookResult
 from githooklib.logger import setup_logging
 from githooklib.logger import TRACE
 from githooklib.git_hook import GitHook
@@ -10,200 +15,173 @@ import logging
 from tests.base_test_case import BaseTestCase
 
 
+_FIRE_GET_RESULT_MOCK = (
+    "githooklib.utils.google_fire_mock_get_result_function.FireGetResultMock"
+)
+_FAKE_PROJECT_ROOT = Path("/fake/project")
+
+
 class TestMain(BaseTestCase):
     def test_setup_logging_with_trace_flag(self):
-        original_argv = sys.argv.copy()
-        try:
-            sys.argv = ["script", "--trace", "other"]
+        with self.patched_argv("script", "--trace", "other"):
             setup_logging()
-            from githooklib.__main__ import logger
-
-            self.assertEqual(logger.level, TRACE)
+            self.assertEqual(main_logger.level, TRACE)
             self.assertNotIn("--trace", sys.argv)
-        finally:
-            sys.argv = original_argv
 
     def test_setup_logging_with_debug_flag(self):
-        original_argv = sys.argv.copy()
-        try:
-            sys.argv = ["script", "--debug", "other"]
+        with self.patched_argv("script", "--debug", "other"):
             setup_logging()
-            from githooklib.__main__ import logger
-
-            self.assertEqual(logger.level, logging.DEBUG)
+            self.assertEqual(main_logger.level, logging.DEBUG)
             self.assertNotIn("--debug", sys.argv)
-        finally:
-            sys.argv = original_argv
 
-    def test_setup_logging_without_flags(self):
-        original_argv = sys.argv.copy()
-        try:
-            sys.argv = ["script", "other"]
+    def test_setup_logging_with_both_flags_prefers_trace(self):
+        with self.patched_argv("script", "--debug", "other", "--trace"):
             setup_logging()
-            from githooklib.__main__ import logger
+            self.assertEqual(main_logger.level, TRACE)
+            self.assertEqual(sys.argv, ["script", "other"])
 
-            self.assertEqual(logger.level, logging.INFO)
-        finally:
-            sys.argv = original_argv
+    def test_setup_logging_without_flags(self):
+        with self.patched_argv("script", "other"):
+            setup_logging()
+            self.assertEqual(main_logger.level, logging.INFO)
 
     def test_setup_logging_sets_hook_logger_levels(self):
-        original_argv = sys.argv.copy()
-        try:
-            sys.argv = ["script", "--debug", "other"]
+        with self.patched_argv("script", "--debug", "other"):
             setup_logging()
 
-            class TestHook(GitHook):
-                @classmethod
-                def get_hook_name(cls):
-                    return "test-hook"
+        class TestHook(GitHook):
+            @classmethod
+            def get_hook_name(cls):
+                return "test-hook"
 
-                @classmethod
-                def get_file_patterns(cls):
-                    return None
+            @classmethod
+            def get_file_patterns(cls):
+                return None
 
-                def execute(self, context):
-                    from githooklib.definitions import HookResult
+            def execute(self, context):
+                return HookResult(success=True)
 
-                    return HookResult(success=True)
+        self.addCleanup(GitHook._registered_hooks.pop, TestHook, None)
+        self.assertEqual(TestHook.logger.level, logging.DEBUG)
+        for handler in TestHook.logger.handlers:
+            self.assertEqual(handler.level, logging.DEBUG)
 
-            self.assertEqual(TestHook.logger.level, logging.DEBUG)
-            for handler in TestHook.logger.handlers:
-                self.assertEqual(handler.level, logging.DEBUG)
+        with self.patched_argv("script", "--trace", "other"):
+            setup_logging()
 
-            sys.argv = ["script", "--trace", "other"]
+        class TestHook2(GitHook):
+            @classmethod
+            def get_hook_name(cls):
+                return "test-hook-2"
+
+            @classmethod
+            def get_file_patterns(cls):
+                return None
+
+            def execute(self, context):
+                return HookResult(success=True)
+
+        self.addCleanup(GitHook._registered_hooks.pop, TestHook2, None)
+        self.assertEqual(TestHook2.logger.level, TRACE)
+        for handler in TestHook2.logger.handlers:
+            self.assertEqual(handler.level, TRACE)
+
+    def test_hook_registration_uses_configured_level_not_argv(self):
+        with self.patched_argv("script", "other"):
             setup_logging()
+        with self.patched_argv("script", "--trace", "other"):
 
-            class TestHook2(GitHook):
+            class TestHook3(GitHook):
                 @classmethod
                 def get_hook_name(cls):
-                    return "test-hook-2"
+                    return "test-hook-3"
 
                 @classmethod
                 def get_file_patterns(cls):
                     return None
 
                 def execute(self, context):
-                    from githooklib.definitions import HookResult
-
                     return HookResult(success=True)
 
-            self.assertEqual(TestHook2.logger.level, TRACE)
-            for handler in TestHook2.logger.handlers:
-                self.assertEqual(handler.level, TRACE)
-        finally:
-            sys.argv = original_argv
-            for hook_class in list(GitHook._registered_hooks):
-                if hook_class.__name__ in ("TestHook", "TestHook2"):
-                    GitHook._registered_hooks.remove(hook_class)
+            self.addCleanup(GitHook._registered_hooks.pop, TestHook3, None)
+            self.assertEqual(TestHook3.logger.level, logging.INFO)
+            self.assertIn("--trace", sys.argv)
 
     def test_main_exits_when_project_root_not_found(self):
-        original_argv = sys.argv.copy()
-        original_exit = sys.exit
-        try:
-            sys.argv = ["script"]
-            exit_called = False
-            exit_code = None
-
-            def mock_exit(code: int) -> None:
-                nonlocal exit_called, exit_code
-                exit_called = True
-                exit_code = code
-                raise SystemExit(code)
-
-            sys.exit = mock_exit  # type: ignore[assignment]
+        with self.patched_argv("script"), patch(
+            "sys.exit", side_effect=SystemExit
+        ) as mock_exit:
             with patch(
                 "githooklib.__main__.ProjectRootGateway.find_project_root",
                 return_value=None,
             ):
                 with self.assertRaises(SystemExit):
                     main()
-                self.assertTrue(exit_called)
-                self.assertEqual(exit_code, 1)
-        finally:
-            sys.argv = original_argv
-            sys.exit = original_exit
+            mock_exit.assert_called_once_with(1)
+
+    def test_importing_main_does_not_import_fire(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, githooklib.__main__; sys.exit('fire' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_utils_exposes_fire_get_result_mock_lazily(self):
+        script = (
+            "import sys, githooklib.utils\n"
+            "assert 'fire' not in sys.modules\n"
+            "from githooklib.utils import FireGetResultMock\n"
+            "assert 'fire' in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
 
     def test_main_calls_fire_with_cli(self):
-        original_argv = sys.argv.copy()
-        original_exit = sys.exit
-        try:
-            sys.argv = ["script"]
-            with patch(
-                "githooklib.__main__.ProjectRootGateway.find_project_root",
-                return_value=MagicMock(),
-            ):
-                with patch(
-                    "githooklib.__main__.fire.Fire", return_value=0
-                ) as mock_fire:
-                    with patch("githooklib.__main__.FireGetResultMock") as mock_mock:
-                        with patch("githooklib.__main__.patch") as mock_patch:
-                            mock_patch.return_value.__enter__.return_value = None
-                            try:
-                                main()
-                            except SystemExit:
-                                pass
-                            mock_fire.assert_called()
-        finally:
-            sys.argv = original_argv
-            sys.exit = original_exit
+        mock_fire, mock_exit = self._run_main_with_mocks(fire_return=0)
+        mock_fire.assert_called_once()
+        mock_exit.assert_called_once_with(0)
 
     def test_main_handles_exception(self):
-        original_argv = sys.argv.copy()
-        original_exit = sys.exit
-        try:
-            sys.argv = ["script"]
-            exit_called = False
-
-            def mock_exit(code: int) -> None:
-                nonlocal exit_called
-                exit_called = True
-                raise SystemExit(code)
-
-            sys.exit = mock_exit  # type: ignore[assignment]
-            with patch(
-                "githooklib.__main__.ProjectRootGateway.find_project_root",
-                return_value=MagicMock(),
-            ):
-                with patch(
-                    "githooklib.__main__.fire.Fire", side_effect=Exception("Error")
-                ):
-                    with patch("githooklib.__main__.FireGetResultMock"):
-                        with patch("githooklib.__main__.patch"):
-                            with self.assertRaises(SystemExit):
-                                main()
-                            self.assertTrue(exit_called)
-        finally:
-            sys.argv = original_argv
-            sys.exit = original_exit
+        _, mock_exit = self._run_main_with_mocks(fire_side_effect=Exception("Error"))
+        mock_exit.assert_called_once_with(1)
 
     def test_main_handles_keyboard_interrupt(self):
-        original_argv = sys.argv.copy()
-        original_exit = sys.exit
-        try:
-            sys.argv = ["script"]
-            exit_called = False
-
-            def mock_exit(code: int) -> None:
-                nonlocal exit_called
-                exit_called = True
-                raise SystemExit(code)
-
-            sys.exit = mock_exit  # type: ignore[assignment]
-            with patch(
-                "githooklib.__main__.ProjectRootGateway.find_project_root",
-                return_value=MagicMock(),
-            ):
-                with patch(
-                    "githooklib.__main__.fire.Fire", side_effect=KeyboardInterrupt()
-                ):
-                    with patch("githooklib.__main__.FireGetResultMock"):
-                        with patch("githooklib.__main__.patch"):
-                            with self.assertRaises(SystemExit):
-                                main()
-                            self.assertTrue(exit_called)
-        finally:
-            sys.argv = original_argv
-            sys.exit = original_exit
+        _, mock_exit = self._run_main_with_mocks(fire_side_effect=KeyboardInterrupt())
+        mock_exit.assert_called_once_with(1)
+
+    def _run_main_with_mocks(
+        self,
+        fire_side_effect: Optional[BaseException] = None,
+        fire_return: object = 0,
+    ) -> Tuple[MagicMock, MagicMock]:
+        with ExitStack() as stack:
+            stack.enter_context(self.patched_argv("script"))
+            mock_exit = stack.enter_context(patch("sys.exit", side_effect=SystemExit))
+            stack.enter_context(
+                patch(
+                    "githooklib.__main__.ProjectRootGateway.find_project_root",
+                    return_value=_FAKE_PROJECT_ROOT,
+                )
+            )
+            mock_fire = stack.enter_context(
+                patch(
+                    "fire.Fire",
+                    return_value=fire_return,
+                    side_effect=fire_side_effect,
+                )
+            )
+            stack.enter_context(patch(_FIRE_GET_RESULT_MOCK))
+            stack.enter_context(patch("githooklib.__main__.patch"))
+            with self.assertRaises(SystemExit):
+                main()
+        return mock_fire, mock_exit
 
 
 if __name__ == "__main__":
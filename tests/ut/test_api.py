@@ -1,10 +1,17 @@
-import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 
 from githooklib.api import API
+from githooklib.gateways import GitGateway, ProjectRootGateway, SeedGateway
+from githooklib.services import (
+    ErrorMessageService,
+    HookDiscoveryService,
+    HookManagementService,
+    HookSeedingService,
+)
 from githooklib import GitHook, GitHookContext, HookResult
+from githooklib.definitions import SeedFailureDetails
 from githooklib.services.hook_management_service import InstalledHooksContext
 from tests.base_test_case import BaseTestCase
 
@@ -22,236 +29,209 @@ class MockHook(GitHook):
         return HookResult(success=True)
 
 
+_FAKE_PROJECT_ROOT = Path("/fake/project")
+_HOOKS_BY_NAME = {"test-hook": MockHook}
+_HOOK_NAMES = ("test-hook",)
+_CACHED_API_METHODS = (
+    API.discover_all_hooks,
+    API.list_available_hook_names,
+    API.check_hook_exists,
+)
+
+
 class TestAPI(BaseTestCase):
+    _shared_api: API
+    _fake_discovery: MagicMock
+    _fake_management: MagicMock
+    _fake_git_gateway: MagicMock
+    _fake_root_gateway: MagicMock
+    _fake_error_messages: MagicMock
+    _fake_seed_gateway: MagicMock
+    _fake_seed_service: MagicMock
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._fake_discovery = MagicMock(spec=HookDiscoveryService)
+        cls._fake_management = MagicMock(spec=HookManagementService)
+        cls._fake_git_gateway = MagicMock(spec=GitGateway)
+        cls._fake_root_gateway = MagicMock(spec=ProjectRootGateway)
+        cls._fake_error_messages = MagicMock(spec=ErrorMessageService)
+        cls._fake_seed_gateway = MagicMock(spec=SeedGateway)
+        cls._fake_seed_service = MagicMock(spec=HookSeedingService)
+        cls._shared_api = API()
+        cls._shared_api.hook_discovery_service = cls._fake_discovery
+        cls._shared_api.hook_management_service = cls._fake_management
+        cls._shared_api.git_gateway = cls._fake_git_gateway
+        cls._shared_api.project_root_gateway = cls._fake_root_gateway
+        cls._shared_api.error_message_service = cls._fake_error_messages
+        cls._shared_api.seed_gateway = cls._fake_seed_gateway
+        cls._shared_api.seed_service = cls._fake_seed_service
+
     def setUp(self):
-        self.api = API()
+        self.reset_mocks(
+            self._fake_discovery,
+            self._fake_management,
+            self._fake_git_gateway,
+            self._fake_root_gateway,
+            self._fake_error_messages,
+            self._fake_seed_gateway,
+            self._fake_seed_service,
+        )
+        for cached in _CACHED_API_METHODS:
+            cached.cache_clear()
+        self.api = self._shared_api
 
     def test_discover_all_hooks_returns_hooks_dict(self):
-        with patch.object(
-            self.api.hook_discovery_service,
-            "discover_hooks",
-            return_value={"test-hook": MockHook},
-        ):
-            result = self.api.discover_all_hooks()
-            self.assertIsInstance(result, dict)
-            self.assertIn("test-hook", result)
+        self._fake_discovery.discover_hooks.return_value = _HOOKS_BY_NAME
+        result = self.api.discover_all_hooks()
+        self.assertIsInstance(result, dict)
+        self.assertIn("test-hook", result)
 
     def test_discover_all_hooks_caches_result(self):
-        with patch.object(
-            self.api.hook_discovery_service,
-            "discover_hooks",
-            return_value={"test-hook": MockHook},
-        ) as mock_discover:
-            result1 = self.api.discover_all_hooks()
-            result2 = self.api.discover_all_hooks()
-            self.assertEqual(result1, result2)
-            mock_discover.assert_called_once()
+        discover_hooks = self._fake_discovery.discover_hooks
+        discover_hooks.side_effect = lambda: dict(_HOOKS_BY_NAME)
+        self.assertIs(self.api.discover_all_hooks(), self.api.discover_all_hooks())
 
     def test_list_available_hook_names_returns_sorted_list(self):
-        with patch.object(
-            self.api.hook_management_service,
-            "list_hooks",
-            return_value=["hook-b", "hook-a", "hook-c"],
-        ):
-            result = self.api.list_available_hook_names()
-            self.assertEqual(result, ["hook-b", "hook-a", "hook-c"])
+        self._fake_management.list_hooks.return_value = ["hook-b", "hook-a", "hook-c"]
+        result = self.api.list_available_hook_names()
+        self.assertEqual(result, ["hook-b", "hook-a", "hook-c"])
 
     def test_list_available_hook_names_caches_result(self):
-        with patch.object(
-            self.api.hook_management_service,
-            "list_hooks",
-            return_value=["test-hook"],
-        ) as mock_list:
-            result1 = self.api.list_available_hook_names()
-            result2 = self.api.list_available_hook_names()
-            self.assertEqual(result1, result2)
-            mock_list.assert_called_once()
+        self._fake_management.list_hooks.side_effect = lambda: list(_HOOK_NAMES)
+        self.assertIs(
+            self.api.list_available_hook_names(), self.api.list_available_hook_names()
+        )
 
     def test_check_hook_exists_returns_true_when_exists(self):
-        with patch.object(
-            self.api.hook_discovery_service, "hook_exists", return_value=True
-        ):
-            result = self.api.check_hook_exists("test-hook")
-            self.assertTrue(result)
+        self._fake_discovery.hook_exists.return_value = True
+        result = self.api.check_hook_exists("test-hook")
+        self.assertTrue(result)
 
     def test_check_hook_exists_returns_false_when_not_exists(self):
-        with patch.object(
-            self.api.hook_discovery_service, "hook_exists", return_value=False
-        ):
-            result = self.api.check_hook_exists("non-existent-hook")
-            self.assertFalse(result)
+        self._fake_discovery.hook_exists.return_value = False
+        result = self.api.check_hook_exists("non-existent-hook")
+        self.assertFalse(result)
 
     def test_check_hook_exists_caches_result(self):
-        with patch.object(
-            self.api.hook_discovery_service, "hook_exists", return_value=True
-        ) as mock_exists:
-            result1 = self.api.check_hook_exists("test-hook")
-            result2 = self.api.check_hook_exists("test-hook")
-            self.assertTrue(result1)
-            self.assertTrue(result2)
-            mock_exists.assert_called_once()
+        self._fake_discovery.hook_exists.return_value = True
+        self.assertTrue(self.api.check_hook_exists("test-hook"))
+        self.assertTrue(self.api.check_hook_exists("test-hook"))
+        self.assertEqual(API.check_hook_exists.cache_info().hits, 1)
 
     def test_install_hook_by_name_returns_true_on_success(self):
-        with patch.object(
-            self.api.hook_management_service, "install_hook", return_value=True
-        ):
-            result = self.api.install_hook_by_name("test-hook")
-            self.assertTrue(result)
+        self._fake_management.install_hook.return_value = True
+        result = self.api.install_hook_by_name("test-hook")
+        self.assertTrue(result)
 
     def test_install_hook_by_name_returns_false_on_failure(self):
-        with patch.object(
-            self.api.hook_management_service, "install_hook", return_value=False
-        ):
-            result = self.api.install_hook_by_name("test-hook")
-            self.assertFalse(result)
+        self._fake_management.install_hook.return_value = False
+        result = self.api.install_hook_by_name("test-hook")
+        self.assertFalse(result)
 
     def test_uninstall_hook_by_name_returns_true_on_success(self):
-        with patch.object(
-            self.api.hook_management_service, "uninstall_hook", return_value=True
-        ):
-            result = self.api.uninstall_hook_by_name("test-hook")
-            self.assertTrue(result)
+        self._fake_management.uninstall_hook.return_value = True
+        result = self.api.uninstall_hook_by_name("test-hook")
+        self.assertTrue(result)
 
     def test_uninstall_hook_by_name_returns_false_on_failure(self):
-        with patch.object(
-            self.api.hook_management_service, "uninstall_hook", return_value=False
-        ):
-            result = self.api.uninstall_hook_by_name("test-hook")
-            self.assertFalse(result)
+        self._fake_management.uninstall_hook.return_value = False
+        result = self.api.uninstall_hook_by_name("test-hook")
+        self.assertFalse(result)
 
     def test_run_hook_by_name_returns_exit_code(self):
-        with patch.object(self.api.hook_management_service, "run_hook", return_value=0):
-            result = self.api.run_hook_by_name("test-hook")
-            self.assertEqual(result, 0)
+        self._fake_management.run_hook.return_value = 0
+        result = self.api.run_hook_by_name("test-hook")
+        self.assertEqual(result, 0)
 
     def test_run_hook_by_name_returns_non_zero_exit_code(self):
-        with patch.object(self.api.hook_management_service, "run_hook", return_value=1):
-            result = self.api.run_hook_by_name("test-hook")
-            self.assertEqual(result, 1)
+        self._fake_management.run_hook.return_value = 1
+        result = self.api.run_hook_by_name("test-hook")
+        self.assertEqual(result, 1)
 
     def test_get_installed_hooks_with_context_returns_context(self):
         context = InstalledHooksContext({}, None, False)
-        with patch.object(
-            self.api.hook_management_service,
-            "get_installed_hooks_with_context",
-            return_value=context,
-        ):
-            result = self.api.get_installed_hooks_with_context()
-            self.assertIsInstance(result, InstalledHooksContext)
+        self._fake_management.get_installed_hooks_with_context.return_value = context
+        result = self.api.get_installed_hooks_with_context()
+        self.assertIsInstance(result, InstalledHooksContext)
 
     def test_find_git_repository_root_returns_path(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            git_root = Path(temp_dir)
-            with patch.object(
-                self.api.git_gateway, "get_git_root_path", return_value=git_root
-            ):
-                result = self.api.find_git_repository_root()
-                self.assertEqual(result, git_root)
+        self._fake_git_gateway.get_git_root_path.return_value = _FAKE_PROJECT_ROOT
+        result = self.api.find_git_repository_root()
+        self.assertEqual(result, _FAKE_PROJECT_ROOT)
 
     def test_find_git_repository_root_returns_none_when_not_found(self):
-        with patch.object(self.api.git_gateway, "get_git_root_path", return_value=None):
-            result = self.api.find_git_repository_root()
-            self.assertIsNone(result)
+        self._fake_git_gateway.get_git_root_path.return_value = None
+        result = self.api.find_git_repository_root()
+        self.assertIsNone(result)
 
     def test_configure_hook_search_paths_sets_paths(self):
-        with patch.object(
-            self.api.hook_discovery_service, "set_hook_search_paths"
-        ) as mock_set:
-            self.api.configure_hook_search_paths("path1", "path2", "path3")
-            mock_set.assert_called_once_with(["path1", "path2", "path3"])
+        self.api.configure_hook_search_paths("path1", "path2", "path3")
+        self._fake_discovery.set_hook_search_paths.assert_called_once_with(
+            ["path1", "path2", "path3"]
+        )
 
     def test_get_hook_not_found_error_message_returns_message(self):
-        with patch.object(
-            self.api.error_message_service,
-            "get_hook_not_found_error_message",
-            return_value="Error: Hook not found",
-        ):
-            result = self.api.get_hook_not_found_error_message("test-hook")
-            self.assertEqual(result, "Error: Hook not found")
+        message = "Error: Hook not found"
+        get_message = self._fake_error_messages.get_hook_not_found_error_message
+        get_message.return_value = message
+        result = self.api.get_hook_not_found_error_message("test-hook")
+        self.assertEqual(result, message)
 
     def test_list_available_example_names_returns_list(self):
-        with patch.object(
-            self.api.seed_gateway,
-            "get_available_examples",
-            return_value=["example1", "example2"],
-        ):
-            result = self.api.list_available_example_names()
-            self.assertEqual(result, ["example1", "example2"])
+        examples = ["example1", "example2"]
+        self._fake_seed_gateway.get_available_examples.return_value = examples
+        result = self.api.list_available_example_names()
+        self.assertEqual(result, ["example1", "example2"])
 
     def test_check_example_exists_returns_true_when_exists(self):
-        with patch.object(
-            self.api.seed_gateway, "is_example_available", return_value=True
-        ):
-            result = self.api.check_example_exists("test-example")
-            self.assertTrue(result)
+        self._fake_seed_gateway.is_example_available.return_value = True
+        result = self.api.check_example_exists("test-example")
+        self.assertTrue(result)
 
     def test_check_example_exists_returns_false_when_not_exists(self):
-        with patch.object(
-            self.api.seed_gateway, "is_example_available", return_value=False
-        ):
-            result = self.api.check_example_exists("non-existent-example")
-            self.assertFalse(result)
+        self._fake_seed_gateway.is_example_available.return_value = False
+        result = self.api.check_example_exists("non-existent-example")
+        self.assertFalse(result)
 
     def test_get_seed_failure_details_returns_details(self):
-        from githooklib.definitions import SeedFailureDetails
-
-        with patch.object(
-            self.api.seed_service,
-            "get_seed_failure_details",
-            return_value=SeedFailureDetails(
-                example_not_found=False,
-                project_root_not_found=False,
-                target_hook_already_exists=False,
-                target_hook_path=None,
-                available_examples=[],
-            ),
-        ):
-            result = self.api.get_seed_failure_details("test-example")
-            self.assertIsInstance(result, SeedFailureDetails)
+        details = SeedFailureDetails(
+            example_not_found=False,
+            project_root_not_found=False,
+            target_hook_already_exists=False,
+            target_hook_path=None,
+            available_examples=[],
+        )
+        self._fake_seed_service.get_seed_failure_details.return_value = details
+        result = self.api.get_seed_failure_details("test-example")
+        self.assertIsInstance(result, SeedFailureDetails)
 
     def test_seed_example_hook_to_project_returns_true_on_success(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_root = Path(temp_dir)
-            with patch(
-                "githooklib.api.ProjectRootGateway.find_project_root",
-                return_value=project_root,
-            ):
-                with patch.object(
-                    self.api.seed_service, "seed_hook", return_value=True
-                ):
-                    result = self.api.seed_example_hook_to_project("test-example")
-                    self.assertTrue(result)
+        self._fake_root_gateway.find_project_root.return_value = _FAKE_PROJECT_ROOT
+        self._fake_seed_service.seed_hook.return_value = True
+        result = self.api.seed_example_hook_to_project("test-example")
+        self.assertTrue(result)
 
     def test_seed_example_hook_to_project_returns_false_when_project_root_not_found(
         self,
     ):
-        with patch(
-            "githooklib.api.ProjectRootGateway.find_project_root",
-            return_value=None,
-        ):
-            result = self.api.seed_example_hook_to_project("test-example")
-            self.assertFalse(result)
+        self._fake_root_gateway.find_project_root.return_value = None
+        result = self.api.seed_example_hook_to_project("test-example")
+        self.assertFalse(result)
 
     def test_seed_example_hook_to_project_returns_false_on_seed_failure(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_root = Path(temp_dir)
-            with patch(
-                "githooklib.api.ProjectRootGateway.find_project_root",
-                return_value=project_root,
-            ):
-                with patch.object(
-                    self.api.seed_service, "seed_hook", return_value=False
-                ):
-                    result = self.api.seed_example_hook_to_project("test-example")
-                    self.assertFalse(result)
+        self._fake_root_gateway.find_project_root.return_value = _FAKE_PROJECT_ROOT
+        self._fake_seed_service.seed_hook.return_value = False
+        result = self.api.seed_example_hook_to_project("test-example")
+        self.assertFalse(result)
 
     def test_seed_example_hook_to_project_handles_exception(self):
-        with patch(
-            "githooklib.api.ProjectRootGateway.find_project_root",
-            side_effect=Exception("Error finding project root"),
-        ):
-            result = self.api.seed_example_hook_to_project("test-example")
-            self.assertFalse(result)
+        self._fake_root_gateway.find_project_root.side_effect = Exception(
+            "Error finding project root"
+        )
+        result = self.api.seed_example_hook_to_project("test-example")
+        self.assertFalse(result)
 
 
 if __name__ == "__main__":
@@ -1,324 +1,242 @@
-import sys
 import unittest
+from contextlib import redirect_stdout
 from io import StringIO
 from pathlib import Path
+from typing import Any, Callable
 from unittest.mock import patch, MagicMock
 
+from githooklib.api import API
 from githooklib.cli import CLI, print_error
+from githooklib.cli import console as cli_console
 from githooklib.constants import EXIT_SUCCESS, EXIT_FAILURE
+from githooklib.definitions import SeedFailureDetails
 from githooklib.services.hook_management_service import InstalledHooksContext
+from githooklib.ui_messages import (
+    UI_MESSAGE_AVAILABLE_HOOKS_HEADER,
+    UI_MESSAGE_ERROR_PREFIX,
+    UI_MESSAGE_ERROR_SEEDING_EXAMPLE_PREFIX,
+    UI_MESSAGE_EXAMPLE_ALREADY_EXISTS_PREFIX,
+    UI_MESSAGE_EXAMPLE_ALREADY_EXISTS_SUFFIX,
+    UI_MESSAGE_EXAMPLE_NOT_FOUND_PREFIX,
+    UI_MESSAGE_EXAMPLE_NOT_FOUND_SUFFIX,
+    UI_MESSAGE_FAILED_TO_SEED_EXAMPLE_PREFIX,
+    UI_MESSAGE_FAILED_TO_SEED_EXAMPLE_PROJECT_ROOT_NOT_FOUND,
+    UI_MESSAGE_INSTALLED_HOOKS_HEADER,
+    UI_MESSAGE_NO_HOOKS_FOUND,
+)
 from tests.base_test_case import BaseTestCase
 
 
+_HOOK_COMMAND_CASES = [
+    ("run", "run_hook_by_name", True, 0, EXIT_SUCCESS),
+    ("run", "run_hook_by_name", True, 1, EXIT_FAILURE),
+    ("run", "run_hook_by_name", False, 0, EXIT_FAILURE),
+    ("install", "install_hook_by_name", True, True, EXIT_SUCCESS),
+    ("install", "install_hook_by_name", True, False, EXIT_FAILURE),
+    ("install", "install_hook_by_name", False, True, EXIT_FAILURE),
+    ("uninstall", "uninstall_hook_by_name", True, True, EXIT_SUCCESS),
+    ("uninstall", "uninstall_hook_by_name", True, False, EXIT_FAILURE),
+    ("uninstall", "uninstall_hook_by_name", False, True, EXIT_FAILURE),
+]
+
+_VALUE_ERROR = ValueError("Invalid hook state")
+_GENERIC_ERROR = Exception("Unexpected failure")
+_SEED_EXAMPLE_NOT_FOUND = SeedFailureDetails(
+    example_not_found=True,
+    project_root_not_found=False,
+    target_hook_already_exists=False,
+    target_hook_path=None,
+    available_examples=["example1"],
+)
+_SEED_PROJECT_ROOT_NOT_FOUND = SeedFailureDetails(
+    example_not_found=False,
+    project_root_not_found=True,
+    target_hook_already_exists=False,
+    target_hook_path=None,
+    available_examples=[],
+)
+_SEED_TARGET_ALREADY_EXISTS = SeedFailureDetails(
+    example_not_found=False,
+    project_root_not_found=False,
+    target_hook_already_exists=True,
+    target_hook_path=Path("/test/path"),
+    available_examples=[],
+)
+_EMPTY_SHOW_CONTEXTS = [
+    ("no_git_root", InstalledHooksContext({}, None, False)),
+    ("no_hooks_directory", InstalledHooksContext({}, Path("/test"), False)),
+    ("no_installed_hooks", InstalledHooksContext({}, Path("/test"), True)),
+]
+_SEED_FAILURES = [
+    (
+        "example_not_found",
+        _SEED_EXAMPLE_NOT_FOUND,
+        f"{UI_MESSAGE_EXAMPLE_NOT_FOUND_PREFIX}test-example"
+        f"{UI_MESSAGE_EXAMPLE_NOT_FOUND_SUFFIX}example1",
+    ),
+    (
+        "project_root_not_found",
+        _SEED_PROJECT_ROOT_NOT_FOUND,
+        f"{UI_MESSAGE_FAILED_TO_SEED_EXAMPLE_PREFIX}test-example"
+        f"{UI_MESSAGE_FAILED_TO_SEED_EXAMPLE_PROJECT_ROOT_NOT_FOUND}",
+    ),
+    (
+        "target_already_exists",
+        _SEED_TARGET_ALREADY_EXISTS,
+        f"{UI_MESSAGE_EXAMPLE_ALREADY_EXISTS_PREFIX}test-example"
+        f"{UI_MESSAGE_EXAMPLE_ALREADY_EXISTS_SUFFIX}{Path('/test/path')}",
+    ),
+]
+_HOOK_COMMAND_ERRORS = [
+    ("run", _VALUE_ERROR),
+    ("install", _GENERIC_ERROR),
+    ("uninstall", _VALUE_ERROR),
+]
+
+
 class TestCLI(BaseTestCase):
+    _fake_api: MagicMock
+    _print_error: MagicMock
+    _shared_cli: CLI
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._fake_api = MagicMock(spec=API)
+        cls._print_error = MagicMock()
+        patcher = patch.object(cli_console, "print_error", cls._print_error)
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+        cls._shared_cli = CLI()
+        cls._shared_cli._api = cls._fake_api
+
     def setUp(self):
-        self.cli = CLI()
+        self.reset_mocks(self._fake_api, self._print_error)
+        self.cli = self._shared_cli
 
     def test_list_with_hooks_prints_hooks(self):
-        with patch.object(
-            self.cli._api, "list_available_hook_names", return_value=["hook1", "hook2"]
-        ):
-            with patch("githooklib.ui.console.Console.print") as mock_print:
-                self.cli.list()
-                mock_print.assert_called()
-                calls = [str(call) for call in mock_print.call_args_list]
-                self.assertTrue(any("hook1" in str(call) for call in calls))
-                self.assertTrue(any("hook2" in str(call) for call in calls))
+        self._fake_api.list_available_hook_names.return_value = ["hook1", "hook2"]
+        output = self._capture(self.cli.list)
+        self.assertIn("hook1", output)
+        self.assertIn("hook2", output)
 
     def test_list_without_hooks_does_not_print(self):
-        with patch.object(self.cli._api, "list_available_hook_names", return_value=[]):
-            with patch("githooklib.ui.console.Console.print") as mock_print:
-                self.cli.list()
-                # Error is printed, not the hook list
-                mock_print.assert_not_called()
+        self._fake_api.list_available_hook_names.return_value = []
+        output = self._capture(self.cli.list)
+        self._print_error.assert_called_once_with(UI_MESSAGE_NO_HOOKS_FOUND)
+        self.assertNotIn(UI_MESSAGE_AVAILABLE_HOOKS_HEADER, output)
 
     def test_list_handles_value_error(self):
-        with patch.object(
-            self.cli._api,
-            "list_available_hook_names",
-            side_effect=ValueError("Error message"),
-        ):
-            with patch("githooklib.cli.console.print_error") as mock_error:
-                self.cli.list()
-                mock_error.assert_called()
-                call_args = str(mock_error.call_args)
-                self.assertIn("Error message", call_args)
+        self._stub_raising("list_available_hook_names", _VALUE_ERROR)
+        self.cli.list()
+        self._print_error.assert_called_once_with(
+            f"{UI_MESSAGE_ERROR_PREFIX}{_VALUE_ERROR}"
+        )
 
     def test_show_with_installed_hooks_prints_hooks(self):
         context = InstalledHooksContext(
             {"pre-commit": True, "pre-push": False}, Path("/test"), True
         )
-        with patch.object(
-            self.cli._api,
-            "get_installed_hooks_with_context",
-            return_value=context,
-        ):
-            with patch("githooklib.ui.console.Console.print_table") as mock_table:
-                self.cli.show()
-                mock_table.assert_called()
-                call_args = str(mock_table.call_args)
-                self.assertIn("pre-commit", call_args)
-
-    def test_show_without_git_root_does_not_print(self):
-        context = InstalledHooksContext({}, None, False)
-        with patch.object(
-            self.cli._api,
-            "get_installed_hooks_with_context",
-            return_value=context,
-        ):
-            with patch("githooklib.ui.console.Console.print_table") as mock_table:
-                self.cli.show()
-                mock_table.assert_not_called()
-
-    def test_show_without_hooks_directory_does_not_print(self):
-        context = InstalledHooksContext({}, Path("/test"), False)
-        with patch.object(
-            self.cli._api,
-            "get_installed_hooks_with_context",
-            return_value=context,
-        ):
-            with patch("githooklib.ui.console.Console.print_table") as mock_table:
-                self.cli.show()
-                mock_table.assert_not_called()
-
-    def test_show_without_installed_hooks_does_not_print(self):
-        context = InstalledHooksContext({}, Path("/test"), True)
-        with patch.object(
-            self.cli._api,
-            "get_installed_hooks_with_context",
-            return_value=context,
-        ):
-            with patch("githooklib.ui.console.Console.print_table") as mock_table:
-                self.cli.show()
-                mock_table.assert_not_called()
-
-    def test_run_success_returns_exit_success(self):
-        with patch.object(self.cli._api, "check_hook_exists", return_value=True):
-            with patch.object(self.cli._api, "run_hook_by_name", return_value=0):
-                result = self.cli.run("test-hook")
-                self.assertEqual(result, EXIT_SUCCESS)
-
-    def test_run_failure_returns_exit_failure(self):
-        with patch.object(self.cli._api, "check_hook_exists", return_value=True):
-            with patch.object(self.cli._api, "run_hook_by_name", return_value=1):
-                result = self.cli.run("test-hook")
-                self.assertEqual(result, EXIT_FAILURE)
-
-    def test_run_hook_not_found_returns_exit_failure(self):
-        with patch.object(self.cli._api, "check_hook_exists", return_value=False):
-            with patch.object(
-                self.cli._api,
-                "get_hook_not_found_error_message",
-                return_value="Hook not found",
-            ):
-                with patch("githooklib.cli.console.print_error") as mock_error:
-                    result = self.cli.run("non-existent-hook")
-                    self.assertEqual(result, EXIT_FAILURE)
-                    mock_error.assert_called()
-                    call_args = str(mock_error.call_args)
-                    self.assertIn("Hook not found", call_args)
-
-    def test_run_handles_value_error(self):
-        with patch.object(
-            self.cli._api, "check_hook_exists", side_effect=ValueError("Error")
-        ):
-            with patch("githooklib.cli.console.print_error") as mock_error:
-                result = self.cli.run("test-hook")
-                self.assertEqual(result, EXIT_FAILURE)
-                mock_error.assert_called()
-                call_args = str(mock_error.call_args)
-                self.assertIn("Error", call_args)
-
-    def test_install_success_returns_exit_success(self):
-        with patch.object(self.cli._api, "check_hook_exists", return_value=True):
-            with patch.object(self.cli._api, "install_hook_by_name", return_value=True):
-                result = self.cli.install("test-hook")
-                self.assertEqual(result, EXIT_SUCCESS)
-
-    def test_install_failure_returns_exit_failure(self):
-        with patch.object(self.cli._api, "check_hook_exists", return_value=True):
-            with patch.object(
-                self.cli._api, "install_hook_by_name", return_value=False
-            ):
-                result = self.cli.install("test-hook")
-                self.assertEqual(result, EXIT_FAILURE)
-
-    def test_install_hook_not_found_returns_exit_failure(self):
-        with patch.object(self.cli._api, "check_hook_exists", return_value=False):
-            with patch.object(
-                self.cli._api,
-                "get_hook_not_found_error_message",
-                return_value="Hook not found",
-            ):
-                with patch("githooklib.cli.console.print_error") as mock_error:
-                    result = self.cli.install("non-existent-hook")
-                    self.assertEqual(result, EXIT_FAILURE)
-                    mock_error.assert_called()
-                    call_args = str(mock_error.call_args)
-                    self.assertIn("Hook not found", call_args)
-
-    def test_install_handles_exception(self):
-        with patch.object(
-            self.cli._api, "check_hook_exists", side_effect=Exception("Error")
-        ):
-            with patch("githooklib.cli.console.print_error") as mock_error:
-                result = self.cli.install("test-hook")
-                self.assertEqual(result, EXIT_FAILURE)
-                mock_error.assert_called()
-                call_args = str(mock_error.call_args)
-                self.assertIn("Error", call_args)
-
-    def test_uninstall_success_returns_exit_success(self):
-        with patch.object(self.cli._api, "check_hook_exists", return_value=True):
-            with patch.object(
-                self.cli._api, "uninstall_hook_by_name", return_value=True
+        self._fake_api.get_installed_hooks_with_context.return_value = context
+        output = self._capture(self.cli.show)
+        self.assertIn("pre-commit", output)
+        self.assertIn("pre-push", output)
+
+    def test_show_without_installed_hooks_does_not_print_table(self):
+        for name, context in _EMPTY_SHOW_CONTEXTS:
+            with self.subTest(scenario=name):
+                self._fake_api.get_installed_hooks_with_context.return_value = context
+                output = self._capture(self.cli.show)
+                self.assertNotIn(UI_MESSAGE_INSTALLED_HOOKS_HEADER, output)
+
+    def test_hook_command_exit_codes(self):
+        for case in _HOOK_COMMAND_CASES:
+            cli_method, api_method, hook_exists, api_ret, expected = case
+            with self.subTest(
+                cli_method=cli_method, hook_exists=hook_exists, api_ret=api_ret
             ):
-                result = self.cli.uninstall("test-hook")
-                self.assertEqual(result, EXIT_SUCCESS)
-
-    def test_uninstall_failure_returns_exit_failure(self):
-        with patch.object(self.cli._api, "check_hook_exists", return_value=True):
-            with patch.object(
-                self.cli._api, "uninstall_hook_by_name", return_value=False
-            ):
-                result = self.cli.uninstall("test-hook")
-                self.assertEqual(result, EXIT_FAILURE)
-
-    def test_uninstall_hook_not_found_returns_exit_failure(self):
-        with patch.object(self.cli._api, "check_hook_exists", return_value=False):
-            with patch.object(
-                self.cli._api,
-                "get_hook_not_found_error_message",
-                return_value="Hook not found",
-            ):
-                with patch("githooklib.cli.console.print_error") as mock_error:
-                    result = self.cli.uninstall("non-existent-hook")
-                    self.assertEqual(result, EXIT_FAILURE)
-                    mock_error.assert_called()
-                    call_args = str(mock_error.call_args)
-                    self.assertIn("Hook not found", call_args)
-
-    def test_uninstall_handles_value_error(self):
-        with patch.object(
-            self.cli._api, "check_hook_exists", side_effect=ValueError("Error")
-        ):
-            with patch("githooklib.cli.console.print_error") as mock_error:
-                result = self.cli.uninstall("test-hook")
+                self.reset_mocks(self._fake_api, self._print_error)
+                self._fake_api.check_hook_exists.return_value = hook_exists
+                self._fake_api.get_hook_not_found_error_message.return_value = (
+                    "Hook not found"
+                )
+                getattr(self._fake_api, api_method).return_value = api_ret
+                result = getattr(self.cli, cli_method)("test-hook")
+                self.assertEqual(result, expected)
+                if not hook_exists:
+                    self._print_error.assert_called_once_with(
+                        f"{UI_MESSAGE_ERROR_PREFIX}Hook not found"
+                    )
+
+    def test_hook_command_reports_api_errors(self):
+        for cli_method, error in _HOOK_COMMAND_ERRORS:
+            with self.subTest(cli_method=cli_method):
+                self.reset_mocks(self._print_error)
+                self._stub_raising("check_hook_exists", error)
+                result = getattr(self.cli, cli_method)("test-hook")
                 self.assertEqual(result, EXIT_FAILURE)
-                mock_error.assert_called()
-                call_args = str(mock_error.call_args)
-                self.assertIn("Error", call_args)
+                self._print_error.assert_called_once_with(
+                    f"{UI_MESSAGE_ERROR_PREFIX}{error}"
+                )
 
     def test_seed_without_example_name_lists_examples(self):
-        with patch.object(
-            self.cli._api,
-            "list_available_example_names",
-            return_value=["example1", "example2"],
-        ):
-            with patch("githooklib.ui.console.Console.print") as mock_print:
-                result = self.cli.seed(None)
-                self.assertEqual(result, EXIT_SUCCESS)
-                mock_print.assert_called()
+        examples = ["example1", "example2"]
+        self._fake_api.list_available_example_names.return_value = examples
+        output = StringIO()
+        with redirect_stdout(output):
+            result = self.cli.seed(None)
+        self.assertEqual(result, EXIT_SUCCESS)
+        self.assertIn("example1", output.getvalue())
+        self.assertIn("example2", output.getvalue())
 
     def test_seed_without_example_name_no_examples_returns_failure(self):
-        with patch.object(
-            self.cli._api, "list_available_example_names", return_value=[]
-        ):
-            result = self.cli.seed(None)
-            self.assertEqual(result, EXIT_FAILURE)
+        self._fake_api.list_available_example_names.return_value = []
+        result = self.cli.seed(None)
+        self.assertEqual(result, EXIT_FAILURE)
 
     def test_seed_success_returns_exit_success(self):
-        with patch.object(
-            self.cli._api, "seed_example_hook_to_project", return_value=True
-        ):
-            result = self.cli.seed("test-example")
-            self.assertEqual(result, EXIT_SUCCESS)
-
-    def test_seed_example_not_found_returns_exit_failure(self):
-        from githooklib.definitions import SeedFailureDetails
-
-        with patch.object(
-            self.cli._api, "seed_example_hook_to_project", return_value=False
-        ):
-            with patch.object(
-                self.cli._api,
-                "get_seed_failure_details",
-                return_value=SeedFailureDetails(
-                    example_not_found=True,
-                    project_root_not_found=False,
-                    target_hook_already_exists=False,
-                    target_hook_path=None,
-                    available_examples=["example1"],
-                ),
-            ):
-                with patch("githooklib.cli.console.print_error") as mock_error:
-                    result = self.cli.seed("non-existent-example")
-                    self.assertEqual(result, EXIT_FAILURE)
-                    mock_error.assert_called()
-
-    def test_seed_project_root_not_found_returns_exit_failure(self):
-        from githooklib.definitions import SeedFailureDetails
-
-        with patch.object(
-            self.cli._api, "seed_example_hook_to_project", return_value=False
-        ):
-            with patch.object(
-                self.cli._api,
-                "get_seed_failure_details",
-                return_value=SeedFailureDetails(
-                    example_not_found=False,
-                    project_root_not_found=True,
-                    target_hook_already_exists=False,
-                    target_hook_path=None,
-                    available_examples=[],
-                ),
-            ):
-                with patch("githooklib.cli.console.print_error") as mock_error:
-                    result = self.cli.seed("test-example")
-                    self.assertEqual(result, EXIT_FAILURE)
-                    mock_error.assert_called()
-
-    def test_seed_target_already_exists_returns_exit_failure(self):
-        from githooklib.definitions import SeedFailureDetails
-
-        with patch.object(
-            self.cli._api, "seed_example_hook_to_project", return_value=False
-        ):
-            with patch.object(
-                self.cli._api,
-                "get_seed_failure_details",
-                return_value=SeedFailureDetails(
-                    example_not_found=False,
-                    project_root_not_found=False,
-                    target_hook_already_exists=True,
-                    target_hook_path=Path("/test/path"),
-                    available_examples=[],
-                ),
-            ):
-                with patch("githooklib.cli.console.print_error") as mock_error:
-                    result = self.cli.seed("test-example")
-                    self.assertEqual(result, EXIT_FAILURE)
-                    mock_error.assert_called()
+        self._fake_api.seed_example_hook_to_project.return_value = True
+        result = self.cli.seed("test-example")
+        self.assertEqual(result, EXIT_SUCCESS)
+
+    def test_seed_failure_returns_exit_failure(self):
+        for name, details, message in _SEED_FAILURES:
+            with self.subTest(scenario=name):
+                self.reset_mocks(self._print_error)
+                self._fake_api.seed_example_hook_to_project.return_value = False
+                self._fake_api.get_seed_failure_details.return_value = details
+                result = self.cli.seed("test-example")
+                self.assertEqual(EXIT_FAILURE, result)
+                self._print_error.assert_called_once_with(
+                    f"{UI_MESSAGE_ERROR_PREFIX}{message}"
+                )
 
     def test_seed_handles_exception(self):
-        with patch.object(
-            self.cli._api,
-            "seed_example_hook_to_project",
-            side_effect=Exception("Error"),
-        ):
-            with patch("githooklib.cli.console.print_error") as mock_error:
-                result = self.cli.seed("test-example")
-                self.assertEqual(result, EXIT_FAILURE)
-                mock_error.assert_called()
-                call_args = str(mock_error.call_args)
-                self.assertIn("Error", call_args)
+        self._stub_raising("seed_example_hook_to_project", _GENERIC_ERROR)
+        result = self.cli.seed("test-example")
+        self.assertEqual(result, EXIT_FAILURE)
+        self._print_error.assert_called_once_with(
+            f"{UI_MESSAGE_ERROR_PREFIX}"
+            f"{UI_MESSAGE_ERROR_SEEDING_EXAMPLE_PREFIX}{_GENERIC_ERROR}"
+        )
+
+    def test_print_error_prefixes_message(self):
+        print_error("Test error message")
+        self._print_error.assert_called_once_with(
+            f"{UI_MESSAGE_ERROR_PREFIX}Test error message"
+        )
 
-    def test_print_error_writes_to_stderr(self):
-        with patch("githooklib.cli.console.print_error") as mock_error:
-            print_error("Test error message")
-            mock_error.assert_called()
-            call_args = str(mock_error.call_args)
-            self.assertIn("Test error message", call_args)
+    def _stub_raising(self, api_method: str, error: Exception) -> None:
+        original = getattr(self._fake_api, api_method)
+        setattr(self._fake_api, api_method, self.raising(error))
+        self.addCleanup(setattr, self._fake_api, api_method, original)
+
+    @staticmethod
+    def _capture(func: Callable[..., Any], *args: Any) -> str:
+        buffer = StringIO()
+        with redirect_stdout(buffer):
+            func(*args)
+        return buffer.getvalue()
 
 
 if __name__ == "__main__":
@@ -1,4 +1,6 @@
+import shutil
 import subprocess
+import sys
 import tempfile
 import unittest
 from pathlib import Path
@@ -10,33 +12,62 @@ from tests.base_test_case import BaseTestCase
 
 
 class TestCommandExecutor(BaseTestCase):
-    def setUp(self):
-        self.executor = CommandExecutor()
+    _shared_executor: CommandExecutor
+    _cwd_dir: Path
 
-    def test_run_with_list_command(self):
-        import sys
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._shared_executor = CommandExecutor()
+        cls._cwd_dir = Path(tempfile.mkdtemp())
+        cls.addClassCleanup(shutil.rmtree, cls._cwd_dir, ignore_errors=True)
+
+    def setUp(self):
+        self.executor = self._shared_executor
 
+    def test_run_executes_real_subprocess(self):
         result = self.executor.run([sys.executable, "-c", "print('test')"])
         self.assertIsInstance(result, CommandResult)
         self.assertTrue(result.success)
+        self.assertEqual(result.stdout.strip(), "test")
+
+    def test_run_with_list_command(self):
+        fake_run = self._fake_subprocess_run()
+        result = self.executor.run(["python", "-c", "print('test')"])
+        self.assertIsInstance(result, CommandResult)
+        self.assertTrue(result.success)
+        fake_run.assert_called_once()
+        self.assertEqual(fake_run.call_args.args[0], ["python", "-c", "print('test')"])
 
     def test_run_with_string_command(self):
+        fake_run = self._fake_subprocess_run()
         result = self.executor.run("echo test", shell=True)
         self.assertIsInstance(result, CommandResult)
+        self.assertEqual(fake_run.call_args.args[0], ["echo test"])
+        self.assertTrue(fake_run.call_args.kwargs["shell"])
 
     def test_run_with_cwd(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = self.executor.run(["pwd"], cwd=temp_dir)
-            self.assertIsInstance(result, CommandResult)
+        fake_run = self._fake_subprocess_run()
+        result = self.executor.run(["pwd"], cwd=str(self._cwd_dir))
+        self.assertIsInstance(result, CommandResult)
+        self.assertEqual(fake_run.call_args.kwargs["cwd"], self._cwd_dir)
 
     def test_python_method(self):
+        fake_run = self._fake_subprocess_run()
         result = self.executor.python(["-c", "print('test')"])
         self.assertIsInstance(result, CommandResult)
         self.assertTrue(result.success)
+        self.assertEqual(
+            fake_run.call_args.args[0], [sys.executable, "-c", "print('test')"]
+        )
 
     def test_python_module_method(self):
+        fake_run = self._fake_subprocess_run()
         result = self.executor.python_module("sys", ["--version"])
         self.assertIsInstance(result, CommandResult)
+        self.assertEqual(
+            fake_run.call_args.args[0], [sys.executable, "-m", "sys", "--version"]
+        )
 
     def test_normalize_command_with_string(self):
         result = self.executor._normalize_command("test command", shell=False)
@@ -55,57 +86,43 @@ class TestCommandExecutor(BaseTestCase):
         self.assertIsNone(result)
 
     def test_normalize_cwd_with_string(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = self.executor._normalize_cwd(temp_dir)
-            self.assertIsInstance(result, Path)
-            self.assertEqual(result, Path(temp_dir))
+        result = self.executor._normalize_cwd(str(self._cwd_dir))
+        self.assertIsInstance(result, Path)
+        self.assertEqual(result, self._cwd_dir)
 
     def test_normalize_cwd_with_path(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            path = Path(temp_dir)
-            result = self.executor._normalize_cwd(path)
-            self.assertIsInstance(result, Path)
-            self.assertEqual(result, path)
+        result = self.executor._normalize_cwd(self._cwd_dir)
+        self.assertIsInstance(result, Path)
+        self.assertEqual(result, self._cwd_dir)
 
     def test_execute_command_handles_called_process_error(self):
-        with patch.object(
-            self.executor,
-            "_run_subprocess",
-            side_effect=subprocess.CalledProcessError(1, "cmd"),
-        ):
-            result = self.executor._execute_command(
-                ["test"], None, True, False, True, False, None
-            )
-            self.assertIsInstance(result, CommandResult)
-            self.assertFalse(result.success)
+        self._stub_run_subprocess(subprocess.CalledProcessError(1, "cmd"))
+        result = self.executor._execute_command(
+            ["test"], None, True, False, True, False, None
+        )
+        self.assertIsInstance(result, CommandResult)
+        self.assertFalse(result.success)
 
     def test_execute_command_handles_file_not_found_error(self):
-        with patch.object(
-            self.executor, "_run_subprocess", side_effect=FileNotFoundError()
-        ):
-            result = self.executor._execute_command(
-                ["nonexistent"], None, True, False, True, False, None
-            )
-            self.assertIsInstance(result, CommandResult)
-            self.assertFalse(result.success)
-            self.assertEqual(result.exit_code, 127)
+        self._stub_run_subprocess(FileNotFoundError())
+        result = self.executor._execute_command(
+            ["nonexistent"], None, True, False, True, False, None
+        )
+        self.assertIsInstance(result, CommandResult)
+        self.assertFalse(result.success)
+        self.assertEqual(result.exit_code, 127)
 
     def test_execute_command_handles_generic_error(self):
-        with patch.object(
-            self.executor, "_run_subprocess", side_effect=Exception("Generic error")
-        ):
-            result = self.executor._execute_command(
-                ["test"], None, True, False, True, False, None
-            )
-            self.assertIsInstance(result, CommandResult)
-            self.assertFalse(result.success)
+        self._stub_run_subprocess(Exception("Generic error"))
+        result = self.executor._execute_command(
+            ["test"], None, True, False, True, False, None
+        )
+        self.assertIsInstance(result, CommandResult)
+        self.assertFalse(result.success)
 
     def test_run_subprocess_creates_success_result(self):
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "output"
-        mock_result.stderr = ""
-        with patch("subprocess.run", return_value=mock_result):
+        completed = subprocess.CompletedProcess(["test"], 0, "output", "")
+        with patch("subprocess.run", return_value=completed):
             result = self.executor._run_subprocess(
                 ["test"], None, True, False, True, False, None
             )
@@ -114,16 +131,16 @@ class TestCommandExecutor(BaseTestCase):
             self.assertEqual(result.exit_code, 0)
     
     def test_run_with_timeout_parameter(self):
-        import sys
+        fake_run = self._fake_subprocess_run()
         result = self.executor.run(
             [sys.executable, "-c", "print('test')"],
             timeout=10
         )
         self.assertIsInstance(result, CommandResult)
         self.assertTrue(result.success)
+        self.assertEqual(fake_run.call_args.kwargs["timeout"], 10)
     
     def test_timeout_expired_returns_error_result(self):
-        import sys
         with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("cmd", 1)):
             result = self.executor.run(
                 [sys.executable, "-c", "import time; time.sleep(10)"],
@@ -135,27 +152,36 @@ class TestCommandExecutor(BaseTestCase):
             self.assertIn("timed out", result.stderr.lower())
     
     def test_timeout_parameter_passed_to_subprocess(self):
-        with patch("subprocess.run") as mock_run:
-            mock_result = MagicMock()
-            mock_result.returncode = 0
-            mock_result.stdout = ""
-            mock_result.stderr = ""
-            mock_run.return_value = mock_result
-            
-            self.executor.run(["test"], timeout=30)
-            
-            args, kwargs = mock_run.call_args
-            self.assertEqual(kwargs.get("timeout"), 30)
+        fake_run = self._fake_subprocess_run()
+        self.executor.run(["test"], timeout=30)
+        self.assertEqual(fake_run.call_args.kwargs.get("timeout"), 30)
     
     def test_python_method_with_timeout(self):
-        import sys
+        fake_run = self._fake_subprocess_run()
         result = self.executor.python(["-c", "print('test')"], timeout=10)
         self.assertIsInstance(result, CommandResult)
         self.assertTrue(result.success)
+        self.assertEqual(fake_run.call_args.kwargs["timeout"], 10)
     
     def test_python_module_method_with_timeout(self):
+        fake_run = self._fake_subprocess_run()
         result = self.executor.python_module("sys", ["--version"], timeout=10)
         self.assertIsInstance(result, CommandResult)
+        self.assertEqual(fake_run.call_args.kwargs["timeout"], 10)
+
+    def _fake_subprocess_run(self) -> MagicMock:
+        return self.start_patch(
+            patch(
+                "githooklib.command.subprocess.run",
+                side_effect=lambda cmd, **_kwargs: subprocess.CompletedProcess(
+                    cmd, 0, "test\n", ""
+                ),
+            )
+        )
+
+    def _stub_run_subprocess(self, error: BaseException) -> None:
+        setattr(self.executor, "_run_subprocess", self.raising(error))
+        self.addCleanup(delattr, self.executor, "_run_subprocess")
 
 
 if __name__ == "__main__":
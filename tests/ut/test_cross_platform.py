@@ -6,50 +6,49 @@ from githooklib.gateways import GitGateway, ProjectRootGateway
 from tests.base_test_case import BaseTestCase
 
 
+_SYSTEM = platform.system()
+
+
 class TestCrossPlatform(BaseTestCase):
+    _git_gateway: GitGateway
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._git_gateway = GitGateway()
+
     def test_path_handling_works_on_current_platform(self):
-        project_root = ProjectRootGateway.find_project_root()
-        
-        self.assertIsNotNone(project_root)
-        project_root = self.unwrap_optional(project_root)
-        
+        project_root = self.unwrap_optional(ProjectRootGateway.find_project_root())
         self.assertTrue(project_root.exists())
         self.assertTrue(project_root.is_dir())
     
     def test_git_root_detection_works_on_current_platform(self):
-        git_gateway = GitGateway()
-        git_root = git_gateway.get_git_root_path()
+        git_root = self._git_gateway.get_git_root_path()
         
         if git_root:
             self.assertTrue(git_root.exists())
             self.assertTrue((Path(git_root.parent) / ".git").exists() or (git_root / ".git").exists())
     
     def test_platform_detection(self):
-        system = platform.system()
-        
-        self.assertIn(system, ["Windows", "Linux", "Darwin"])
-        
-        if system == "Windows":
-            self.assertTrue(Path.cwd().drive or True)
-        else:
-            self.assertTrue(str(Path.cwd()).startswith("/"))
-    
+        self.assertIn(_SYSTEM, ["Windows", "Linux", "Darwin"])
+
+    @unittest.skipIf(_SYSTEM == "Windows", "POSIX only")
+    def test_posix_cwd_is_absolute(self):
+        self.assertTrue(str(Path.cwd()).startswith("/"))
+
+    @unittest.skipUnless(_SYSTEM == "Windows", "Windows only")
+    def test_windows_cwd_has_drive(self):
+        self.assertTrue(Path.cwd().drive)
+
     def test_file_permissions_handling(self):
-        import tempfile
-        
-        with tempfile.NamedTemporaryFile(delete=False, mode="w") as f:
-            temp_file = Path(f.name)
-            f.write("test content")
-        
-        try:
-            if platform.system() != "Windows":
-                temp_file.chmod(0o755)
-                stat_info = temp_file.stat()
-                self.assertTrue(stat_info.st_mode & 0o111)
-            else:
-                self.assertTrue(temp_file.exists())
-        finally:
-            temp_file.unlink()
+        temp_file = self.make_scratch_dir() / "perm.txt"
+        self.touch(temp_file, b"test content")
+        if _SYSTEM != "Windows":
+            temp_file.chmod(0o755)
+            stat_info = temp_file.stat()
+            self.assertTrue(stat_info.st_mode & 0o111)
+        else:
+            self.assertTrue(temp_file.exists())
 
 
 __all__ = ["TestCrossPlatform"]
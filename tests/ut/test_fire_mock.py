@@ -1,9 +1,9 @@
 import io
 import os
 import re
-import sys
 from builtins import SystemExit as BuiltinSystemExit
-from typing import Callable, List, Optional, Tuple
+from contextlib import ExitStack, redirect_stderr, redirect_stdout
+from typing import Callable, List, Tuple
 from unittest.mock import patch
 
 from githooklib.__main__ import main
@@ -30,10 +30,6 @@ class MockSystemExit(Exception):
 
 class ModuleCommandRunner:
     def __init__(self) -> None:
-        self._original_argv = sys.argv.copy()
-        self._original_stdout = sys.stdout
-        self._original_stderr = sys.stderr
-        self._original_exit = sys.exit
         self._exit_code = 0
 
     def run_module_command(self, args: List[str]) -> Tuple[int, str, str]:
@@ -41,22 +37,15 @@ class ModuleCommandRunner:
         stderr_buffer = io.StringIO()
         self._exit_code = 0
 
-        try:
-            self._setup_environment(args, stdout_buffer, stderr_buffer)
+        with ExitStack() as stack:
+            stack.enter_context(BaseTestCase.patched_argv("githooklib", *args))
+            stack.enter_context(redirect_stdout(stdout_buffer))
+            stack.enter_context(redirect_stderr(stderr_buffer))
+            stack.enter_context(patch("sys.exit", self._create_mock_exit()))
             self._execute_main_with_exit_handling()
-        finally:
-            self._restore_environment()
 
         return self._exit_code, stdout_buffer.getvalue(), stderr_buffer.getvalue()
 
-    def _setup_environment(
-        self, args: List[str], stdout_buffer: io.StringIO, stderr_buffer: io.StringIO
-    ) -> None:
-        sys.argv = ["githooklib"] + args
-        sys.stdout = stdout_buffer
-        sys.stderr = stderr_buffer
-        sys.exit = self._create_mock_exit()  # type: ignore[assignment]
-
     def _create_mock_exit(self) -> Callable[..., None]:
         def mock_exit(code: int = 0) -> None:
             self._exit_code = code if isinstance(code, int) else 0
@@ -74,30 +63,16 @@ class ModuleCommandRunner:
         except MockSystemExit:
             pass
 
-    def _restore_environment(self) -> None:
-        sys.argv = self._original_argv
-        sys.stdout = self._original_stdout
-        sys.stderr = self._original_stderr
-        sys.exit = self._original_exit
-
 
 class TestFireMock(BaseTestCase):
-    _original_cwd: Optional[str] = None
-
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
-        cls._original_cwd = os.getcwd()
         project_root = ProjectRootGateway.find_project_root()
         if project_root:
+            cls.addClassCleanup(os.chdir, os.getcwd())
             os.chdir(project_root)
 
-    @classmethod
-    def tearDownClass(cls):
-        if cls._original_cwd:
-            os.chdir(cls._original_cwd)
-        super().tearDownClass()
-
     def setUp(self):
         super().setUp()
         self.runner = ModuleCommandRunner()
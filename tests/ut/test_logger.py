@@ -2,6 +2,7 @@ import logging
 import sys
 import unittest
 from io import StringIO
+from typing import Dict, List, Optional, Tuple
 from unittest.mock import patch
 
 from githooklib.logger import (
@@ -14,69 +15,104 @@ from githooklib.logger import (
 from tests.base_test_case import BaseTestCase
 
 
+_LOGGER_KEYS = (
+    ("test_module", None),
+    ("test_module_prefix", "test-prefix"),
+    ("githooklib.test", None),
+    ("test_hook", "pre-commit"),
+)
+_MESSAGE_FORMATTER = logging.Formatter("%(message)s")
+
+
+class _CaptureHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
 class TestLogger(BaseTestCase):
+    _loggers: Dict[Tuple[str, Optional[str]], Logger]
+    _stdout: StringIO
+    _stderr: StringIO
+    _handler: StreamHandler
+    _error_record: logging.LogRecord
+    _info_record: logging.LogRecord
+    _capture: _CaptureHandler
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._loggers = {
+            (name, prefix): get_logger(name, prefix=prefix)
+            for name, prefix in _LOGGER_KEYS
+        }
+        cls._stdout = StringIO()
+        cls._stderr = StringIO()
+        cls._handler = StreamHandler(cls._stdout, cls._stderr)
+        cls._handler.setFormatter(_MESSAGE_FORMATTER)
+        cls._error_record = logging.LogRecord(
+            "test", logging.ERROR, "test.py", 1, "Error message", (), None
+        )
+        cls._info_record = logging.LogRecord(
+            "test", logging.INFO, "test.py", 1, "Info message", (), None
+        )
+        cls._capture = _CaptureHandler()
+
+    def setUp(self):
+        for logger in self._loggers.values():
+            self.addCleanup(logger.setLevel, logger.level)
+        for stream in (self._stdout, self._stderr):
+            stream.seek(0)
+            stream.truncate(0)
+        self._capture.records.clear()
+
     def test_get_logger_returns_logger_instance(self):
-        logger = get_logger("test_module")
+        logger = self._loggers[("test_module", None)]
         self.assertIsInstance(logger, Logger)
 
     def test_get_logger_with_prefix(self):
-        logger = get_logger("test_module_prefix", prefix="test-prefix")
+        logger = self._loggers[("test_module_prefix", "test-prefix")]
         self.assertTrue(logger.propagate)
         self.assertEqual(len(logger.handlers), 1)
 
     def test_logger_set_level_only_affects_logger(self):
-        logger = get_logger("test_module")
+        logger = self._loggers[("test_module", None)]
         logger.setLevel(logging.DEBUG)
         self.assertEqual(logger.level, logging.DEBUG)
 
     def test_logger_success_method(self):
-        logger = get_logger("test_module")
+        logger = self._loggers[("test_module", None)]
         logger.setLevel(SUCCESS)
-        with patch.object(logging.Logger, "_log") as mock_log:
-            logger.success("Test success message")
-            mock_log.assert_called_once()
-            call_args = mock_log.call_args
-            self.assertEqual(call_args[0][0], SUCCESS)
+        self._attach_capture(logger)
+        logger.success("Test success message")
+        self.assertEqual(len(self._capture.records), 1)
+        self.assertEqual(self._capture.records[0].levelno, SUCCESS)
 
     def test_logger_trace_method(self):
-        logger = get_logger("test_module")
+        logger = self._loggers[("test_module", None)]
         logger.setLevel(TRACE)
-        with patch.object(logging.Logger, "_log") as mock_log:
-            logger.trace("Test trace message")
-            mock_log.assert_called_once()
-            call_args = mock_log.call_args
-            self.assertEqual(call_args[0][0], TRACE)
+        self._attach_capture(logger)
+        logger.trace("Test trace message")
+        self.assertEqual(len(self._capture.records), 1)
+        self.assertEqual(self._capture.records[0].levelno, TRACE)
 
     def test_stream_handler_writes_error_to_stderr(self):
-        stdout = StringIO()
-        stderr = StringIO()
-        handler = StreamHandler(stdout, stderr)
-        handler.setFormatter(logging.Formatter("%(message)s"))
-        record = logging.LogRecord(
-            "test", logging.ERROR, "test.py", 1, "Error message", (), None
-        )
-        with patch(
-            "builtins.__import__", side_effect=ImportError("No module named 'tqdm'")
-        ):
-            handler.emit(record)
-            self.assertGreater(len(stderr.getvalue()), 0)
+        self._block_tqdm()
+        self._handler.emit(self._error_record)
+        self.assertEqual(self._stderr.getvalue(), "Error message\n")
+        self.assertEqual(self._stdout.getvalue(), "")
 
     def test_stream_handler_writes_info_to_stdout(self):
-        stdout = StringIO()
-        stderr = StringIO()
-        handler = StreamHandler(stdout, stderr)
-        handler.setFormatter(logging.Formatter("%(message)s"))
-        record = logging.LogRecord(
-            "test", logging.INFO, "test.py", 1, "Info message", (), None
-        )
-        with patch(
-            "builtins.__import__", side_effect=ImportError("No module named 'tqdm'")
-        ):
-            handler.emit(record)
-            self.assertGreater(len(stdout.getvalue()), 0)
+        self._block_tqdm()
+        self._handler.emit(self._info_record)
+        self.assertEqual(self._stdout.getvalue(), "Info message\n")
+        self.assertEqual(self._stderr.getvalue(), "")
 
     def test_githooklib_logger_has_handler(self):
-        logger = get_logger("githooklib.test")
+        logger = self._loggers[("githooklib.test", None)]
         self.assertEqual(len(logger.handlers), 1)
         handler = logger.handlers[0]
         formatter = handler.formatter
@@ -84,7 +120,7 @@ class TestLogger(BaseTestCase):
         self.assertIn("githooklib", formatter._fmt)  # type: ignore[union-attr, arg-type]
 
     def test_hook_logger_has_own_handler(self):
-        logger = get_logger("test_hook", prefix="pre-commit")
+        logger = self._loggers[("test_hook", "pre-commit")]
         self.assertTrue(logger.propagate)
         self.assertEqual(len(logger.handlers), 1)
         handler = logger.handlers[0]
@@ -92,6 +128,13 @@ class TestLogger(BaseTestCase):
         self.assertIsNotNone(formatter)
         self.assertIn("pre-commit", formatter._fmt)  # type: ignore[union-attr, arg-type]
 
+    def _block_tqdm(self) -> None:
+        self.start_patch(patch.dict(sys.modules, {"tqdm": None}))
+
+    def _attach_capture(self, logger: Logger) -> None:
+        logger.addHandler(self._capture)
+        self.addCleanup(logger.removeHandler, self._capture)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,58 +1,57 @@
 import subprocess
 import unittest
-from unittest.mock import MagicMock
 
 from githooklib.utils.command_result_factory import CommandResultFactory
 from githooklib.constants import EXIT_FAILURE
+from githooklib.definitions import CommandResult
 from tests.base_test_case import BaseTestCase
 
 
-class TestCommandResultFactory(BaseTestCase):
-    def test_create_success_result_with_zero_exit_code(self):
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "output"
-        mock_result.stderr = ""
-        result = CommandResultFactory.create_success_result(mock_result, ["test"], True)
-        self.assertTrue(result.success)
-        self.assertEqual(result.exit_code, 0)
-        self.assertEqual(result.stdout, "output")
-        self.assertEqual(result.command, ["test"])
+_COMPLETED_OK = subprocess.CompletedProcess(["test"], 0, "output", "")
+_COMPLETED_FAILED = subprocess.CompletedProcess(["test"], 1, "error output", "error")
+_CALLED_PROCESS_ERROR = subprocess.CalledProcessError(1, "test", "output", "error")
+_SUCCESS_RESULT_CASES = (
+    (
+        "zero_exit_code",
+        _COMPLETED_OK,
+        True,
+        CommandResult(True, 0, "output", "", ["test"]),
+    ),
+    (
+        "non_zero_exit_code",
+        _COMPLETED_FAILED,
+        True,
+        CommandResult(False, 1, "error output", "error", ["test"]),
+    ),
+    (
+        "without_capture_output",
+        _COMPLETED_OK,
+        False,
+        CommandResult(True, 0, "", "", ["test"]),
+    ),
+)
+_ERROR_RESULT_CASES = (
+    ("with_capture_output", True, CommandResult(False, 1, "output", "error", ["test"])),
+    ("without_capture_output", False, CommandResult(False, 1, "", "", ["test"])),
+)
 
-    def test_create_success_result_with_non_zero_exit_code(self):
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = "error output"
-        mock_result.stderr = "error"
-        result = CommandResultFactory.create_success_result(mock_result, ["test"], True)
-        self.assertFalse(result.success)
-        self.assertEqual(result.exit_code, 1)
 
-    def test_create_success_result_without_capture_output(self):
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "output"
-        mock_result.stderr = ""
-        result = CommandResultFactory.create_success_result(
-            mock_result, ["test"], False
-        )
-        self.assertEqual(result.stdout, "")
-        self.assertEqual(result.stderr, "")
+class TestCommandResultFactory(BaseTestCase):
+    def test_create_success_result(self):
+        for scenario, completed, capture_output, expected in _SUCCESS_RESULT_CASES:
+            with self.subTest(scenario=scenario):
+                result = CommandResultFactory.create_success_result(
+                    completed, ["test"], capture_output
+                )
+                self.assertEqual(result, expected)
 
     def test_create_error_result(self):
-        error = subprocess.CalledProcessError(1, "test", "output", "error")
-        result = CommandResultFactory.create_error_result(error, ["test"], True)
-        self.assertFalse(result.success)
-        self.assertEqual(result.exit_code, 1)
-        self.assertEqual(result.stdout, "output")
-        self.assertEqual(result.stderr, "error")
-        self.assertEqual(result.command, ["test"])
-
-    def test_create_error_result_without_capture_output(self):
-        error = subprocess.CalledProcessError(1, "test", "output", "error")
-        result = CommandResultFactory.create_error_result(error, ["test"], False)
-        self.assertEqual(result.stdout, "")
-        self.assertEqual(result.stderr, "")
+        for scenario, capture_output, expected in _ERROR_RESULT_CASES:
+            with self.subTest(scenario=scenario):
+                result = CommandResultFactory.create_error_result(
+                    _CALLED_PROCESS_ERROR, ["test"], capture_output
+                )
+                self.assertEqual(result, expected)
 
     def test_create_not_found_result(self):
         result = CommandResultFactory.create_not_found_result(["nonexistent"])
@@ -69,7 +68,7 @@ class TestCommandResultFactory(BaseTestCase):
         self.assertIn("Error executing command", result.stderr)
         self.assertIn("Generic error message", result.stderr)
         self.assertEqual(result.command, ["test"])
-    
+
     def test_create_timeout_result(self):
         result = CommandResultFactory.create_timeout_result(["long-command"], 30)
         self.assertFalse(result.success)
@@ -78,7 +77,7 @@ class TestCommandResultFactory(BaseTestCase):
         self.assertIn("30", result.stderr)
         self.assertEqual(result.command, ["long-command"])
         self.assertEqual(result.stdout, "")
-    
+
     def test_create_timeout_result_with_none_timeout(self):
         result = CommandResultFactory.create_timeout_result(["command"], None)
         self.assertFalse(result.success)
@@ -1,6 +1,6 @@
 import unittest
 
-from githooklib.utils.singleton import singleton
+from githooklib.utils.singleton import singleton, reset_singleton
 from tests.base_test_case import BaseTestCase
 
 
@@ -13,7 +13,17 @@ class MockSingletonClass:
         self.value += 1
 
 
+@singleton
+class MockSingletonWithArgs:
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+
 class TestSingleton(BaseTestCase):
+    def setUp(self):
+        for singleton_class in (MockSingletonClass, MockSingletonWithArgs):
+            reset_singleton(singleton_class)
+
     def test_singleton_returns_same_instance(self):
         instance1 = MockSingletonClass()  # type: ignore[no-untyped-call]
         instance2 = MockSingletonClass()  # type: ignore[no-untyped-call]
@@ -28,17 +38,20 @@ class TestSingleton(BaseTestCase):
         self.assertIs(instance1, instance2)
 
     def test_singleton_with_arguments(self):
-        @singleton
-        class TestClassWithArgs:
-            def __init__(self, value: int) -> None:
-                self.value = value
-
-        instance1 = TestClassWithArgs(10)  # type: ignore[no-untyped-call]
-        instance2 = TestClassWithArgs(20)  # type: ignore[no-untyped-call]
+        instance1 = MockSingletonWithArgs(10)  # type: ignore[no-untyped-call]
+        instance2 = MockSingletonWithArgs(20)  # type: ignore[no-untyped-call]
         self.assertIs(instance1, instance2)
         self.assertEqual(instance1.value, 10)
         self.assertEqual(instance2.value, 10)
 
+    def test_reset_singleton_creates_fresh_instance(self):
+        instance1 = MockSingletonClass()  # type: ignore[no-untyped-call]
+        instance1.increment()  # type: ignore[no-untyped-call]
+        reset_singleton(MockSingletonClass)
+        instance2 = MockSingletonClass()  # type: ignore[no-untyped-call]
+        self.assertIsNot(instance1, instance2)
+        self.assertEqual(instance2.value, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
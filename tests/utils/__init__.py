@@ -1 +1,2 @@
 from .path_utils import *
+from .fake_directory import *
@@ -0,0 +1,34 @@
+import fnmatch
+from pathlib import PurePath, PurePosixPath
+from typing import Iterable, List, Optional, Union
+
+
+class FakeDirectory:
+    def __init__(
+        self,
+        path: Union[PurePath, str] = "/fake/dir",
+        file_names: Optional[Iterable[str]] = None,
+        exists: bool = True,
+    ) -> None:
+        self.path = PurePosixPath(path)
+        self.file_names = list(file_names or [])
+        self._exists = exists
+
+    def exists(self) -> bool:
+        return self._exists
+
+    def is_dir(self) -> bool:
+        return self._exists
+
+    def glob(self, pattern: str) -> List[PurePosixPath]:
+        return [
+            self.path / name
+            for name in self.file_names
+            if fnmatch.fnmatchcase(name, pattern)
+        ]
+
+    def __str__(self) -> str:
+        return str(self.path)
+
+
+__all__ = ["FakeDirectory"]